@@ -33,8 +33,10 @@ Examples:
 """
 import click
 import json
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -617,13 +619,24 @@ def autonomous(with_ui: bool):
         # New behavior - live status UI (from main.py)
         _autonomous_with_ui()
 
-# Cache status to prevent re-initialization in dashboard refresh loop
+# Cache status to prevent re-initialization in dashboard refresh loop.
+# Each entry's lock serialises refreshes, so concurrent callers on a cold or
+# expired cache wait for the one in-flight API call instead of repeating it.
 _cached_status = {
-    'alpaca': {'status': '[yellow]Initializing...[/yellow]', 'last_check': 0},
-    'gemini': {'status': '[yellow]Initializing...[/yellow]', 'last_check': 0}
+    'alpaca': {'status': '[yellow]Initializing...[/yellow]', 'last_check': 0, 'lock': threading.Lock()},
+    'gemini': {'status': '[yellow]Initializing...[/yellow]', 'last_check': 0, 'lock': threading.Lock()}
 }
 _STATUS_CACHE_TTL = 30  # Refresh status every 30 seconds instead of every 3 seconds
 
+
+def reset_status_cache() -> None:
+    """Expire the cached Alpaca/Gemini status so the next get_status_panel() call refreshes it."""
+    for entry in _cached_status.values():
+        with entry['lock']:
+            entry['status'] = '[yellow]Initializing...[/yellow]'
+            entry['last_check'] = 0
+
+
 def get_status_panel() -> Panel:
     """Returns a Panel with the current system status."""
     import time
@@ -633,38 +646,42 @@ def get_status_panel() -> Panel:
     table.add_column("key", style="cyan")
     table.add_column("value")
 
-    # Check Alpaca status with caching
+    # Check Alpaca status with caching (re-checked under the lock so only one caller refreshes)
     if current_time - _cached_status['alpaca']['last_check'] > _STATUS_CACHE_TTL:
-        try:
-            account = alpaca_manager.get_account()
-            equity = account.get('equity')
-            if equity is None:
-                equity_str = "N/A"
-            else:
-                equity_str = f"${float(equity):,.2f}"
-            _cached_status['alpaca']['status'] = f"[green]Connected[/green] (Equity: {equity_str})"
-            _cached_status['alpaca']['last_check'] = current_time
-        except Exception as e:
-            _cached_status['alpaca']['status'] = f"[red]Connection Failed[/red] ({str(e)[:30]})"
-            _cached_status['alpaca']['last_check'] = current_time
+        with _cached_status['alpaca']['lock']:
+            if current_time - _cached_status['alpaca']['last_check'] > _STATUS_CACHE_TTL:
+                try:
+                    account = alpaca_manager.get_account()
+                    equity = account.get('equity')
+                    if equity is None:
+                        equity_str = "N/A"
+                    else:
+                        equity_str = f"${float(equity):,.2f}"
+                    _cached_status['alpaca']['status'] = f"[green]Connected[/green] (Equity: {equity_str})"
+                    _cached_status['alpaca']['last_check'] = current_time
+                except Exception as e:
+                    _cached_status['alpaca']['status'] = f"[red]Connection Failed[/red] ({str(e)[:30]})"
+                    _cached_status['alpaca']['last_check'] = current_time
     
     alpaca_status = _cached_status['alpaca']['status']
 
     # Check Gemini status with caching (FIXED: No longer calls get_client() on every refresh)
     if current_time - _cached_status['gemini']['last_check'] > _STATUS_CACHE_TTL:
-        try:
-            gemini_keys = settings.get_gemini_keys_list()
-            # Check if gemini_manager has an existing healthy client (no new connection attempt)
-            if hasattr(gemini_manager, '_last_client') and gemini_manager._last_client is not None:
-                _cached_status['gemini']['status'] = f"[green]Connected[/green] ({len(gemini_keys)} keys)"
-            else:
-                # Only initialize connection once (not on every refresh)
-                gemini_manager.get_client(skip_health_check=True)
-                _cached_status['gemini']['status'] = f"[green]Connected[/green] ({len(gemini_keys)} keys)"
-            _cached_status['gemini']['last_check'] = current_time
-        except Exception as e:
-            _cached_status['gemini']['status'] = f"[red]Connection Failed[/red] ({str(e)[:30]})"
-            _cached_status['gemini']['last_check'] = current_time
+        with _cached_status['gemini']['lock']:
+            if current_time - _cached_status['gemini']['last_check'] > _STATUS_CACHE_TTL:
+                try:
+                    gemini_keys = settings.get_gemini_keys_list()
+                    # Check if gemini_manager has an existing healthy client (no new connection attempt)
+                    if hasattr(gemini_manager, '_last_client') and gemini_manager._last_client is not None:
+                        _cached_status['gemini']['status'] = f"[green]Connected[/green] ({len(gemini_keys)} keys)"
+                    else:
+                        # Only initialize connection once (not on every refresh)
+                        gemini_manager.get_client(skip_health_check=True)
+                        _cached_status['gemini']['status'] = f"[green]Connected[/green] ({len(gemini_keys)} keys)"
+                    _cached_status['gemini']['last_check'] = current_time
+                except Exception as e:
+                    _cached_status['gemini']['status'] = f"[red]Connection Failed[/red] ({str(e)[:30]})"
+                    _cached_status['gemini']['last_check'] = current_time
     
     gemini_status = _cached_status['gemini']['status']
 
@@ -740,20 +757,34 @@ def get_recent_orders_panel() -> Panel:
 def get_active_strategies_panel() -> Panel:
     """Returns a Panel with currently active strategies."""
     try:
-        # Cache strategies config (no need to reload state every 3 seconds)
-        strategies_used = ['3ma', 'rsi_breakout', 'macd', 'bollinger_bands_reversal']  # Default active strategies
-        mode = "[bold yellow]DRY RUN[/bold yellow]" if settings.dry_run else "[bold green]PAPER TRADING[/bold green]"
-        
-        content = f"Mode: {mode}\n\n"
-        content += "Active Strategies:\n"
-        for strat in strategies_used:
-            content += f"  • {strat}\n"
-        
-        return Panel(content, title="Configuration", border_style="cyan")
+        return _build_active_strategies_panel(bool(settings.dry_run))
     except Exception as e:
         return Panel(f"[red]Error: {e}[/red]", title="Configuration", border_style="red")
 
 
+@lru_cache(maxsize=2)
+def _build_active_strategies_panel(dry_run: bool) -> Panel:
+    """
+    Build the configuration panel; memoized because its only input is the trading mode.
+    
+    Args:
+        dry_run: Whether the system is in dry-run mode
+    
+    Returns:
+        Panel listing the trading mode and active strategies
+    """
+    # Cache strategies config (no need to reload state every 3 seconds)
+    strategies_used = ['3ma', 'rsi_breakout', 'macd', 'bollinger_bands_reversal']  # Default active strategies
+    mode = "[bold yellow]DRY RUN[/bold yellow]" if dry_run else "[bold green]PAPER TRADING[/bold green]"
+    
+    content = f"Mode: {mode}\n\n"
+    content += "Active Strategies:\n"
+    for strat in strategies_used:
+        content += f"  • {strat}\n"
+    
+    return Panel(content, title="Configuration", border_style="cyan")
+
+
 def generate_dashboard() -> Layout:
     """Creates the layout for the interactive dashboard."""
     layout = Layout(name="root")
@@ -71,6 +71,7 @@ class Settings(BaseSettings):
     dry_run: bool = Field(default=True, description="Don't place real orders")
     cache_enabled: bool = Field(default=True)
     cache_ttl: int = Field(default=300, ge=0)
+    bars_cache_enabled: bool = Field(default=False, description="Reuse on-disk historical bars (tests/backtests only)")
     
     def __init__(self, **data):
         """Initialize settings and thread-safe lock for caching."""
@@ -10,8 +10,9 @@ from alpaca.data.historical import StockHistoricalDataClient, CryptoHistoricalDa
 from alpaca.data.requests import StockBarsRequest, CryptoBarsRequest
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 import pandas as pd
+import re
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 from src.config.settings import settings
 from src.utils.asset_classifier import AssetClassifier
@@ -145,6 +146,165 @@ class AlpacaConnectionManager:
         else:  # US_EQUITY
             return self._fetch_stock_bars(symbol, timeframe, start, end, limit)
 
+    def fetch_historical_bars_batch(
+        self,
+        symbols: List[str],
+        timeframe: str = "1Min",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: int = 100,
+        asset_class: str = "US_EQUITY",
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical OHLCV data for several symbols of one asset class in a single request.
+
+        Args:
+            symbols: Symbols to fetch, all of the same asset class
+            timeframe: Bar timeframe ("1Min", "5Min", "1Hour", etc.)
+            start: Start date string (YYYY-MM-DD)
+            end: End date string (YYYY-MM-DD)
+            limit: Number of bars to fetch if start/end are not provided
+            asset_class: Asset class shared by all symbols ("US_EQUITY", "CRYPTO", "FOREX")
+
+        Returns:
+            Dictionary mapping each requested symbol (as passed in) to its DataFrame.
+            Symbols with no bars are omitted.
+
+        If the batched request fails (e.g. one invalid or delisted symbol makes Alpaca
+        reject the whole request), the symbols are retried one at a time so only the
+        failing ones are omitted.
+        """
+        if not symbols:
+            return {}
+
+        try:
+            if asset_class == "CRYPTO":
+                return self._fetch_crypto_bars_batch(symbols, timeframe, start, end, limit)
+            elif asset_class == "FOREX":
+                raise NotImplementedError(
+                    "Forex data fetching not yet implemented. "
+                    "Alpaca forex support is in beta."
+                )
+            else:  # US_EQUITY
+                return self._fetch_stock_bars_batch(symbols, timeframe, start, end, limit)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            if len(symbols) == 1:
+                raise
+            logger.warning(
+                f"Batch bars request for {len(symbols)} symbols failed ({e}); retrying individually"
+            )
+
+        by_symbol = {}
+        for symbol in symbols:
+            try:
+                df = self.fetch_historical_bars(
+                    symbol, timeframe, start, end, limit, asset_class=asset_class
+                )
+            except Exception as e:
+                logger.warning(f"Skipping {symbol}: {e}")
+                continue
+            if not df.empty:
+                by_symbol[symbol] = df
+        return by_symbol
+
+    @staticmethod
+    def _parse_timeframe(timeframe: str) -> Tuple[TimeFrame, TimeFrameUnit, int]:
+        """
+        Parse a timeframe string into an Alpaca TimeFrame.
+
+        Handles formats like "1m", "5Min", "1Hour", "1h", "1 day", "1d".
+
+        Returns:
+            Tuple of (TimeFrame, unit, amount)
+        """
+        timeframe_lower = timeframe.lower()
+        match = re.match(r"(\d+)\s*(m|min|h|hour|d|day)", timeframe_lower)
+        if not match:
+            raise ValueError(f"Invalid timeframe format: {timeframe}")
+
+        amount = int(match.group(1))
+        unit_str = match.group(2)
+
+        if "m" in unit_str:
+            tf_unit = TimeFrameUnit.Minute
+        elif "h" in unit_str:
+            tf_unit = TimeFrameUnit.Hour
+        elif "d" in unit_str:
+            tf_unit = TimeFrameUnit.Day
+        else:
+            raise ValueError(f"Unrecognized timeframe unit in: {timeframe}")
+
+        return TimeFrame(amount, tf_unit), tf_unit, amount
+
+    @staticmethod
+    def _resolve_window(
+        start: Optional[str],
+        end: Optional[str],
+        tf_unit: TimeFrameUnit,
+        amount: int,
+        limit: int,
+        tz: str,
+    ) -> Tuple[datetime, datetime]:
+        """
+        Resolve the request window from explicit dates or from the bar limit.
+
+        Explicit dates are localized (naive) or converted (aware) to ``tz``.
+        """
+        if start and end:
+            start_dt = pd.to_datetime(start)
+            if start_dt.tzinfo is None or start_dt.tzinfo.utcoffset(start_dt) is None:
+                start_dt = start_dt.tz_localize(tz)
+            else:
+                start_dt = start_dt.tz_convert(tz)
+            end_dt = pd.to_datetime(end)
+            if end_dt.tzinfo is None or end_dt.tzinfo.utcoffset(end_dt) is None:
+                end_dt = end_dt.tz_localize(tz)
+            else:
+                end_dt = end_dt.tz_convert(tz)
+        else:
+            end_dt = datetime.now()
+            if tf_unit == TimeFrameUnit.Day:
+                start_dt = end_dt - timedelta(days=limit * amount)
+            elif tf_unit == TimeFrameUnit.Hour:
+                start_dt = end_dt - timedelta(hours=limit * amount)
+            else:  # Minute
+                start_dt = end_dt - timedelta(minutes=limit * amount)
+        return start_dt, end_dt
+
+    @staticmethod
+    def _normalize_crypto_symbol(symbol: str) -> str:
+        """
+        Normalize a crypto symbol to slash format (Alpaca requirement).
+
+        BTCUSD → BTC/USD, ETHUSD → ETH/USD, BTCUSDT → BTC/USDT
+        """
+        if "/" in symbol:
+            return symbol
+        if symbol.endswith("USDT"):
+            normalized = f"{symbol[:-4]}/USDT"
+        elif symbol.endswith("USD"):
+            normalized = f"{symbol[:-3]}/USD"
+        else:
+            raise ValueError(f"Cannot normalize crypto symbol: {symbol}")
+        logger.debug(f"Normalized crypto symbol to: {normalized}")
+        return normalized
+
+    @staticmethod
+    def _split_bars_by_symbol(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Split a multi-symbol bars frame (symbol, timestamp) into per-symbol frames.
+        """
+        if df.empty:
+            return {}
+        if not isinstance(df.index, pd.MultiIndex):
+            raise ValueError("Expected a (symbol, timestamp) MultiIndex for multi-symbol bars")
+        return {
+            symbol: group.droplevel(0)
+            for symbol, group in df.groupby(level=0, sort=False)
+        }
+
     def _fetch_stock_bars(
         self,
         symbol: str,
@@ -159,52 +319,10 @@ class AlpacaConnectionManager:
         (Original implementation from fetch_historical_bars)
         """
         try:
-            # Improved timeframe parsing
-            import re
-
-            timeframe_lower = timeframe.lower()
-            # This regex handles formats like "1m", "5Min", "1Hour", "1h", "1 day", "1d"
-            match = re.match(r"(\d+)\s*(m|min|h|hour|d|day)", timeframe_lower)
-            if not match:
-                raise ValueError(f"Invalid timeframe format: {timeframe}")
-
-            amount = int(match.group(1))
-            unit_str = match.group(2)
-
-            if "m" in unit_str:
-                tf_unit = TimeFrameUnit.Minute
-            elif "h" in unit_str:
-                tf_unit = TimeFrameUnit.Hour
-            elif "d" in unit_str:
-                tf_unit = TimeFrameUnit.Day
-            else:
-                raise ValueError(f"Unrecognized timeframe unit in: {timeframe}")
-
-            tf = TimeFrame(amount, tf_unit)
-
-            # Calculate start/end times
-            if start and end:
-                start_dt = pd.to_datetime(start)
-                if (
-                    start_dt.tzinfo is None
-                    or start_dt.tzinfo.utcoffset(start_dt) is None
-                ):
-                    start_dt = start_dt.tz_localize("America/New_York")
-                else:
-                    start_dt = start_dt.tz_convert("America/New_York")
-                end_dt = pd.to_datetime(end)
-                if end_dt.tzinfo is None or end_dt.tzinfo.utcoffset(end_dt) is None:
-                    end_dt = end_dt.tz_localize("America/New_York")
-                else:
-                    end_dt = end_dt.tz_convert("America/New_York")
-            else:
-                end_dt = datetime.now()
-                if tf_unit == TimeFrameUnit.Day:
-                    start_dt = end_dt - timedelta(days=limit * amount)
-                elif tf_unit == TimeFrameUnit.Hour:
-                    start_dt = end_dt - timedelta(hours=limit * amount)
-                else:  # Minute
-                    start_dt = end_dt - timedelta(minutes=limit * amount)
+            tf, tf_unit, amount = self._parse_timeframe(timeframe)
+            start_dt, end_dt = self._resolve_window(
+                start, end, tf_unit, amount, limit, "America/New_York"
+            )
 
             request_params = StockBarsRequest(
                 symbol_or_symbols=[symbol],
@@ -230,6 +348,44 @@ class AlpacaConnectionManager:
             logger.error(f"Failed to fetch stock bars: {e}")
             raise
 
+    def _fetch_stock_bars_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: Optional[str],
+        end: Optional[str],
+        limit: int,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch stock (equity) historical bars for several symbols in one request.
+        """
+        try:
+            tf, tf_unit, amount = self._parse_timeframe(timeframe)
+            start_dt, end_dt = self._resolve_window(
+                start, end, tf_unit, amount, limit, "America/New_York"
+            )
+
+            request_params = StockBarsRequest(
+                symbol_or_symbols=list(symbols),
+                timeframe=tf,
+                start=start_dt,
+                end=end_dt,
+                feed=settings.alpaca_data_feed,
+            )
+
+            bars = self.data_client.get_stock_bars(request_params)
+            by_symbol = self._split_bars_by_symbol(bars.df)
+
+            logger.info(
+                f"Fetched bars for {len(by_symbol)}/{len(symbols)} symbols ({timeframe}) "
+                f"from {start_dt} to {end_dt}"
+            )
+            return by_symbol
+
+        except Exception as e:
+            logger.error(f"Failed to fetch stock bars: {e}")
+            raise
+
     def _fetch_crypto_bars(
         self,
         symbol: str,
@@ -247,61 +403,13 @@ class AlpacaConnectionManager:
         Note: Alpaca crypto API requires symbols with slash (BTC/USD, not BTCUSD)
         """
         try:
-            # Normalize crypto symbol to slash format (Alpaca requirement)
-            if "/" not in symbol:
-                # BTCUSD → BTC/USD, ETHUSD → ETH/USD, BTCUSDT → BTC/USDT
-                if symbol.endswith("USDT"):
-                    base = symbol[:-4]  # Remove USDT
-                    symbol = f"{base}/USDT"
-                elif symbol.endswith("USD"):
-                    base = symbol[:-3]  # Remove USD
-                    symbol = f"{base}/USD"
-                else:
-                    raise ValueError(f"Cannot normalize crypto symbol: {symbol}")
-                logger.debug(f"Normalized crypto symbol to: {symbol}")
-            
-            # Parse timeframe (same logic as stocks)
-            import re
-
-            timeframe_lower = timeframe.lower()
-            match = re.match(r"(\d+)\s*(m|min|h|hour|d|day)", timeframe_lower)
-            if not match:
-                raise ValueError(f"Invalid timeframe format: {timeframe}")
-
-            amount = int(match.group(1))
-            unit_str = match.group(2)
-
-            if "m" in unit_str:
-                tf_unit = TimeFrameUnit.Minute
-            elif "h" in unit_str:
-                tf_unit = TimeFrameUnit.Hour
-            elif "d" in unit_str:
-                tf_unit = TimeFrameUnit.Day
-            else:
-                raise ValueError(f"Unrecognized timeframe unit in: {timeframe}")
-
-            tf = TimeFrame(amount, tf_unit)
-
-            # Calculate start/end times (crypto is 24/7, use UTC)
-            if start and end:
-                start_dt = pd.to_datetime(start)
-                if start_dt.tzinfo is None or start_dt.tzinfo.utcoffset(start_dt) is None:
-                    start_dt = start_dt.tz_localize("UTC")
-                else:
-                    start_dt = start_dt.tz_convert("UTC")
-                end_dt = pd.to_datetime(end)
-                if end_dt.tzinfo is None or end_dt.tzinfo.utcoffset(end_dt) is None:
-                    end_dt = end_dt.tz_localize("UTC")
-                else:
-                    end_dt = end_dt.tz_convert("UTC")
-            else:
-                end_dt = datetime.now()
-                if tf_unit == TimeFrameUnit.Day:
-                    start_dt = end_dt - timedelta(days=limit * amount)
-                elif tf_unit == TimeFrameUnit.Hour:
-                    start_dt = end_dt - timedelta(hours=limit * amount)
-                else:  # Minute
-                    start_dt = end_dt - timedelta(minutes=limit * amount)
+            symbol = self._normalize_crypto_symbol(symbol)
+
+            # Crypto is 24/7, use UTC
+            tf, tf_unit, amount = self._parse_timeframe(timeframe)
+            start_dt, end_dt = self._resolve_window(
+                start, end, tf_unit, amount, limit, "UTC"
+            )
 
             # Use CryptoBarsRequest (different from StockBarsRequest)
             request_params = CryptoBarsRequest(
@@ -327,6 +435,55 @@ class AlpacaConnectionManager:
             logger.error(f"Failed to fetch crypto bars: {e}")
             raise
 
+    def _fetch_crypto_bars_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        start: Optional[str],
+        end: Optional[str],
+        limit: int,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch cryptocurrency historical bars for several symbols in one request.
+
+        Results are keyed by the symbols as passed in, even when they had to be
+        normalized to slash format for the request. Spellings of the same pair
+        (e.g. BTCUSD and BTC/USD) share one requested series and each gets it.
+        """
+        try:
+            normalized: Dict[str, List[str]] = {}
+            for s in symbols:
+                normalized.setdefault(self._normalize_crypto_symbol(s), []).append(s)
+
+            tf, tf_unit, amount = self._parse_timeframe(timeframe)
+            start_dt, end_dt = self._resolve_window(
+                start, end, tf_unit, amount, limit, "UTC"
+            )
+
+            request_params = CryptoBarsRequest(
+                symbol_or_symbols=list(normalized),
+                timeframe=tf,
+                start=start_dt,
+                end=end_dt,
+            )
+
+            bars = self.crypto_client.get_crypto_bars(request_params)
+            by_symbol = {
+                original: df
+                for symbol, df in self._split_bars_by_symbol(bars.df).items()
+                for original in normalized.get(symbol, [symbol])
+            }
+
+            logger.info(
+                f"Fetched crypto bars for {len(by_symbol)}/{len(symbols)} symbols ({timeframe}) "
+                f"from {start_dt} to {end_dt}"
+            )
+            return by_symbol
+
+        except Exception as e:
+            logger.error(f"Failed to fetch crypto bars: {e}")
+            raise
+
     def place_market_order(
         self, symbol: str, qty: int, side: str  # "BUY" or "SELL"
     ) -> dict:
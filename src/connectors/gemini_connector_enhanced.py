@@ -16,7 +16,7 @@ import logging
 import threading
 import time
 from collections import deque, defaultdict
-from typing import List, Optional, Dict, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,12 +24,25 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-try:
-    from google import genai
+if TYPE_CHECKING:
     from google.genai.types import Model
-except ImportError:
-    genai = None
-    Model = None
+
+
+def _import_genai():
+    """
+    Import google-genai on first use.
+
+    The SDK takes seconds to import and is only needed for model discovery, so
+    importing this module (and everything that pulls in the connector) stays cheap.
+
+    Returns:
+        The google.genai module, or None if the library is not installed
+    """
+    try:
+        from google import genai
+    except ImportError:
+        return None
+    return genai
 
 
 class ModelTier(Enum):
@@ -158,6 +171,7 @@ class DynamicModelManager:
         
         for attempt in range(max_retries):
             try:
+                genai = _import_genai()
                 if genai is None:
                     raise RuntimeError("google-genai library not installed")
 
@@ -273,8 +287,11 @@ class EnhancedGeminiConnectionManager:
         self.quota_tracker = ModelQuotaTracker()
         self.model_manager = DynamicModelManager(self.api_keys[0])
 
-        # Get dynamic model lists
-        self.flash_models, self.pro_models = self.model_manager.get_preferred_models()
+        # Dynamic model lists are discovered on first use (see _preferred_models), so
+        # constructing the manager - including the module singleton at import - makes no API call
+        self._model_lists: Optional[Tuple[List[str], List[str]]] = None
+        # Separate from self._lock, which is held while model lists are read
+        self._model_lists_lock = threading.Lock()
 
         # Thread lock for ensuring atomic quota checking and model selection during parallel execution.
         # Prevents race conditions when multiple trading crews run concurrently and attempt to access
@@ -285,8 +302,35 @@ class EnhancedGeminiConnectionManager:
         logger.info(
             f"Enhanced Gemini connector initialized with {len(self.api_keys)} keys"
         )
-        logger.info(f"Preferred Flash models: {self.flash_models}")
-        logger.info(f"Fallback Pro models: {self.pro_models}")
+
+    @property
+    def flash_models(self) -> List[str]:
+        """Preferred Flash models, discovered on first access."""
+        return self._preferred_models()[0]
+
+    @property
+    def pro_models(self) -> List[str]:
+        """Fallback Pro models, discovered on first access."""
+        return self._preferred_models()[1]
+
+    def _preferred_models(self) -> Tuple[List[str], List[str]]:
+        """
+        Return the (flash_models, pro_models) lists, querying the model manager once.
+
+        Concurrent first calls wait for a single discovery instead of each querying.
+
+        Returns:
+            Tuple of Flash and Pro model name lists
+        """
+        model_lists = self._model_lists
+        if model_lists is None:
+            with self._model_lists_lock:
+                if self._model_lists is None:
+                    self._model_lists = self.model_manager.get_preferred_models()
+                    logger.info(f"Preferred Flash models: {self._model_lists[0]}")
+                    logger.info(f"Fallback Pro models: {self._model_lists[1]}")
+                model_lists = self._model_lists
+        return model_lists
 
     @staticmethod
     def mask_api_key(api_key: str) -> str:
@@ -453,7 +497,9 @@ class EnhancedGeminiConnectionManager:
     def refresh_model_list(self):
         """Manually refresh the list of available models"""
         logger.info("Refreshing available models from Gemini API")
-        self.flash_models, self.pro_models = self.model_manager.get_preferred_models()
+        model_lists = self.model_manager.get_preferred_models()
+        with self._model_lists_lock:
+            self._model_lists = model_lists
         logger.info(f"Updated - Flash: {self.flash_models}, Pro: {self.pro_models}")
 
 
@@ -29,18 +29,32 @@ class MarketRotationStrategy:
     3. Performance overlay: Adjust based on recent market performance
     """
     
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(
+        self,
+        state_file: Optional[Path] = None,
+        state_manager: Optional[StateManager] = None,
+        autoflush: bool = True
+    ):
         """
         Initialize market rotation strategy.
         
         Args:
             state_file: Path to state file for performance tracking (default: data/market_rotation_state.json)
+            state_manager: Pre-built state manager (anything with load_state/save_state).
+                Takes precedence over state_file when given.
+            autoflush: Save state after every mutation. When False, changes stay
+                in memory until flush() is called.
         """
         self.market_calendar = MarketCalendar()
-        self.state_manager = StateManager(
+        self.state_manager = state_manager or StateManager(
             state_file or Path("data/market_rotation_state.json")
         )
+        self.autoflush = autoflush
         self.performance_state = self._load_performance_state()
+        
+        # get_market_statistics() cache, invalidated when performance or the active market changes
+        self._cached_stats: Optional[Dict] = None
+        self._stats_dirty = True
     
     def _load_performance_state(self) -> Dict:
         """
@@ -62,10 +76,20 @@ class MarketRotationStrategy:
                 'last_rotation': None,
                 'rotation_count': 0,
             }
-            self.state_manager.save_state(state)
+            if self.autoflush:
+                self.state_manager.save_state(state)
         
         return state
     
+    def _save_state(self):
+        """Persist performance state unless autoflush is disabled."""
+        if self.autoflush:
+            self.state_manager.save_state(self.performance_state)
+    
+    def flush(self):
+        """Persist performance state now, regardless of autoflush."""
+        self.state_manager.save_state(self.performance_state)
+    
     def select_active_market(
         self,
         target_markets: Optional[List[str]] = None,
@@ -209,11 +233,15 @@ class MarketRotationStrategy:
         if last_rotation != selected_market:
             self.performance_state['rotation_count'] = self.performance_state.get('rotation_count', 0) + 1
             logger.info(f"Market rotation: {last_rotation} → {selected_market} (rotation #{self.performance_state['rotation_count']})")
+            self._stats_dirty = True
         
         self.performance_state['last_rotation'] = selected_market
         self.performance_state['last_rotation_time'] = now.isoformat()
+        # Same market again: only the timestamp moved, so patch it in and keep the cache
+        if self._cached_stats is not None:
+            self._cached_stats['last_rotation_time'] = self.performance_state['last_rotation_time']
         
-        self.state_manager.save_state(self.performance_state)
+        self._save_state()
     
     def update_market_performance(
         self,
@@ -234,6 +262,40 @@ class MarketRotationStrategy:
                     'timestamp': str
                 }
         """
+        self._apply_trade(market, trade_result)
+        
+        # Save state
+        self._save_state()
+    
+    def bulk_update_market_performance(
+        self,
+        market: str,
+        trades: List[Dict]
+    ):
+        """
+        Update performance metrics for a market with several trades at once.
+        
+        Applies every trade in a single pass and saves state once at the end,
+        instead of one disk write per trade.
+        
+        Args:
+            market: Market name ('US_EQUITY', 'CRYPTO', 'FOREX')
+            trades: List of trade outcome dictionaries (same shape as
+                ``trade_result`` in ``update_market_performance``)
+        """
+        for trade_result in trades:
+            self._apply_trade(market, trade_result)
+        
+        self._save_state()
+    
+    def _apply_trade(self, market: str, trade_result: Dict):
+        """
+        Apply a single trade outcome to in-memory performance metrics.
+        
+        Args:
+            market: Market name
+            trade_result: Dictionary with trade outcome
+        """
         if 'market_performance' not in self.performance_state:
             self.performance_state['market_performance'] = {}
         
@@ -246,6 +308,7 @@ class MarketRotationStrategy:
             }
         
         metrics = self.performance_state['market_performance'][market]
+        self._stats_dirty = True
         
         # Update metrics
         metrics['trades'] += 1
@@ -263,17 +326,28 @@ class MarketRotationStrategy:
             f"{metrics['win_rate']:.1%} win rate, "
             f"${metrics['avg_profit']:.2f} avg profit"
         )
-        
-        # Save state
-        self.state_manager.save_state(self.performance_state)
     
     def get_market_statistics(self) -> Dict:
         """
         Get comprehensive statistics for all markets.
         
+        Market scores are cached until the next performance update, rotation
+        to a different market or reset, so repeated calls between mutations
+        skip rescoring. Each call returns a fresh copy that callers may modify.
+        
         Returns:
             Dictionary with market statistics
         """
+        if self._stats_dirty or self._cached_stats is None:
+            self._cached_stats = self._build_market_statistics()
+            self._stats_dirty = False
+        
+        stats = dict(self._cached_stats)
+        stats['markets'] = {market: dict(entry) for market, entry in stats['markets'].items()}
+        return stats
+    
+    def _build_market_statistics(self) -> Dict:
+        """Score every market and assemble the statistics that get_market_statistics caches."""
         stats = {
             'markets': {},
             'rotation_count': self.performance_state.get('rotation_count', 0),
@@ -321,7 +395,8 @@ class MarketRotationStrategy:
             self.performance_state['rotation_count'] = 0
             logger.info("Reset performance for all markets")
         
-        self.state_manager.save_state(self.performance_state)
+        self._stats_dirty = True
+        self._save_state()
 
 
 # Global singleton instance
@@ -41,13 +41,49 @@ Usage:
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 from src.crew.market_scanner_crew import market_scanner_crew
 from src.crew.trading_crew import TradingCrew
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class TopAsset:
+    """
+    A single market scanner recommendation, validated once when the scan is parsed.
+
+    Attributes:
+        symbol: Asset symbol to trade
+        priority: Priority score (1-5)
+        recommended_strategies: Strategy names to run (defaults to 3MA)
+        reason: Explanation for recommendation
+        scores: Dict with volatility, technical, liquidity scores
+    """
+    symbol: str
+    priority: int = 0
+    recommended_strategies: List[str] = field(default_factory=lambda: ["3ma"])
+    reason: str = ""
+    scores: Dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TopAsset":
+        """
+        Build a TopAsset from one entry of the scanner's top_assets list.
+
+        Raises:
+            KeyError: If the entry has no symbol
+        """
+        return cls(
+            symbol=data["symbol"],
+            priority=data.get("priority", 0),
+            recommended_strategies=data.get("recommended_strategies", ["3ma"]),
+            reason=data.get("reason", ""),
+            scores=data.get("scores", {}),
+        )
+
+
 class TradingOrchestrator:
     """
     Orchestrates parallel execution of trading crews.
@@ -58,14 +94,28 @@ class TradingOrchestrator:
     Attributes:
         market_scanner: Market scanner crew instance
         active_crews: Dictionary tracking active trading crew instances
-        executor: Thread pool executor for parallel crew execution (max 3 workers)
+        executor: Thread pool executor for parallel crew execution (max 3 workers, created lazily)
     """
 
-    def __init__(self):
+    def __init__(self, sleep_fn: Optional[Callable[[float], None]] = None):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            sleep_fn: Delay function used to stagger crew submissions (default: time.sleep)
+        """
         self.market_scanner = market_scanner_crew
         self.active_crews: Dict[str, TradingCrew] = {}
-        self.executor = ThreadPoolExecutor(max_workers=3)  # Limit parallel crews to 3
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.global_rate_limiter = None  # Placeholder for future rate limiter implementation
+        self._sleep = sleep_fn or time.sleep
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazy-loaded thread pool, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=3)  # Limit parallel crews to 3
+        return self._executor
 
     def _run_trading_crew(self, symbol: str, strategy: str):
         """
@@ -133,18 +183,17 @@ class TradingOrchestrator:
         
         # Calculate total expected crews to determine when to delay
         total_expected_crews = sum(
-            len(asset.get("recommended_strategies", ["3ma"])) 
-            for asset in top_assets[:3]
+            len(asset.recommended_strategies) for asset in top_assets[:3]
         )
         
         for asset_config in top_assets[:3]:  # Process top 3 assets
-            for strategy in asset_config.get("recommended_strategies", ["3ma"]):
+            for strategy in asset_config.recommended_strategies:
                 logger.info(
-                    f"Submitting trading crew for {asset_config['symbol']} with strategy {strategy}"
+                    f"Submitting trading crew for {asset_config.symbol} with strategy {strategy}"
                 )
                 future = self.executor.submit(
                     self._run_trading_crew,
-                    symbol=asset_config["symbol"],
+                    symbol=asset_config.symbol,
                     strategy=strategy,
                 )
                 futures.append(future)
@@ -152,7 +201,7 @@ class TradingOrchestrator:
                 # This helps prevent all crews from hitting the API simultaneously
                 # Skip delay after the last submission
                 if len(futures) < total_expected_crews:
-                    time.sleep(2)
+                    self._sleep(2)
 
         # Step 3: Wait for all submitted crews to complete
         results = [f.result() for f in futures]
@@ -160,7 +209,7 @@ class TradingOrchestrator:
         # Step 4: Log summary of all results
         self.log_cycle_summary(results)
 
-    def _parse_scan_results(self, scan_results) -> List[Dict]:
+    def _parse_scan_results(self, scan_results) -> List[TopAsset]:
         """
         Parse and validate market scanner output.
 
@@ -168,12 +217,7 @@ class TradingOrchestrator:
             scan_results: Raw output from market scanner crew (CrewOutput object)
 
         Returns:
-            List of asset configurations, each containing:
-                - symbol: Stock symbol
-                - priority: Priority score (1-5)
-                - scores: Dict with volatility, technical, liquidity scores
-                - recommended_strategies: List of strategy names
-                - reason: Explanation for recommendation
+            List of TopAsset recommendations. Entries without a symbol are skipped.
 
         Returns empty list if parsing fails.
         """
@@ -186,17 +230,17 @@ class TradingOrchestrator:
             if hasattr(scan_results, 'pydantic') and scan_results.pydantic is not None:
                 result_dict = scan_results.pydantic.model_dump()
                 logger.debug(f"Parsed pydantic output keys: {result_dict.keys()}")
-                return result_dict.get("top_assets", [])
+                raw_assets = result_dict.get("top_assets", [])
             
             # Try json_dict attribute (alternate structured output)
             elif hasattr(scan_results, 'json_dict') and scan_results.json_dict is not None:
                 logger.debug(f"Parsed json_dict output keys: {scan_results.json_dict.keys()}")
-                return scan_results.json_dict.get("top_assets", [])
+                raw_assets = scan_results.json_dict.get("top_assets", [])
             
             # Fallback: try to access as dict
             elif isinstance(scan_results, dict):
                 logger.debug(f"Parsed dict output keys: {scan_results.keys()}")
-                return scan_results.get("top_assets", [])
+                raw_assets = scan_results.get("top_assets", [])
             
             # Last resort: try raw attribute and parse JSON
             elif hasattr(scan_results, 'raw'):
@@ -207,12 +251,20 @@ class TradingOrchestrator:
                 raw_str = raw_str.strip().removeprefix("```json").removesuffix("```").strip()
                 result_dict = json.loads(raw_str)
                 logger.debug(f"Parsed raw output keys: {result_dict.keys()}")
-                return result_dict.get("top_assets", [])
+                raw_assets = result_dict.get("top_assets", [])
             
             else:
                 logger.error(f"Unknown scan_results type: {type(scan_results)}")
                 logger.error(f"Available attributes: {[a for a in dir(scan_results) if not a.startswith('_')]}")
                 return []
+
+            top_assets = []
+            for asset in raw_assets:
+                try:
+                    top_assets.append(TopAsset.from_dict(asset))
+                except KeyError:
+                    logger.warning(f"Skipping scanner asset without a symbol: {asset}")
+            return top_assets
                 
         except Exception as e:
             logger.error(f"Failed to parse market scanner output: {e}")
@@ -35,15 +35,11 @@ Usage:
     else:
         print(f"Error: {result['error']}")
 """
-from crewai import Crew, Process, LLM
 import threading
 import logging
 
-from src.agents.base_agents import TradingAgents
 from src.config.settings import settings
-from src.connectors.gemini_connector_enhanced import enhanced_gemini_manager
 from src.crew.crew_context import crew_context
-from src.crew.tasks import TradingTasks
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +49,9 @@ class TradingCrew:
     Manages the complete workflow from data collection to trade execution.
     """
     
+    # Crews are created per symbol/strategy run; slots keep each instance lean
+    __slots__ = ('crew',)
+    
     def __init__(self, skip_init: bool = False):
         """
         Initialize the trading crew.
@@ -63,6 +62,13 @@ class TradingCrew:
         if skip_init:
             self.crew = None
             return
+        
+        # CrewAI, the agents and the Gemini connector are only needed for a runnable
+        # crew, so skip_init instances (help/validation commands) never import them
+        from crewai import Crew, Process, LLM
+        from src.agents.base_agents import TradingAgents
+        from src.connectors.gemini_connector_enhanced import enhanced_gemini_manager
+        from src.crew.tasks import TradingTasks
             
         # Use enhanced Gemini connector with dynamic model selection
         # Automatically selects best available model and key based on quota
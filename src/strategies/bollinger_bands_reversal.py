@@ -31,7 +31,7 @@ class BollingerBandsReversalStrategy(TradingStrategy):
             "lower_band": lower_band,
             "rsi": TechnicalAnalysisTools.calculate_rsi(df, 14),
             "volume": df['volume'],
-            "bb_width": TechnicalAnalysisTools.calculate_bollinger_band_width(df),
+            "bb_width": TechnicalAnalysisTools.bollinger_band_width(upper_band, middle_band, lower_band),
             "atr": TechnicalAnalysisTools.calculate_atr(df, atr_period),
         }
 
@@ -11,6 +11,24 @@ from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+try:
+    import talib
+except ImportError:
+    talib = None
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Simple moving average of a 1-D float array.
+
+    Uses TA-Lib's C kernel when it is installed. TA-Lib lets a NaN poison every later
+    window while pandas only skips the windows containing it, so NaN-bearing input
+    always goes through pandas to keep the results identical.
+    """
+    if talib is not None and not np.isnan(values).any():
+        return talib.SMA(values, timeperiod=period)
+    return pd.Series(values).rolling(window=period).mean().to_numpy()
+
 
 class TechnicalAnalysisTools:
     """Technical analysis indicators and signal generation."""
@@ -33,14 +51,30 @@ class TechnicalAnalysisTools:
     @staticmethod
     def calculate_sma(df: pd.DataFrame, period: int, column: str = 'close') -> pd.Series:
         """Calculate Simple Moving Average."""
-        return df[column].rolling(window=period).mean()
+        values = df[column]
+        if isinstance(values, pd.DataFrame):
+            # Multi-symbol panel: one column-wise pandas pass
+            return values.rolling(window=period).mean()
+        return pd.Series(
+            _rolling_mean(values.to_numpy(dtype=float), period), index=values.index
+        )
 
     @staticmethod
     def calculate_rsi(df: pd.DataFrame, period: int = 14, column: str = 'close') -> pd.Series:
         """Calculate Relative Strength Index."""
         delta = df[column].diff(1)
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        if isinstance(delta, pd.DataFrame):
+            # Multi-symbol panel: one column-wise pandas pass
+            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        else:
+            values = delta.to_numpy(dtype=float)
+            gain = pd.Series(
+                _rolling_mean(np.where(values > 0, values, 0.0), period), index=delta.index
+            )
+            loss = pd.Series(
+                _rolling_mean(np.where(values < 0, -values, 0.0), period), index=delta.index
+            )
         rs = gain / loss
         return 100 - (100 / (1 + rs))
 
@@ -57,8 +91,9 @@ class TechnicalAnalysisTools:
     @staticmethod
     def calculate_bollinger_bands(df: pd.DataFrame, period=20, std_dev=2, column='close'):
         """Calculate Bollinger Bands."""
-        sma = df[column].rolling(window=period).mean()
-        std = df[column].rolling(window=period).std()
+        window = df[column].rolling(window=period)
+        sma = window.mean()
+        std = window.std()
         upper_band = sma + (std * std_dev)
         lower_band = sma - (std * std_dev)
         return upper_band, sma, lower_band
@@ -67,6 +102,11 @@ class TechnicalAnalysisTools:
     def calculate_bollinger_band_width(df: pd.DataFrame, period=20, std_dev=2, column='close'):
         """Calculate Bollinger Band Width."""
         upper, middle, lower = TechnicalAnalysisTools.calculate_bollinger_bands(df, period, std_dev, column)
+        return TechnicalAnalysisTools.bollinger_band_width(upper, middle, lower)
+
+    @staticmethod
+    def bollinger_band_width(upper: pd.Series, middle: pd.Series, lower: pd.Series) -> pd.Series:
+        """Calculate Bollinger Band Width (percent of the middle band) from precomputed bands."""
         return ((upper - lower) / middle) * 100
     
     @staticmethod
@@ -81,19 +121,42 @@ class TechnicalAnalysisTools:
         Returns:
             Series with ATR values
         """
-        high = df['high']
-        low = df['low']
-        close = df['close']
+        atr = TechnicalAnalysisTools.average_true_range(
+            df['high'].to_numpy(dtype=float),
+            df['low'].to_numpy(dtype=float),
+            df['close'].to_numpy(dtype=float),
+            period
+        )
+        return pd.Series(atr, index=df.index)
+    
+    @staticmethod
+    def average_true_range(
+        high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14
+    ) -> np.ndarray:
+        """
+        Calculate Average True Range directly on float arrays.
         
-        # True Range calculation
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            period: ATR period
         
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
+        Returns:
+            Array with ATR values (NaN until the first full window)
+        """
+        # True Range calculation; the first bar has no previous close, so its
+        # gap terms are NaN and fmax falls back to high - low
+        prev_close = np.empty_like(close)
+        prev_close[:1] = np.nan
+        prev_close[1:] = close[:-1]
         
-        return atr
+        true_range = np.fmax.reduce([
+            high - low,
+            np.abs(high - prev_close),
+            np.abs(low - prev_close)
+        ])
+        return _rolling_mean(true_range, period)
     
     @staticmethod
     def calculate_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -0,0 +1,119 @@
+"""Historical Bars Cache
+
+On-disk cache for OHLCV bars fetched by the market scanner. Entries are pickled
+DataFrames (dtypes and DatetimeIndex survive the round trip) keyed by
+(symbol, timeframe, limit, asset_class) and expire after a timeframe-dependent TTL:
+daily bars are reused for a day, intraday bars for a minute.
+
+The key carries no trading date, so a cached daily bar can be a day old or a
+partial bar from earlier in the session. The cache is therefore off unless
+BARS_CACHE_ENABLED is set, which is meant for tests and backtests only.
+
+Usage:
+    from src.tools.bars_cache import bars_cache
+
+    key = bars_cache.make_key("BTC/USD", "1Day", 100, "CRYPTO")
+    df = bars_cache.get(key, bars_cache.ttl_for("1Day"))
+    if df is None:
+        df = fetch(...)
+        bars_cache.set(key, df)
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BarsCache:
+    """File-backed TTL cache for historical bar DataFrames."""
+
+    DAILY_TTL_SECONDS = 24 * 60 * 60
+    INTRADAY_TTL_SECONDS = 60
+
+    def __init__(self, cache_dir: Path = Path(".cache/bars"), enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached pickles (created on first write)
+            enabled: When False, get() always misses and set() is a no-op
+        """
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+
+    @staticmethod
+    def make_key(symbol: str, timeframe: str, limit: int, asset_class: str) -> str:
+        """Build a filesystem-safe cache key for one symbol's bars."""
+        raw = f"{symbol}|{timeframe}|{limit}|{asset_class}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def ttl_for(cls, timeframe: str) -> int:
+        """Return the TTL in seconds for bars of the given timeframe."""
+        if re.match(r"\d+\s*(d|day)", timeframe.lower()):
+            return cls.DAILY_TTL_SECONDS
+        return cls.INTRADAY_TTL_SECONDS
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str, ttl: int) -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for ``key`` if present and younger than ``ttl`` seconds.
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if age > ttl:
+            return None
+
+        try:
+            return pd.read_pickle(path)
+        except Exception as e:
+            # Truncated or corrupt entry (e.g. from a pre-atomic writer): treat as a miss
+            logger.warning(f"Discarding unreadable bars cache entry {path}: {e}")
+            return None
+
+    def set(self, key: str, df: pd.DataFrame):
+        """Store ``df`` under ``key``. Writes are atomic (temp file + rename)."""
+        if not self.enabled:
+            return
+
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Unique temp file per writer, renamed into place, so concurrent or
+            # interrupted writes never leave a truncated pickle under the key
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            df.to_pickle(tmp_name)
+            os.replace(tmp_name, self._path(key))
+        except Exception as e:
+            logger.warning(f"Failed to write bars cache entry {key}: {e}")
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+
+
+# Global singleton instance
+# Opt-in: live scans must see fresh bars, so only tests/backtests enable it
+bars_cache = BarsCache(enabled=settings.bars_cache_enabled)
@@ -88,12 +88,14 @@ DataFrames between tools is incompatible with CrewAI's design. Refactoring requi
 =====================================================================================================
 """
 
+import numpy as np
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from src.connectors.alpaca_connector import alpaca_manager
 from src.tools.analysis_tools import TechnicalAnalysisTools
 from src.tools.universe_manager import universe_manager
+from src.tools.bars_cache import bars_cache
 from src.utils.asset_classifier import AssetClassifier
 from src.constants import SP_100_SYMBOLS
 import logging
@@ -103,6 +105,73 @@ logger = logging.getLogger(__name__)
 # Initialize asset classifier for multi-market support
 asset_classifier = AssetClassifier()
 
+# Bar fields handed to the analysis kernels as plain arrays
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _frames_to_arrays(frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Convert symbol DataFrames to {field: float64 array} for the OHLCV columns present.
+
+    Args:
+        frames: Symbol to OHLCV DataFrame
+
+    Returns:
+        Symbol to {field: ndarray}
+    """
+    return {
+        symbol: {
+            field: df[field].to_numpy(dtype=float)
+            for field in OHLCV_FIELDS
+            if field in df.columns
+        }
+        for symbol, df in frames.items()
+    }
+
+
+def _technical_indicators(ready: Dict[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """
+    Compute the last-bar RSI, MACD and SMA values for several symbols in one pass.
+
+    Every symbol's closes are aligned on bar position from the end (shorter series are
+    NaN-padded at the front) so each indicator is one column-wise pass over the whole
+    universe rather than a separate computation per symbol.
+
+    Args:
+        ready: Symbol to 1-D close array, each with at least 50 bars
+
+    Returns:
+        Symbol to {rsi, sma_20, sma_50, price, macd, macd_prev, signal, signal_prev}
+    """
+    closes = pd.concat(
+        {
+            symbol: pd.Series(close, index=pd.RangeIndex(-len(close), 0))
+            for symbol, close in ready.items()
+        },
+        axis=1
+    )
+    panel = pd.concat({"close": closes}, axis=1)
+
+    rsi_values = TechnicalAnalysisTools.calculate_rsi(panel, 14).iloc[-1]
+    macd_line, signal_line, _ = TechnicalAnalysisTools.calculate_macd(panel)
+    sma_20_values = TechnicalAnalysisTools.calculate_sma(panel, 20).iloc[-1]
+    sma_50_values = TechnicalAnalysisTools.calculate_sma(panel, 50).iloc[-1]
+    prices = closes.iloc[-1]
+
+    return {
+        symbol: {
+            "rsi": float(rsi_values[symbol]),
+            "sma_20": float(sma_20_values[symbol]),
+            "sma_50": float(sma_50_values[symbol]),
+            "price": float(prices[symbol]),
+            "macd": float(macd_line[symbol].iloc[-1]),
+            "macd_prev": float(macd_line[symbol].iloc[-2]),
+            "signal": float(signal_line[symbol].iloc[-1]),
+            "signal_prev": float(signal_line[symbol].iloc[-2]),
+        }
+        for symbol in ready
+    }
+
 
 class MarketScanTools:
 
@@ -148,10 +217,11 @@ class MarketScanTools:
         symbols: List[str],
         timeframe: str = "1Day",
         limit: int = 100,
-        asset_class: Optional[str] = None
+        asset_class: Optional[str] = None,
+        use_cache: bool = False
     ) -> Dict[str, pd.DataFrame]:
         """
-        Fetch historical data for a universe of symbols using parallel execution.
+        Fetch historical data for a universe of symbols using batched requests.
 
         ⚠️  DEPRECATED (Phase 4 - November 4, 2025) ⚠️
         -----------------------------------------------
@@ -171,9 +241,12 @@ class MarketScanTools:
         **DO NOT USE** in CrewAI tool chains - tools will fail with TypeError.
         -----------------------------------------------
 
-        Uses ThreadPoolExecutor to fetch data concurrently from Alpaca API,
-        dramatically improving performance for large symbol lists. With parallel
-        fetching, scanning 100 symbols completes in ~1 minute vs 7+ minutes sequentially.
+        Symbols are grouped by asset class and each group is fetched with a single
+        multi-symbol Alpaca request, so a universe of N symbols costs one round trip
+        per asset class instead of N. When the universe spans several asset classes
+        the per-class requests run concurrently. With use_cache=True, recently fetched
+        bars are served from the on-disk bars cache (see src/tools/bars_cache.py)
+        without a request; live scans leave it off so every cycle sees fresh bars.
 
         Supports multi-asset class fetching (stocks, crypto, forex) with automatic
         detection via AssetClassifier.
@@ -184,6 +257,7 @@ class MarketScanTools:
             limit: Number of bars to fetch per symbol
             asset_class: Optional asset class override ('US_EQUITY', 'CRYPTO', 'FOREX')
                         If None, auto-detected per symbol
+            use_cache: Read and populate the on-disk bars cache (tests/backtests only)
 
         Returns:
             Dictionary mapping symbols to their DataFrames (only successful fetches)
@@ -195,60 +269,91 @@ class MarketScanTools:
         """
         universe_data = {}
 
-        def _fetch_one(symbol: str) -> tuple:
+        # Group symbols by asset class so each class is one batched request
+        groups: Dict[str, List[str]] = {}
+        for symbol in symbols:
+            if asset_class is None:
+                try:
+                    detected_class = asset_classifier.classify(symbol)['type']
+                except ValueError as e:
+                    logger.warning(f"Exception classifying {symbol}: {e}")
+                    continue
+            else:
+                detected_class = asset_class
+            groups.setdefault(detected_class, []).append(symbol)
+
+        ttl = bars_cache.ttl_for(timeframe)
+
+        def _fetch_group(group_class: str, group_symbols: List[str]) -> Dict[str, pd.DataFrame]:
             """
-            Helper function to fetch data for a single symbol.
-            Used by ThreadPoolExecutor for concurrent execution.
+            Fetch one asset-class group, serving cache hits and batching the rest.
 
             Args:
-                symbol: Symbol to fetch (stock/crypto/forex)
+                group_class: Asset class shared by every symbol in the group
+                group_symbols: Symbols belonging to that asset class
 
             Returns:
-                Tuple of (symbol, DataFrame or None)
+                Dictionary mapping symbols to their non-empty DataFrames
             """
-            try:
-                # Auto-detect asset class if not specified
-                if asset_class is None:
-                    classification = asset_classifier.classify(symbol)
-                    detected_class = classification['type']
-                else:
-                    detected_class = asset_class
+            group_data = {}
+
+            if use_cache:
+                # Serve what we can from the on-disk cache; only request the rest
+                to_fetch = []
+                for symbol in group_symbols:
+                    cached = bars_cache.get(
+                        bars_cache.make_key(symbol, timeframe, limit, group_class), ttl
+                    )
+                    if cached is not None:
+                        group_data[symbol] = cached
+                    else:
+                        to_fetch.append(symbol)
+            else:
+                to_fetch = list(group_symbols)
+
+            if not to_fetch:
+                return group_data
 
-                # Fetch historical bars with asset class for proper routing
-                df = alpaca_manager.fetch_historical_bars(
-                    symbol=symbol,
+            try:
+                fetched = alpaca_manager.fetch_historical_bars_batch(
+                    symbols=to_fetch,
                     timeframe=timeframe,
                     limit=limit,
-                    asset_class=detected_class
+                    asset_class=group_class
                 )
-                
-                if df is not None and not df.empty:
-                    logger.debug(
-                        f"Fetched {len(df)} bars for {symbol} ({detected_class})"
-                    )
-                    return (symbol, df)
-                else:
-                    logger.warning(
-                        f"No data returned for {symbol} ({detected_class})"
-                    )
-                    return (symbol, None)
             except Exception as e:
-                logger.warning(f"Exception fetching data for {symbol}: {e}")
-                return (symbol, None)
-
-        # Use ThreadPoolExecutor with max_workers=10 for concurrent API calls.
-        # This provides optimal throughput without overwhelming the API or system resources.
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all fetch jobs to the executor
-            future_to_symbol = {
-                executor.submit(_fetch_one, symbol): symbol for symbol in symbols
-            }
+                logger.warning(
+                    f"Exception fetching data for {to_fetch} ({group_class}): {e}"
+                )
+                return group_data
 
-            # Process results as they complete (faster than waiting for all)
-            for future in as_completed(future_to_symbol):
-                symbol, data = future.result()
-                if data is not None:
-                    universe_data[symbol] = data
+            for symbol in to_fetch:
+                df = fetched.get(symbol)
+                if df is not None and not df.empty:
+                    logger.debug(f"Fetched {len(df)} bars for {symbol} ({group_class})")
+                    group_data[symbol] = df
+                    if use_cache:
+                        bars_cache.set(
+                            bars_cache.make_key(symbol, timeframe, limit, group_class), df
+                        )
+                else:
+                    logger.warning(f"No data returned for {symbol} ({group_class})")
+
+            return group_data
+
+        if len(groups) > 1:
+            # Mixed universes need one request per asset class; these are I/O-bound,
+            # so run them concurrently and wait for the slowest instead of the sum.
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+                futures = [
+                    executor.submit(_fetch_group, group_class, group_symbols)
+                    for group_class, group_symbols in groups.items()
+                ]
+                for future in as_completed(futures):
+                    universe_data.update(future.result())
+        else:
+            for group_class, group_symbols in groups.items():
+                universe_data.update(_fetch_group(group_class, group_symbols))
 
         logger.info(
             f"Successfully fetched data for {len(universe_data)}/{len(symbols)} symbols "
@@ -256,12 +361,53 @@ class MarketScanTools:
         )
         return universe_data
 
+    @staticmethod
+    def fetch_universe_arrays(
+        symbols: List[str],
+        timeframe: str = "1Day",
+        limit: int = 100,
+        asset_class: Optional[str] = None,
+        use_cache: bool = False
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Fetch a universe of symbols as plain float arrays, one per OHLCV field.
+
+        Wraps fetch_universe_data (same batching and opt-in caching) and converts each
+        DataFrame once, so the analyze_* helpers run their NumPy/TA-Lib kernels on
+        contiguous float64 columns without any pandas indexing per call.
+
+        Args:
+            symbols: List of symbols to fetch (stocks, crypto, or forex)
+            timeframe: Bar timeframe (e.g., '1Day', '1Hour', '15Min')
+            limit: Number of bars to fetch per symbol
+            asset_class: Optional asset class override ('US_EQUITY', 'CRYPTO', 'FOREX')
+            use_cache: Read and populate the on-disk bars cache (tests/backtests only)
+
+        Returns:
+            Dictionary mapping symbols to {field: ndarray} for the OHLCV columns present
+            (only successful fetches)
+
+        Examples:
+            >>> bars = fetch_universe_arrays(['BTC/USD'], asset_class='CRYPTO')
+            >>> bars['BTC/USD']['close'][-1]
+        """
+        universe_data = MarketScanTools.fetch_universe_data(
+            symbols=symbols,
+            timeframe=timeframe,
+            limit=limit,
+            asset_class=asset_class,
+            use_cache=use_cache
+        )
+        return _frames_to_arrays(universe_data)
+
     @staticmethod
     def analyze_volatility(
         symbols: List[str],
         timeframe: str = "1Hour",
         limit: int = 100,
-        asset_class: Optional[str] = None
+        asset_class: Optional[str] = None,
+        use_cache: bool = False,
+        bars: Optional[Dict[str, pd.DataFrame]] = None
     ) -> List[Dict]:
         """
         Analyze the volatility of each symbol using Independent Tool Fetching pattern.
@@ -285,6 +431,9 @@ class MarketScanTools:
             timeframe: Bar timeframe for volatility calculation (default: '1Hour')
             limit: Number of bars to fetch (default: 100)
             asset_class: Optional asset class override ('US_EQUITY', 'CRYPTO', 'FOREX')
+            use_cache: Serve bars from the on-disk bars cache (tests/backtests only)
+            bars: Optional prefetched symbol-to-DataFrame bars (e.g. from fetch_universe_data);
+                  when given, no fetch is made and timeframe/limit/asset_class are ignored
 
         Returns:
             List of dicts with volatility metrics:
@@ -308,25 +457,24 @@ class MarketScanTools:
         
         logger.info(f"Analyzing volatility for {len(symbols)} symbols...")
         volatility_results = []
+
+        if bars is not None:
+            universe_bars = _frames_to_arrays(bars)
+        else:
+            # One batched fetch for the whole universe instead of one per symbol
+            universe_bars = MarketScanTools.fetch_universe_arrays(
+                symbols=symbols,
+                timeframe=timeframe,
+                limit=limit,
+                asset_class=asset_class,
+                use_cache=use_cache
+            )
         
         for symbol in symbols:
             try:
-                # Auto-detect asset class if not specified
-                if asset_class is None:
-                    classification = asset_classifier.classify(symbol)
-                    detected_class = classification['type']
-                else:
-                    detected_class = asset_class
-                
-                # Fetch data internally (Independent Tool pattern)
-                df = alpaca_manager.fetch_historical_bars(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    limit=limit,
-                    asset_class=detected_class
-                )
+                symbol_bars = universe_bars.get(symbol)
                 
-                if df is None or df.empty:
+                if symbol_bars is None:
                     logger.warning(f"No data returned for {symbol}")
                     volatility_results.append({
                         "symbol": symbol,
@@ -335,19 +483,21 @@ class MarketScanTools:
                     })
                     continue
                 
-                if len(df) < 14:
-                    logger.debug(f"Insufficient data for {symbol} (need 14+ bars, got {len(df)})")
+                if len(symbol_bars["close"]) < 14:
+                    logger.debug(f"Insufficient data for {symbol} (need 14+ bars, got {len(symbol_bars['close'])})")
                     volatility_results.append({
                         "symbol": symbol,
                         "status": "insufficient_data",
-                        "bars": len(df)
+                        "bars": len(symbol_bars["close"])
                     })
                     continue
                 
                 # Calculate ATR (Average True Range)
-                atr = TechnicalAnalysisTools.calculate_atr(df, 14)
-                atr_current = float(atr.iloc[-1])
-                atr_mean = float(atr.mean())
+                atr = TechnicalAnalysisTools.average_true_range(
+                    symbol_bars["high"], symbol_bars["low"], symbol_bars["close"], 14
+                )
+                atr_current = float(atr[-1])
+                atr_mean = float(np.nanmean(atr))
                 atr_percentile = (atr_current / atr_mean) * 100 if atr_mean > 0 else 0
                 
                 volatility_results.append({
@@ -378,7 +528,9 @@ class MarketScanTools:
         symbols: List[str],
         timeframe: str = "1Day",
         limit: int = 100,
-        asset_class: Optional[str] = None
+        asset_class: Optional[str] = None,
+        use_cache: bool = False,
+        bars: Optional[Dict[str, pd.DataFrame]] = None
     ) -> List[Dict]:
         """
         Analyze the technical setup of each symbol using Independent Tool Fetching pattern.
@@ -398,6 +550,9 @@ class MarketScanTools:
             timeframe: Bar timeframe for analysis (default: '1Day')
             limit: Number of bars to fetch (default: 100, need 50+ for indicators)
             asset_class: Optional asset class override
+            use_cache: Serve bars from the on-disk bars cache (tests/backtests only)
+            bars: Optional prefetched symbol-to-DataFrame bars (e.g. from fetch_universe_data);
+                  when given, no fetch is made and timeframe/limit/asset_class are ignored
 
         Returns:
             List of dicts with technical analysis:
@@ -417,108 +572,123 @@ class MarketScanTools:
             return []
         
         logger.info(f"Analyzing technical setup for {len(symbols)} symbols...")
-        technical_results = []
-        
+        results: Dict[str, Dict] = {}
+
+        if bars is not None:
+            universe_bars = _frames_to_arrays(bars)
+        else:
+            # One batched fetch for the whole universe instead of one per symbol
+            universe_bars = MarketScanTools.fetch_universe_arrays(
+                symbols=symbols,
+                timeframe=timeframe,
+                limit=limit,
+                asset_class=asset_class,
+                use_cache=use_cache
+            )
+
+        ready = {}
         for symbol in symbols:
-            try:
-                # Auto-detect asset class if not specified
-                if asset_class is None:
-                    classification = asset_classifier.classify(symbol)
-                    detected_class = classification['type']
-                else:
-                    detected_class = asset_class
-                
-                # Fetch data internally
-                df = alpaca_manager.fetch_historical_bars(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    limit=limit,
-                    asset_class=detected_class
-                )
-                
-                if df is None or df.empty:
-                    logger.warning(f"No data returned for {symbol}")
-                    technical_results.append({
-                        "symbol": symbol,
-                        "status": "no_data",
-                        "error": "No data available"
-                    })
-                    continue
-                
-                if len(df) < 50:
-                    logger.debug(f"Insufficient data for {symbol} (need 50+ bars, got {len(df)})")
-                    technical_results.append({
-                        "symbol": symbol,
-                        "status": "insufficient_data",
-                        "bars": len(df)
-                    })
-                    continue
-
-                # Calculate indicators
-                rsi = TechnicalAnalysisTools.calculate_rsi(df, 14).iloc[-1]
-                macd_line, signal_line, _ = TechnicalAnalysisTools.calculate_macd(df)
-                sma_20 = TechnicalAnalysisTools.calculate_sma(df, 20).iloc[-1]
-                sma_50 = TechnicalAnalysisTools.calculate_sma(df, 50).iloc[-1]
-                price = df["close"].iloc[-1]
-
-                # Scoring logic
-                score = 0
-                reasons = []
-
-                # Trend and Momentum
-                if sma_20 > sma_50 and price > sma_20:
-                    score += 30
-                    reasons.append("Strong Uptrend (Price > 20SMA > 50SMA)")
-                elif sma_20 < sma_50 and price < sma_20:
-                    score += 30
-                    reasons.append("Strong Downtrend (Price < 20SMA < 50SMA)")
-
-                if (
-                    macd_line.iloc[-1] > signal_line.iloc[-1]
-                    and macd_line.iloc[-2] <= signal_line.iloc[-2]
-                ):
-                    score += 25
-                    reasons.append("Bullish MACD Crossover")
-                elif (
-                    macd_line.iloc[-1] < signal_line.iloc[-1]
-                    and macd_line.iloc[-2] >= signal_line.iloc[-2]
-                ):
-                    score += 25
-                    reasons.append("Bearish MACD Crossover")
-
-                # Overbought/Oversold
-                if rsi < 30:
-                    score += 20
-                    reasons.append("RSI Oversold (< 30)")
-                elif rsi > 70:
-                    score -= 10  # Penalize overbought
-                    reasons.append("RSI Overbought (> 70)")
-
-                technical_results.append({
+            symbol_bars = universe_bars.get(symbol)
+            if symbol_bars is None:
+                logger.warning(f"No data returned for {symbol}")
+                results[symbol] = {
                     "symbol": symbol,
-                    "technical_score": max(0, min(100, score)),  # Normalize 0-100
-                    "reason": ", ".join(reasons) if reasons else "Neutral",
-                    "indicators": {
-                        "rsi": float(rsi),
-                        "macd": float(macd_line.iloc[-1]),
-                        "sma_20": float(sma_20),
-                        "sma_50": float(sma_50),
-                        "price": float(price)
-                    },
-                    "status": "success"
-                })
-                
-                logger.debug(f"{symbol}: Score={score}, RSI={rsi:.1f}, MACD={macd_line.iloc[-1]:.2f}")
-                
+                    "status": "no_data",
+                    "error": "No data available"
+                }
+                continue
+
+            try:
+                close = np.asarray(symbol_bars["close"], dtype=float)
+                if close.ndim != 1:
+                    raise ValueError(f"expected 1-D closes, got shape {close.shape}")
             except Exception as e:
                 logger.error(f"Error analyzing technical setup for {symbol}: {e}", exc_info=True)
-                technical_results.append({
+                results[symbol] = {
                     "symbol": symbol,
                     "status": "error",
                     "error": str(e)
-                })
+                }
                 continue
-        
+
+            if len(close) < 50:
+                logger.debug(f"Insufficient data for {symbol} (need 50+ bars, got {len(close)})")
+                results[symbol] = {
+                    "symbol": symbol,
+                    "status": "insufficient_data",
+                    "bars": len(close)
+                }
+            else:
+                ready[symbol] = close
+
+        indicators: Dict[str, Dict[str, float]] = {}
+        if ready:
+            try:
+                indicators = _technical_indicators(ready)
+            except Exception as e:
+                # One bad series must not sink the universe: redo it symbol by symbol
+                logger.warning(f"Universe indicator pass failed ({e}); retrying per symbol")
+                for symbol, close in ready.items():
+                    try:
+                        indicators.update(_technical_indicators({symbol: close}))
+                    except Exception as e:
+                        logger.error(f"Error analyzing technical setup for {symbol}: {e}", exc_info=True)
+                        results[symbol] = {
+                            "symbol": symbol,
+                            "status": "error",
+                            "error": str(e)
+                        }
+
+        for symbol, values in indicators.items():
+            rsi = values["rsi"]
+            sma_20 = values["sma_20"]
+            sma_50 = values["sma_50"]
+            price = values["price"]
+
+            # Scoring logic
+            score = 0
+            reasons = []
+
+            # Trend and Momentum
+            if sma_20 > sma_50 and price > sma_20:
+                score += 30
+                reasons.append("Strong Uptrend (Price > 20SMA > 50SMA)")
+            elif sma_20 < sma_50 and price < sma_20:
+                score += 30
+                reasons.append("Strong Downtrend (Price < 20SMA < 50SMA)")
+
+            if values["macd"] > values["signal"] and values["macd_prev"] <= values["signal_prev"]:
+                score += 25
+                reasons.append("Bullish MACD Crossover")
+            elif values["macd"] < values["signal"] and values["macd_prev"] >= values["signal_prev"]:
+                score += 25
+                reasons.append("Bearish MACD Crossover")
+
+            # Overbought/Oversold
+            if rsi < 30:
+                score += 20
+                reasons.append("RSI Oversold (< 30)")
+            elif rsi > 70:
+                score -= 10  # Penalize overbought
+                reasons.append("RSI Overbought (> 70)")
+
+            results[symbol] = {
+                "symbol": symbol,
+                "technical_score": max(0, min(100, score)),  # Normalize 0-100
+                "reason": ", ".join(reasons) if reasons else "Neutral",
+                "indicators": {
+                    "rsi": rsi,
+                    "macd": values["macd"],
+                    "sma_20": sma_20,
+                    "sma_50": sma_50,
+                    "price": price
+                },
+                "status": "success"
+            }
+
+            logger.debug(f"{symbol}: Score={score}, RSI={rsi:.1f}, MACD={values['macd']:.2f}")
+
+        technical_results = [results[symbol] for symbol in symbols]
         success_count = sum(1 for r in technical_results if r.get("status") == "success")
         logger.info(f"Technical analysis complete: {success_count}/{len(symbols)} symbols successful")
         return technical_results
@@ -529,7 +699,9 @@ class MarketScanTools:
         min_volume: int = 1_000_000,
         timeframe: str = "1Day",
         limit: int = 30,
-        asset_class: Optional[str] = None
+        asset_class: Optional[str] = None,
+        use_cache: bool = False,
+        bars: Optional[Dict[str, pd.DataFrame]] = None
     ) -> List[Dict]:
         """
         Filter symbols by their average trading volume using Independent Tool Fetching pattern.
@@ -544,6 +716,9 @@ class MarketScanTools:
             timeframe: Bar timeframe for volume calculation (default: '1Day')
             limit: Number of bars to average (default: 30 for monthly average)
             asset_class: Optional asset class override
+            use_cache: Serve bars from the on-disk bars cache (tests/backtests only)
+            bars: Optional prefetched symbol-to-DataFrame bars (e.g. from fetch_universe_data);
+                  when given, no fetch is made and timeframe/limit/asset_class are ignored
 
         Returns:
             List of dicts with liquidity metrics:
@@ -564,25 +739,24 @@ class MarketScanTools:
         
         logger.info(f"Filtering liquidity for {len(symbols)} symbols (min_volume: {min_volume:,})...")
         liquidity_results = []
+
+        if bars is not None:
+            universe_bars = _frames_to_arrays(bars)
+        else:
+            # One batched fetch for the whole universe instead of one per symbol
+            universe_bars = MarketScanTools.fetch_universe_arrays(
+                symbols=symbols,
+                timeframe=timeframe,
+                limit=limit,
+                asset_class=asset_class,
+                use_cache=use_cache
+            )
         
         for symbol in symbols:
             try:
-                # Auto-detect asset class if not specified
-                if asset_class is None:
-                    classification = asset_classifier.classify(symbol)
-                    detected_class = classification['type']
-                else:
-                    detected_class = asset_class
-                
-                # Fetch data internally
-                df = alpaca_manager.fetch_historical_bars(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    limit=limit,
-                    asset_class=detected_class
-                )
+                symbol_bars = universe_bars.get(symbol)
                 
-                if df is None or df.empty:
+                if symbol_bars is None:
                     logger.warning(f"No data returned for {symbol}")
                     liquidity_results.append({
                         "symbol": symbol,
@@ -591,7 +765,7 @@ class MarketScanTools:
                     })
                     continue
                 
-                if "volume" not in df.columns:
+                if "volume" not in symbol_bars:
                     logger.warning(f"No volume data for {symbol}")
                     liquidity_results.append({
                         "symbol": symbol,
@@ -600,7 +774,7 @@ class MarketScanTools:
                     })
                     continue
                 
-                avg_volume = float(df["volume"].mean())
+                avg_volume = float(np.nanmean(symbol_bars["volume"]))
                 is_liquid = avg_volume >= min_volume
                 liquidity_score = min(100, (avg_volume / min_volume) * 100)  # Score relative to minimum
 
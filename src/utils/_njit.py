@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT decorator.
+
+numba is not a required dependency. When it is missing, ``njit`` is a no-op
+decorator and ``NUMBA_AVAILABLE`` is False, so callers can keep a vectorized
+NumPy path for that case instead of running the kernel as plain Python.
+
+With ``cache=True`` compiled kernels are written next to the source module;
+set ``NUMBA_CACHE_DIR`` before starting the scheduler when that directory is
+read-only, so the compile cost is paid once per environment.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,57 @@
+"""
+Numeric kernels for backtest performance metrics.
+
+``dd_sortino`` returns ``(max_drawdown, mean_return, std_return,
+downside_std, downside_count)`` for one backtest's completed trades. It is
+the single-pass JIT kernel when numba is installed and the NumPy version
+otherwise; both use population standard deviations, like ``np.std``.
+"""
+import math
+
+import numpy as np
+
+from src.utils._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _dd_sortino_kernel(trade_pnls, returns):
+    """One pass over the trades: running equity peak plus Welford moments."""
+    peak = 0.0
+    equity = 0.0
+    max_dd = 0.0
+    mean = 0.0
+    m2 = 0.0
+    down_mean = 0.0
+    down_m2 = 0.0
+    down_count = 0
+    for i in range(trade_pnls.shape[0]):
+        equity += trade_pnls[i]
+        peak = equity if i == 0 else max(peak, equity)
+        max_dd = min(max_dd, equity - peak)
+
+        r = returns[i]
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+        if r < 0:
+            down_count += 1
+            delta = r - down_mean
+            down_mean += delta / down_count
+            down_m2 += delta * (r - down_mean)
+
+    n = trade_pnls.shape[0]
+    std = math.sqrt(m2 / n) if n > 0 else 0.0
+    down_std = math.sqrt(down_m2 / down_count) if down_count > 0 else 0.0
+    return max_dd, mean, std, down_std, down_count
+
+
+def _dd_sortino_numpy(trade_pnls, returns):
+    """Vectorized equivalent of ``_dd_sortino_kernel``."""
+    cumulative_pnl = np.cumsum(trade_pnls)
+    max_dd = float((cumulative_pnl - np.maximum.accumulate(cumulative_pnl)).min())
+    downside = returns[returns < 0]
+    down_std = float(np.std(downside)) if len(downside) > 0 else 0.0
+    return max_dd, float(np.mean(returns)), float(np.std(returns)), down_std, len(downside)
+
+
+dd_sortino = _dd_sortino_kernel if NUMBA_AVAILABLE else _dd_sortino_numpy
@@ -62,6 +62,13 @@ class AssetClassifier:
         }
     }
     
+    # Each class's patterns joined into one pre-compiled alternation, so a lookup is a
+    # single C-level match instead of re-resolving every pattern string per call
+    _COMPILED_PATTERNS = {
+        name: re.compile("|".join(f"(?:{pattern})" for pattern in info["patterns"]))
+        for name, info in ASSET_CLASSES.items()
+    }
+    
     @classmethod
     def classify(cls, symbol: str) -> Dict[str, any]:
         """
@@ -118,8 +125,7 @@ class AssetClassifier:
     @classmethod
     def _matches_asset_class(cls, symbol: str, asset_class: str) -> bool:
         """Check if symbol matches any pattern for given asset class."""
-        patterns = cls.ASSET_CLASSES[asset_class]["patterns"]
-        return any(re.match(pattern, symbol) for pattern in patterns)
+        return cls._COMPILED_PATTERNS[asset_class].match(symbol) is not None
     
     @classmethod
     def _build_result(cls, symbol: str, asset_class: str) -> Dict[str, any]:
@@ -2,23 +2,35 @@
 Backtesting Engine V2 - Event-Driven
 """
 import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Optional
 from src.connectors.alpaca_connector import alpaca_manager
 from src.strategies.registry import get_strategy
 from src.config.settings import settings
+from src.utils._perf_kernels import dd_sortino
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+_TRADE_DTYPE = np.dtype([('price', 'f8'), ('commission', 'f8')])
+
+
+def _trades_to_soa(trades: List[Dict]):
+    """Unpack trade dicts into contiguous price and commission arrays."""
+    arr = np.fromiter(((t['price'], t['commission']) for t in trades), dtype=_TRADE_DTYPE, count=len(trades))
+    return arr['price'], arr['commission']
+
 class BacktesterV2:
     def __init__(self, start_date: str, end_date: str, risk_free_rate=0.02):
         self.start_date = start_date
         self.end_date = end_date
         self.risk_free_rate = risk_free_rate
 
-    def _get_annualization_factor(self, timeframe: str) -> int:
-        """Determines the annualization factor based on the timeframe."""
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_annualization_factor(timeframe: str) -> int:
+        """Determines the annualization factor based on the timeframe (memoized per string)."""
         timeframe_lower = timeframe.lower()
         match = re.match(r'(\d+)\s*(m|min|h|hour|d|day)', timeframe_lower)
         if not match:
@@ -97,46 +109,34 @@ class BacktesterV2:
             # Use only complete pairs for calculation
             trades = trades[:num_complete_trades * 2]
 
-        pnl = 0
-        wins = 0
-        returns = []
-        trade_pnls = []
-
-        for i in range(0, len(trades), 2):
-            buy_trade = trades[i]
-            sell_trade = trades[i+1]
-            trade_pnl = (sell_trade['price'] - buy_trade['price']) - (buy_trade['commission'] + sell_trade['commission'])
-            trade_pnls.append(trade_pnl)
-            pnl += trade_pnl
-            if trade_pnl > 0:
-                wins += 1
-            returns.append((sell_trade['price'] / buy_trade['price']) - 1)
-
-        returns = np.array(returns)
-        total_trades = len(trades) // 2
+        # Trades alternate BUY, SELL: even slots are entries, odd slots exits
+        prices, commissions = _trades_to_soa(trades)
+        buy_prices, sell_prices = prices[0::2], prices[1::2]
+        trade_pnls = (sell_prices - buy_prices) - (commissions[0::2] + commissions[1::2])
+        returns = sell_prices / buy_prices - 1
+
+        pnl = float(trade_pnls.sum())
+        wins = int(np.count_nonzero(trade_pnls > 0))
+        total_trades = len(trade_pnls)
         win_rate = (wins / total_trades) * 100 if total_trades > 0 else 0
 
+        # Max drawdown plus the return moments behind Sharpe, Sortino and Calmar
+        max_drawdown, mean_return, std_return, downside_std, downside_count = dd_sortino(trade_pnls, returns)
+
         # Sharpe Ratio
-        if np.std(returns) > 0:
-            sharpe_ratio = (np.mean(returns) * annualization_factor - self.risk_free_rate) / (np.std(returns) * np.sqrt(annualization_factor))
+        if std_return > 0:
+            sharpe_ratio = (mean_return * annualization_factor - self.risk_free_rate) / (std_return * np.sqrt(annualization_factor))
         else:
             sharpe_ratio = 0
 
         # Sortino Ratio
-        downside_returns = returns[returns < 0]
-        if len(downside_returns) > 1 and np.std(downside_returns) > 0:
-            sortino_ratio = (np.mean(returns) * annualization_factor - self.risk_free_rate) / (np.std(downside_returns) * np.sqrt(annualization_factor))
+        if downside_count > 1 and downside_std > 0:
+            sortino_ratio = (mean_return * annualization_factor - self.risk_free_rate) / (downside_std * np.sqrt(annualization_factor))
         else:
             sortino_ratio = 0
 
-        # Max Drawdown & Calmar Ratio
-        cumulative_pnl = np.cumsum(trade_pnls)
-        peak = np.maximum.accumulate(cumulative_pnl)
-        drawdown = (cumulative_pnl - peak)
-        max_drawdown = np.min(drawdown) if len(drawdown) > 0 else 0
-
         # Calmar Ratio
-        annualized_return = np.mean(returns) * annualization_factor
+        annualized_return = mean_return * annualization_factor
         if max_drawdown < 0:
             calmar_ratio = annualized_return / abs(max_drawdown)
         else:
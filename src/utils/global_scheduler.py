@@ -4,8 +4,7 @@ Enhanced with intelligent market rotation and adaptive intervals.
 """
 import time
 import logging
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 from typing import List, Optional
 from src.config.settings import settings
 from src.crew.orchestrator import trading_orchestrator
@@ -28,12 +27,32 @@ class AutoTradingScheduler:
     - Market activity monitoring
     """
     
-    def __init__(self):
-        self.market_calendar = MarketCalendar()
-        self.state_manager = StateManager()
-        self.orchestrator = trading_orchestrator
-        self.market_rotation = market_rotation_strategy
+    # Interval key per UTC hour for crypto; peak hours are 9:00-23:00 UTC (highest trading volume)
+    _CRYPTO_HOUR_KEYS = ('CRYPTO_OFFPEAK',) * 9 + ('CRYPTO_PEAK',) * 14 + ('CRYPTO_OFFPEAK',)
+    
+    def __init__(
+        self,
+        market_calendar: Optional[MarketCalendar] = None,
+        state_manager: Optional[StateManager] = None,
+        orchestrator=None,
+        market_rotation=None
+    ):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            market_calendar: Calendar to use (default: new MarketCalendar)
+            state_manager: State persistence (default: new StateManager)
+            orchestrator: Trading orchestrator (default: global trading_orchestrator)
+            market_rotation: Market rotation strategy (default: global market_rotation_strategy)
+        """
+        self.market_calendar = market_calendar or MarketCalendar()
+        self.state_manager = state_manager or StateManager()
+        self.orchestrator = orchestrator or trading_orchestrator
+        self.market_rotation = market_rotation or market_rotation_strategy
         self.state = self.state_manager.load_state()
+        # Armed here, not in run_forever, so a stop() issued before the loop starts is kept
+        self._should_run = True
         
         # Adaptive interval configuration (in minutes)
         self.intervals = {
@@ -54,6 +73,10 @@ class AutoTradingScheduler:
         except Exception as e:
             logger.error(f"Failed to execute emergency position close: {e}", exc_info=True)
 
+    def stop(self):
+        """Ask run_forever to exit after the current iteration."""
+        self._should_run = False
+
     def _calculate_next_interval(self, active_market: str, current_time: datetime) -> int:
         """
         Calculate adaptive sleep interval based on market and time.
@@ -71,20 +94,11 @@ class AutoTradingScheduler:
         Returns:
             Sleep duration in seconds
         """
-        if active_market == 'US_EQUITY':
-            interval_minutes = self.intervals['US_EQUITY']
-        elif active_market == 'CRYPTO':
-            # Peak crypto hours: 9:00-23:00 UTC (highest trading volume)
-            hour_utc = current_time.hour
-            if 9 <= hour_utc < 23:
-                interval_minutes = self.intervals['CRYPTO_PEAK']
-            else:
-                interval_minutes = self.intervals['CRYPTO_OFFPEAK']
-        elif active_market == 'FOREX':
-            interval_minutes = self.intervals['FOREX']
+        if active_market == 'CRYPTO':
+            interval_minutes = self.intervals[self._CRYPTO_HOUR_KEYS[current_time.hour]]
         else:
-            # Fallback
-            interval_minutes = settings.scan_interval_minutes
+            # US_EQUITY and FOREX are keyed by market; unknown markets use the configured default
+            interval_minutes = self.intervals.get(active_market, settings.scan_interval_minutes)
         
         logger.debug(f"Next interval for {active_market}: {interval_minutes} minutes")
         return interval_minutes * 60
@@ -120,7 +134,7 @@ class AutoTradingScheduler:
         3. Execute trading cycle with market-aware configuration
         4. Update market performance metrics
         5. Calculate adaptive sleep interval
-        6. Repeat
+        6. Repeat until stop() is called or a KeyboardInterrupt is received
         """
         logger.info("Starting AutoTradingScheduler in 24/7 mode with intelligent market rotation.")
         logger.info(f"Configured intervals: US_EQUITY={self.intervals['US_EQUITY']}min, "
@@ -128,8 +142,8 @@ class AutoTradingScheduler:
                    f"CRYPTO_OFFPEAK={self.intervals['CRYPTO_OFFPEAK']}min, "
                    f"FOREX={self.intervals['FOREX']}min")
 
-        while True:
-            current_time_utc = datetime.now(pytz.utc)
+        while self._should_run:
+            current_time_utc = datetime.now(timezone.utc)
             
             try:
                 # Step 1: Intelligent market selection
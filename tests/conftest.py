@@ -0,0 +1,14 @@
+"""
+Suite-wide pytest configuration.
+"""
+
+
+def pytest_configure(config):
+    # pytest-xdist registers xdist_group itself; registering it here too keeps runs
+    # without the plugin free of unknown-mark warnings
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests with the same name on one xdist worker"
+    )
+    config.addinivalue_line(
+        "markers", "asset_classifier: pure AssetClassifier checks"
+    )
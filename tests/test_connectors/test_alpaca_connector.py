@@ -42,6 +42,94 @@ class TestAlpacaConnector(unittest.TestCase):
                 request_params = called_args[0]
                 self.assertEqual(request_params.timeframe.amount, expected_timeframe.amount)
                 self.assertEqual(request_params.timeframe.unit, expected_timeframe.unit)
+    @patch('src.connectors.alpaca_connector.CryptoHistoricalDataClient')
+    def test_fetch_historical_bars_batch_single_request(self, MockCryptoClient):
+        """
+        Verify that a batch fetch issues one request and splits the result per symbol.
+        """
+        # Arrange
+        timestamps = pd.to_datetime(['2025-01-01', '2025-01-02'])
+        index = pd.MultiIndex.from_product(
+            [['BTC/USD', 'ETH/USD'], timestamps], names=['symbol', 'timestamp']
+        )
+        mock_instance = MockCryptoClient.return_value
+        mock_instance.get_crypto_bars.return_value = MagicMock(df=pd.DataFrame({
+            'open': [1.0, 2.0, 3.0, 4.0], 'high': [1.5, 2.5, 3.5, 4.5],
+            'low': [0.5, 1.5, 2.5, 3.5], 'close': [1.2, 2.2, 3.2, 4.2],
+            'volume': [10, 20, 30, 40]
+        }, index=index))
+
+        manager = AlpacaConnectionManager()
+        manager._crypto_client = mock_instance
+
+        # Act (ETHUSD exercises normalization; results keep the caller's spelling)
+        data = manager.fetch_historical_bars_batch(
+            ['BTC/USD', 'ETHUSD', 'SOL/USD'], timeframe='1Day', limit=2, asset_class='CRYPTO'
+        )
+
+        # Assert
+        mock_instance.get_crypto_bars.assert_called_once()
+        request_params = mock_instance.get_crypto_bars.call_args[0][0]
+        self.assertEqual(request_params.symbol_or_symbols, ['BTC/USD', 'ETH/USD', 'SOL/USD'])
+        self.assertEqual(set(data), {'BTC/USD', 'ETHUSD'})
+        self.assertListEqual(list(data['ETHUSD']['close']), [3.2, 4.2])
+        self.assertTrue(data['BTC/USD'].index.equals(pd.DatetimeIndex(timestamps, name='timestamp')))
+
+    @patch('src.connectors.alpaca_connector.CryptoHistoricalDataClient')
+    def test_fetch_historical_bars_batch_duplicate_spellings(self, MockCryptoClient):
+        """
+        Verify that two spellings of one pair request it once and both get its bars.
+        """
+        # Arrange
+        index = pd.MultiIndex.from_product(
+            [['BTC/USD'], pd.to_datetime(['2025-01-01'])], names=['symbol', 'timestamp']
+        )
+        mock_instance = MockCryptoClient.return_value
+        mock_instance.get_crypto_bars.return_value = MagicMock(df=pd.DataFrame({
+            'open': [1.0], 'high': [1.5], 'low': [0.5], 'close': [1.2], 'volume': [10]
+        }, index=index))
+
+        manager = AlpacaConnectionManager()
+        manager._crypto_client = mock_instance
+
+        # Act
+        data = manager.fetch_historical_bars_batch(
+            ['BTCUSD', 'BTC/USD'], timeframe='1Day', limit=1, asset_class='CRYPTO'
+        )
+
+        # Assert
+        request_params = mock_instance.get_crypto_bars.call_args[0][0]
+        self.assertEqual(request_params.symbol_or_symbols, ['BTC/USD'])
+        self.assertEqual(set(data), {'BTCUSD', 'BTC/USD'})
+        self.assertListEqual(list(data['BTCUSD']['close']), [1.2])
+
+    @patch('src.connectors.alpaca_connector.StockHistoricalDataClient')
+    def test_fetch_historical_bars_batch_bad_symbol_retried_individually(self, MockDataClient):
+        """
+        Verify that one rejected symbol only drops that symbol, not the whole batch.
+        """
+        # Arrange: Alpaca rejects any request that contains the delisted symbol
+        def get_stock_bars(request_params):
+            if 'DELISTED' in request_params.symbol_or_symbols:
+                raise ValueError("invalid symbol: DELISTED")
+            return MagicMock(df=pd.DataFrame({
+                'open': [100], 'high': [101], 'low': [99], 'close': [100.5], 'volume': [1000]
+            }, index=pd.to_datetime(['2025-01-02'])))
+
+        mock_instance = MockDataClient.return_value
+        mock_instance.get_stock_bars.side_effect = get_stock_bars
+
+        manager = AlpacaConnectionManager()
+        manager._data_client = mock_instance
+
+        # Act
+        data = manager.fetch_historical_bars_batch(
+            ['AAPL', 'DELISTED', 'MSFT'], timeframe='1Day', limit=1, asset_class='US_EQUITY'
+        )
+
+        # Assert: one failed batch request, then one request per symbol
+        self.assertEqual(set(data), {'AAPL', 'MSFT'})
+        self.assertEqual(mock_instance.get_stock_bars.call_count, 4)
 
 if __name__ == '__main__':
     unittest.main()
@@ -10,6 +10,7 @@ Tests cover:
 
 import unittest
 from unittest.mock import patch, MagicMock
+import threading
 import time
 from src.connectors.gemini_connector_enhanced import (
     EnhancedGeminiConnectionManager,
@@ -32,6 +33,49 @@ class TestEnhancedGeminiConnectionManager(unittest.TestCase):
         self.assertEqual(len(manager.api_keys), 2)
         self.assertIsInstance(manager.quota_tracker, ModelQuotaTracker)
         
+    def test_model_discovery_deferred_until_first_use(self):
+        """Test that constructing the manager makes no model query; first access makes one."""
+        with patch('src.connectors.gemini_connector_enhanced.DynamicModelManager') as mock_manager_cls:
+            mock_manager_cls.return_value.get_preferred_models.return_value = (
+                ["gemini-2.5-flash"], ["gemini-2.5-pro"]
+            )
+            manager = EnhancedGeminiConnectionManager(api_keys=["key1"])
+            
+            mock_manager_cls.return_value.get_preferred_models.assert_not_called()
+            
+            self.assertEqual(manager.flash_models, ["gemini-2.5-flash"])
+            self.assertEqual(manager.pro_models, ["gemini-2.5-pro"])
+            mock_manager_cls.return_value.get_preferred_models.assert_called_once()
+        
+    def test_concurrent_first_use_discovers_once(self):
+        """Test that threads racing on first access share a single model query."""
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_discovery():
+            started.set()
+            release.wait(5)
+            return ["gemini-2.5-flash"], ["gemini-2.5-pro"]
+        
+        with patch('src.connectors.gemini_connector_enhanced.DynamicModelManager') as mock_manager_cls:
+            mock_manager_cls.return_value.get_preferred_models.side_effect = slow_discovery
+            manager = EnhancedGeminiConnectionManager(api_keys=["key1"])
+            
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(manager.flash_models))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            started.wait(5)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+            
+            mock_manager_cls.return_value.get_preferred_models.assert_called_once()
+            self.assertEqual(results, [["gemini-2.5-flash"]] * 4)
+        
     def test_mask_api_key(self):
         """Test API key masking for security."""
         result = EnhancedGeminiConnectionManager.mask_api_key("ABCDEFGHIJK")
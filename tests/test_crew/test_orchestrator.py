@@ -5,75 +5,103 @@ This module tests the trading orchestrator's workflow including market scanning,
 crew distribution, parallel execution, and result aggregation.
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
-from concurrent.futures import Future
-from src.crew.orchestrator import TradingOrchestrator, trading_orchestrator
+from unittest.mock import DEFAULT, Mock, patch, call
 
+import pytest
 
-class TestOrchestratorInit(unittest.TestCase):
+from src.crew.orchestrator import TopAsset, TradingOrchestrator, trading_orchestrator
+
+# Mock convention: plain Mock() by default, and spec_set=[...] listing only the
+# attributes the code under test uses where a typo must fail. Avoid autospec=True
+# here; it introspects the whole class on every patch and dominates setup time.
+
+# Keep the module on one xdist worker so its module-scoped orchestrators are built once
+pytestmark = pytest.mark.xdist_group("orchestrator")
+
+
+@pytest.fixture(scope="module")
+def bare_orch():
+    # The parsing and logging methods are pure; bypass __init__ so no scanner or executor is wired up
+    return TradingOrchestrator.__new__(TradingOrchestrator)
+
+
+@pytest.fixture(scope="module")
+def orch():
+    return TradingOrchestrator()
+
+
+@pytest.fixture(scope="module")
+def paced_orch():
+    # Records the stagger delays instead of sleeping
+    return TradingOrchestrator(sleep_fn=Mock())
+
+
+class TestOrchestratorInit:
     """Test orchestrator initialization."""
     
     def test_initialization(self):
         """Test orchestrator initializes with correct attributes."""
         orch = TradingOrchestrator()
-        self.assertIsNotNone(orch.market_scanner)
-        self.assertEqual(orch.active_crews, {})
-        self.assertIsNotNone(orch.executor)
-        self.assertIsNone(orch.global_rate_limiter)
+        assert orch.market_scanner is not None
+        assert orch.active_crews == {}
+        assert orch.executor is not None
+        assert orch.global_rate_limiter is None
+    
+    def test_executor_created_lazily(self):
+        """Test the thread pool is only created on first access and then reused."""
+        orch = TradingOrchestrator()
+        assert orch._executor is None
+        executor = orch.executor
+        assert orch.executor is executor
     
     def test_singleton_instance(self):
         """Test global singleton instance exists."""
-        self.assertIsInstance(trading_orchestrator, TradingOrchestrator)
+        assert isinstance(trading_orchestrator, TradingOrchestrator)
 
 
-class TestRunTradingCrew(unittest.TestCase):
+class TestRunTradingCrew:
     """Test single trading crew execution."""
     
-    def setUp(self):
-        self.orch = TradingOrchestrator()
+    @pytest.fixture
+    def mock_crew(self):
+        # Every test runs against the same patched TradingCrew; tests only script run().
+        # spec_set limits the double to run, so a misspelt call fails instead of passing.
+        with patch('src.crew.orchestrator.TradingCrew') as mock_trading_crew_class:
+            mock_trading_crew_class.return_value = Mock(spec_set=["run"])
+            yield mock_trading_crew_class.return_value
     
-    @patch('src.crew.orchestrator.TradingCrew')
-    def test_run_trading_crew_success(self, mock_trading_crew_class):
+    def test_run_trading_crew_success(self, orch, mock_crew):
         """Test successful trading crew execution."""
-        mock_crew = Mock()
         mock_crew.run.return_value = {
             "success": True,
             "symbol": "SPY",
             "strategy": "3ma",
             "result": "Trade executed"
         }
-        mock_trading_crew_class.return_value = mock_crew
         
-        result = self.orch._run_trading_crew("SPY", "3ma")
+        result = orch._run_trading_crew("SPY", "3ma")
         
-        self.assertTrue(result["success"])
-        self.assertEqual(result["symbol"], "SPY")
-        self.assertEqual(result["strategy"], "3ma")
+        assert result["success"]
+        assert result["symbol"] == "SPY"
+        assert result["strategy"] == "3ma"
         mock_crew.run.assert_called_once_with(symbol="SPY", strategy="3ma")
     
-    @patch('src.crew.orchestrator.TradingCrew')
-    def test_run_trading_crew_failure(self, mock_trading_crew_class):
+    def test_run_trading_crew_failure(self, orch, mock_crew):
         """Test trading crew execution handles errors gracefully."""
-        mock_crew = Mock()
         mock_crew.run.side_effect = Exception("API connection failed")
-        mock_trading_crew_class.return_value = mock_crew
         
-        result = self.orch._run_trading_crew("AAPL", "rsi_breakout")
+        result = orch._run_trading_crew("AAPL", "rsi_breakout")
         
-        self.assertFalse(result["success"])
-        self.assertEqual(result["symbol"], "AAPL")
-        self.assertEqual(result["strategy"], "rsi_breakout")
-        self.assertIn("API connection failed", result["error"])
+        assert not result["success"]
+        assert result["symbol"] == "AAPL"
+        assert result["strategy"] == "rsi_breakout"
+        assert "API connection failed" in result["error"]
 
 
-class TestParseScanResults(unittest.TestCase):
+class TestParseScanResults:
     """Test market scanner result parsing."""
     
-    def setUp(self):
-        self.orch = TradingOrchestrator()
-    
-    def test_parse_valid_results(self):
+    def test_parse_valid_results(self, bare_orch):
         """Test parsing valid scanner results."""
         scan_results = {
             "top_assets": [
@@ -94,72 +122,82 @@ class TestParseScanResults(unittest.TestCase):
             ]
         }
         
-        assets = self.orch._parse_scan_results(scan_results)
+        assets = bare_orch._parse_scan_results(scan_results)
+        
+        assert len(assets) == 2
+        assert isinstance(assets[0], TopAsset)
+        assert assets[0].symbol == "SPY"
+        assert assets[0].priority == 5
+        assert assets[0].recommended_strategies == ["3ma", "rsi_breakout"]
+        assert assets[1].symbol == "QQQ"
+    
+    def test_parse_applies_defaults_and_skips_assets_without_symbol(self, bare_orch):
+        """Test missing optional fields get defaults and symbol-less entries are dropped."""
+        scan_results = {"top_assets": [{"symbol": "SPY"}, {"priority": 3}]}
+        
+        assets = bare_orch._parse_scan_results(scan_results)
         
-        self.assertEqual(len(assets), 2)
-        self.assertEqual(assets[0]["symbol"], "SPY")
-        self.assertEqual(assets[0]["priority"], 5)
-        self.assertEqual(assets[1]["symbol"], "QQQ")
+        assert assets == [TopAsset(symbol="SPY")]
+        assert assets[0].recommended_strategies == ["3ma"]
     
-    def test_parse_empty_results(self):
+    def test_parse_empty_results(self, bare_orch):
         """Test parsing empty scanner results."""
         scan_results = {"top_assets": []}
         
-        assets = self.orch._parse_scan_results(scan_results)
+        assets = bare_orch._parse_scan_results(scan_results)
         
-        self.assertEqual(assets, [])
+        assert assets == []
     
-    def test_parse_missing_top_assets(self):
+    def test_parse_missing_top_assets(self, bare_orch):
         """Test parsing results without top_assets key."""
         scan_results = {"other_data": "value"}
         
-        assets = self.orch._parse_scan_results(scan_results)
+        assets = bare_orch._parse_scan_results(scan_results)
         
-        self.assertEqual(assets, [])
+        assert assets == []
     
-    def test_parse_malformed_results(self):
+    def test_parse_malformed_results(self, bare_orch):
         """Test parsing malformed scanner results returns empty list."""
         scan_results = None
         
-        assets = self.orch._parse_scan_results(scan_results)
+        assets = bare_orch._parse_scan_results(scan_results)
         
-        self.assertEqual(assets, [])
+        assert assets == []
 
 
-class TestLogCycleSummary(unittest.TestCase):
+class TestLogCycleSummary:
     """Test cycle summary logging."""
     
-    def setUp(self):
-        self.orch = TradingOrchestrator()
+    @pytest.fixture
+    def mock_logger(self):
+        with patch('src.crew.orchestrator.logger') as mock_logger:
+            yield mock_logger
     
-    @patch('src.crew.orchestrator.logger')
-    def test_log_all_successes(self, mock_logger):
+    def test_log_all_successes(self, bare_orch, mock_logger):
         """Test logging with all successful crew executions."""
         results = [
             {"success": True, "symbol": "SPY", "strategy": "3ma", "result": "BUY executed"},
             {"success": True, "symbol": "QQQ", "strategy": "macd", "result": "HOLD"}
         ]
         
-        self.orch.log_cycle_summary(results)
+        bare_orch.log_cycle_summary(results)
         
         # Verify summary log
         mock_logger.info.assert_any_call("Cycle complete: 2 succeeded, 0 failed out of 2 total")
     
-    @patch('src.crew.orchestrator.logger')
-    def test_log_all_failures(self, mock_logger):
+    def test_log_all_failures(self, bare_orch, mock_logger):
         """Test logging with all failed crew executions."""
         results = [
             {"success": False, "symbol": "AAPL", "strategy": "rsi_breakout", "error": "API error"},
             {"success": False, "symbol": "MSFT", "strategy": "bollinger", "error": "Rate limit"}
         ]
         
-        self.orch.log_cycle_summary(results)
+        bare_orch.log_cycle_summary(results)
         
         # Verify summary log
         mock_logger.info.assert_any_call("Cycle complete: 0 succeeded, 2 failed out of 2 total")
     
-    @patch('src.crew.orchestrator.logger')
-    def test_log_mixed_results(self, mock_logger):
+    def test_log_mixed_results(self, bare_orch, mock_logger):
         """Test logging with mixed success/failure results."""
         results = [
             {"success": True, "symbol": "SPY", "strategy": "3ma", "result": "BUY"},
@@ -167,36 +205,50 @@ class TestLogCycleSummary(unittest.TestCase):
             {"success": True, "symbol": "IWM", "strategy": "rsi_breakout", "result": "SELL"}
         ]
         
-        self.orch.log_cycle_summary(results)
+        bare_orch.log_cycle_summary(results)
         
         # Verify summary log
         mock_logger.info.assert_any_call("Cycle complete: 2 succeeded, 1 failed out of 3 total")
     
-    @patch('src.crew.orchestrator.logger')
-    def test_log_empty_results(self, mock_logger):
+    def test_log_empty_results(self, bare_orch, mock_logger):
         """Test logging with no results."""
         results = []
         
-        self.orch.log_cycle_summary(results)
+        bare_orch.log_cycle_summary(results)
         
         # Verify summary log
         mock_logger.info.assert_any_call("Cycle complete: 0 succeeded, 0 failed out of 0 total")
 
 
-class TestRunCycle(unittest.TestCase):
+class TestRunCycle:
     """Test complete trading cycle execution."""
     
-    def setUp(self):
-        self.orch = TradingOrchestrator()
+    @pytest.fixture
+    def orch(self, paced_orch):
+        # The orchestrator is shared; give each test its own scanner double
+        paced_orch.market_scanner = Mock()
+        paced_orch._sleep.reset_mock()
+        return paced_orch
     
-    @patch('src.crew.orchestrator.TradingOrchestrator.log_cycle_summary')
-    @patch('src.crew.orchestrator.TradingOrchestrator._run_trading_crew')
-    @patch('src.crew.orchestrator.time.sleep')
-    def test_run_cycle_with_top_assets(self, mock_sleep, mock_run_crew, mock_log_summary):
+    @pytest.fixture
+    def cycle_patches(self):
+        # One patch.multiple covers both collaborators instead of one patcher per method
+        with patch.multiple(
+            TradingOrchestrator, _run_trading_crew=DEFAULT, log_cycle_summary=DEFAULT
+        ) as patches:
+            yield patches
+    
+    @pytest.fixture
+    def mock_run_crew(self, cycle_patches):
+        return cycle_patches["_run_trading_crew"]
+    
+    @pytest.fixture
+    def mock_log_summary(self, cycle_patches):
+        return cycle_patches["log_cycle_summary"]
+    
+    def test_run_cycle_with_top_assets(self, orch, mock_run_crew, mock_log_summary):
         """Test complete cycle with market scanner returning top assets."""
-        # Mock market scanner results
-        self.orch.market_scanner = Mock()
-        self.orch.market_scanner.run.return_value = {
+        orch.market_scanner.run.return_value = {
             "top_assets": [
                 {
                     "symbol": "SPY",
@@ -214,40 +266,34 @@ class TestRunCycle(unittest.TestCase):
         # Mock trading crew results
         mock_run_crew.return_value = {"success": True, "symbol": "SPY", "strategy": "3ma", "result": "BUY"}
         
-        self.orch.run_cycle()
+        orch.run_cycle()
         
         # Verify market scanner was called
-        self.orch.market_scanner.run.assert_called_once()
+        orch.market_scanner.run.assert_called_once()
         
         # Verify trading crews were submitted (3 total: SPY-3ma, SPY-rsi, QQQ-macd)
-        self.assertEqual(mock_run_crew.call_count, 3)
+        assert mock_run_crew.call_count == 3
         
         # Verify summary was logged
         mock_log_summary.assert_called_once()
     
-    @patch('src.crew.orchestrator.TradingOrchestrator.log_cycle_summary')
-    def test_run_cycle_with_no_assets(self, mock_log_summary):
+    def test_run_cycle_with_no_assets(self, orch, mock_log_summary):
         """Test cycle exits gracefully when scanner returns no assets."""
         # Mock market scanner with no results
-        self.orch.market_scanner = Mock()
-        self.orch.market_scanner.run.return_value = {"top_assets": []}
+        orch.market_scanner.run.return_value = {"top_assets": []}
         
-        self.orch.run_cycle()
+        orch.run_cycle()
         
         # Verify market scanner was called
-        self.orch.market_scanner.run.assert_called_once()
+        orch.market_scanner.run.assert_called_once()
         
         # Verify summary was NOT called (early exit)
         mock_log_summary.assert_not_called()
     
-    @patch('src.crew.orchestrator.TradingOrchestrator.log_cycle_summary')
-    @patch('src.crew.orchestrator.TradingOrchestrator._run_trading_crew')
-    @patch('src.crew.orchestrator.time.sleep')
-    def test_run_cycle_limits_to_top_3_assets(self, mock_sleep, mock_run_crew, mock_log_summary):
+    def test_run_cycle_limits_to_top_3_assets(self, orch, mock_run_crew, mock_log_summary):
         """Test cycle only processes top 3 assets even if more are available."""
         # Mock market scanner with 5 assets
-        self.orch.market_scanner = Mock()
-        self.orch.market_scanner.run.return_value = {
+        orch.market_scanner.run.return_value = {
             "top_assets": [
                 {"symbol": "SPY", "priority": 5, "recommended_strategies": ["3ma"]},
                 {"symbol": "QQQ", "priority": 4, "recommended_strategies": ["macd"]},
@@ -259,27 +305,19 @@ class TestRunCycle(unittest.TestCase):
         
         mock_run_crew.return_value = {"success": True}
         
-        self.orch.run_cycle()
+        orch.run_cycle()
         
         # Verify only 3 crews were submitted (top 3 assets)
-        self.assertEqual(mock_run_crew.call_count, 3)
-        
-        # Verify the top 3 symbols were used
-        call_symbols = [call.kwargs["symbol"] for call in mock_run_crew.call_args_list]
-        self.assertIn("SPY", call_symbols)
-        self.assertIn("QQQ", call_symbols)
-        self.assertIn("IWM", call_symbols)
-        self.assertNotIn("DIA", call_symbols)
-        self.assertNotIn("EFA", call_symbols)
+        assert mock_run_crew.call_count == 3
+        
+        # Verify exactly the top 3 symbols were used (crews run in worker threads, so ignore order)
+        call_symbols = [c.kwargs["symbol"] for c in mock_run_crew.call_args_list]
+        assert sorted(call_symbols) == sorted(["SPY", "QQQ", "IWM"])
     
-    @patch('src.crew.orchestrator.TradingOrchestrator.log_cycle_summary')
-    @patch('src.crew.orchestrator.TradingOrchestrator._run_trading_crew')
-    @patch('src.crew.orchestrator.time.sleep')
-    def test_run_cycle_staggered_submission(self, mock_sleep, mock_run_crew, mock_log_summary):
+    def test_run_cycle_staggered_submission(self, orch, mock_run_crew, mock_log_summary):
         """Test cycle staggers crew submissions with delays."""
         # Mock market scanner with 2 assets, each with 1 strategy (2 crews total)
-        self.orch.market_scanner = Mock()
-        self.orch.market_scanner.run.return_value = {
+        orch.market_scanner.run.return_value = {
             "top_assets": [
                 {"symbol": "SPY", "priority": 5, "recommended_strategies": ["3ma"]},
                 {"symbol": "QQQ", "priority": 4, "recommended_strategies": ["macd"]}
@@ -288,20 +326,15 @@ class TestRunCycle(unittest.TestCase):
         
         mock_run_crew.return_value = {"success": True}
         
-        self.orch.run_cycle()
+        orch.run_cycle()
         
         # Verify sleep was called between submissions (2 crews = 1 sleep call)
-        self.assertEqual(mock_sleep.call_count, 1)
-        mock_sleep.assert_called_with(2)
+        assert orch._sleep.call_args_list == [call(2)]
     
-    @patch('src.crew.orchestrator.TradingOrchestrator.log_cycle_summary')
-    @patch('src.crew.orchestrator.TradingOrchestrator._run_trading_crew')
-    @patch('src.crew.orchestrator.time.sleep')
-    def test_run_cycle_with_multiple_strategies_per_asset(self, mock_sleep, mock_run_crew, mock_log_summary):
+    def test_run_cycle_with_multiple_strategies_per_asset(self, orch, mock_run_crew, mock_log_summary):
         """Test cycle handles assets with multiple recommended strategies."""
         # Mock market scanner with 1 asset having 3 strategies
-        self.orch.market_scanner = Mock()
-        self.orch.market_scanner.run.return_value = {
+        orch.market_scanner.run.return_value = {
             "top_assets": [
                 {
                     "symbol": "SPY",
@@ -313,17 +346,12 @@ class TestRunCycle(unittest.TestCase):
         
         mock_run_crew.return_value = {"success": True}
         
-        self.orch.run_cycle()
+        orch.run_cycle()
         
         # Verify 3 crews were submitted (1 asset x 3 strategies)
-        self.assertEqual(mock_run_crew.call_count, 3)
+        assert mock_run_crew.call_count == 3
         
-        # Verify all strategies were used
-        call_strategies = [call.kwargs["strategy"] for call in mock_run_crew.call_args_list]
-        self.assertIn("3ma", call_strategies)
-        self.assertIn("rsi_breakout", call_strategies)
-        self.assertIn("macd", call_strategies)
-
+        # Verify all strategies were used (crews run in worker threads, so ignore order)
+        call_strategies = [c.kwargs["strategy"] for c in mock_run_crew.call_args_list]
+        assert sorted(call_strategies) == sorted(["3ma", "rsi_breakout", "macd"])
 
-if __name__ == "__main__":
-    unittest.main()
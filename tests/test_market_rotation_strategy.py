@@ -3,36 +3,62 @@ Tests for Market Rotation Strategy
 Validates intelligent market selection based on time and performance.
 """
 
+import shutil
 import unittest
-from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
-import pytz
+from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import tempfile
 import json
 
 from src.crew.market_rotation_strategy import MarketRotationStrategy
 
+UTC = timezone.utc
+
+# Fixed timestamp shared by every synthetic trade (avoids a clock read per dict)
+_FIXED_TS = datetime(2025, 11, 3, 12, 0, 0, tzinfo=UTC).isoformat()
+
+# Trade templates; copy before mutating
+_TRADE_WIN = {
+    'success': True,
+    'profit': 100.0,
+    'symbol': 'AAPL',
+    'strategy': '3ma',
+    'timestamp': _FIXED_TS
+}
+_TRADE_LOSS = {
+    'success': False,
+    'profit': -50.0,
+    'symbol': 'AAPL',
+    'strategy': '3ma',
+    'timestamp': _FIXED_TS
+}
+
+
+class _InMemoryStateManager:
+    """StateManager stand-in that keeps state in memory instead of JSON on disk."""
+    
+    def __init__(self):
+        self.state = {}
+    
+    def load_state(self):
+        return self.state
+    
+    def save_state(self, state):
+        self.state = state
+
 
 class TestMarketRotationStrategy(unittest.TestCase):
     """Test suite for market rotation strategy."""
     
     def setUp(self):
-        """Set up test fixtures with temporary state file."""
-        # Create temporary state file for each test
-        self.temp_dir = tempfile.mkdtemp()
-        self.state_file = Path(self.temp_dir) / "test_rotation_state.json"
-        self.strategy = MarketRotationStrategy(state_file=self.state_file)
-    
-    def tearDown(self):
-        """Clean up temporary files."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Set up test fixtures with in-memory state."""
+        self.strategy = MarketRotationStrategy(state_manager=_InMemoryStateManager(), autoflush=False)
     
     def test_1_us_market_hours_priority(self):
         """Test that US_EQUITY is prioritized during market hours."""
         # Mock time during US market hours (11:00 AM ET = 3:00 PM UTC)
-        us_market_time = datetime(2025, 11, 3, 15, 0, 0, tzinfo=pytz.utc)  # Monday 11:00 AM ET
+        us_market_time = datetime(2025, 11, 3, 15, 0, 0, tzinfo=UTC)  # Monday 11:00 AM ET
         
         with patch('src.utils.market_calendar.MarketCalendar.get_active_markets') as mock_active:
             # Both markets active, but US should be prioritized
@@ -48,7 +74,7 @@ class TestMarketRotationStrategy(unittest.TestCase):
     def test_2_crypto_when_us_closed(self):
         """Test that CRYPTO is selected when US market is closed."""
         # Mock time after US market close (8:00 PM ET = 1:00 AM UTC)
-        us_closed_time = datetime(2025, 11, 4, 1, 0, 0, tzinfo=pytz.utc)  # Tuesday 8:00 PM ET (previous day)
+        us_closed_time = datetime(2025, 11, 4, 1, 0, 0, tzinfo=UTC)  # Tuesday 8:00 PM ET (previous day)
         
         with patch('src.utils.market_calendar.MarketCalendar.get_active_markets') as mock_active:
             # Only crypto active (24/7)
@@ -69,7 +95,7 @@ class TestMarketRotationStrategy(unittest.TestCase):
             'profit': 150.0,
             'symbol': 'AAPL',
             'strategy': '3ma',
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': _FIXED_TS
         }
         
         trade_2 = {
@@ -77,7 +103,7 @@ class TestMarketRotationStrategy(unittest.TestCase):
             'profit': -50.0,
             'symbol': 'MSFT',
             'strategy': 'rsi_breakout',
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': _FIXED_TS
         }
         
         trade_3 = {
@@ -85,7 +111,7 @@ class TestMarketRotationStrategy(unittest.TestCase):
             'profit': 200.0,
             'symbol': 'GOOGL',
             'strategy': 'macd',
-            'timestamp': datetime.now(pytz.utc).isoformat()
+            'timestamp': _FIXED_TS
         }
         
         # Update performance
@@ -105,16 +131,11 @@ class TestMarketRotationStrategy(unittest.TestCase):
     
     def test_4_performance_score_calculation(self):
         """Test that market score calculation is correct."""
-        # Add trades to CRYPTO
-        for i in range(10):
-            trade = {
-                'success': True if i < 8 else False,  # 80% win rate
-                'profit': 100.0 if i < 8 else -50.0,
-                'symbol': f'BTC-USD',
-                'strategy': '3ma',
-                'timestamp': datetime.now(pytz.utc).isoformat()
-            }
-            self.strategy.update_market_performance('CRYPTO', trade)
+        # Add trades to CRYPTO (80% win rate)
+        wins = [{**_TRADE_WIN, 'symbol': 'BTC-USD'} for _ in range(8)]
+        losses = [{**_TRADE_LOSS, 'symbol': 'BTC-USD'} for _ in range(2)]
+        trades = wins + losses
+        self.strategy.bulk_update_market_performance('CRYPTO', trades)
         
         # Calculate score
         score = self.strategy._calculate_market_score('CRYPTO')
@@ -123,16 +144,11 @@ class TestMarketRotationStrategy(unittest.TestCase):
         self.assertGreater(score, 0, "Score should be positive")
         self.assertGreater(score, 100, "Score should be > 100 with good performance")
         
-        # Add trades to US_EQUITY with worse performance
-        for i in range(10):
-            trade = {
-                'success': True if i < 5 else False,  # 50% win rate
-                'profit': 50.0 if i < 5 else -50.0,
-                'symbol': f'AAPL',
-                'strategy': '3ma',
-                'timestamp': datetime.now(pytz.utc).isoformat()
-            }
-            self.strategy.update_market_performance('US_EQUITY', trade)
+        # Add trades to US_EQUITY with worse performance (50% win rate)
+        wins = [{**_TRADE_WIN, 'profit': 50.0} for _ in range(5)]
+        losses = [_TRADE_LOSS.copy() for _ in range(5)]
+        trades = wins + losses
+        self.strategy.bulk_update_market_performance('US_EQUITY', trades)
         
         equity_score = self.strategy._calculate_market_score('US_EQUITY')
         
@@ -141,27 +157,13 @@ class TestMarketRotationStrategy(unittest.TestCase):
     
     def test_5_performance_based_override(self):
         """Test that performance can override time-based selection."""
-        # Add excellent CRYPTO performance
-        for i in range(10):
-            trade = {
-                'success': True,  # 100% win rate
-                'profit': 200.0,
-                'symbol': 'BTC-USD',
-                'strategy': '3ma',
-                'timestamp': datetime.now(pytz.utc).isoformat()
-            }
-            self.strategy.update_market_performance('CRYPTO', trade)
-        
-        # Add poor US_EQUITY performance
-        for i in range(10):
-            trade = {
-                'success': False,  # 0% win rate
-                'profit': -100.0,
-                'symbol': 'AAPL',
-                'strategy': '3ma',
-                'timestamp': datetime.now(pytz.utc).isoformat()
-            }
-            self.strategy.update_market_performance('US_EQUITY', trade)
+        # Add excellent CRYPTO performance (100% win rate)
+        crypto_trades = [{**_TRADE_WIN, 'profit': 200.0, 'symbol': 'BTC-USD'} for _ in range(10)]
+        self.strategy.bulk_update_market_performance('CRYPTO', crypto_trades)
+        
+        # Add poor US_EQUITY performance (0% win rate)
+        equity_trades = [{**_TRADE_LOSS, 'profit': -100.0} for _ in range(10)]
+        self.strategy.bulk_update_market_performance('US_EQUITY', equity_trades)
         
         with patch('src.utils.market_calendar.MarketCalendar.get_active_markets') as mock_active:
             # Both markets active
@@ -205,18 +207,18 @@ class TestMarketRotationStrategy(unittest.TestCase):
     
     def test_7_state_persistence(self):
         """Test that state is saved and loaded correctly."""
+        # Persistence needs the real JSON-backed state manager and a file on disk
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        state_file = Path(temp_dir) / "test_rotation_state.json"
+        strategy = MarketRotationStrategy(state_file=state_file)
+        
         # Add performance data
-        trade = {
-            'success': True,
-            'profit': 100.0,
-            'symbol': 'AAPL',
-            'strategy': '3ma',
-            'timestamp': datetime.now(pytz.utc).isoformat()
-        }
-        self.strategy.update_market_performance('US_EQUITY', trade)
+        trade = _TRADE_WIN.copy()
+        strategy.update_market_performance('US_EQUITY', trade)
         
         # Create new strategy instance (should load state)
-        new_strategy = MarketRotationStrategy(state_file=self.state_file)
+        new_strategy = MarketRotationStrategy(state_file=state_file)
         
         # Check that state was loaded
         stats = new_strategy.get_market_statistics()
@@ -226,13 +228,8 @@ class TestMarketRotationStrategy(unittest.TestCase):
     def test_8_reset_performance(self):
         """Test that performance can be reset."""
         # Add performance data
-        trade = {
-            'success': True,
-            'profit': 100.0,
-            'symbol': 'BTC-USD',
-            'strategy': '3ma',
-            'timestamp': datetime.now(pytz.utc).isoformat()
-        }
+        trade = _TRADE_WIN.copy()
+        trade['symbol'] = 'BTC-USD'
         self.strategy.update_market_performance('CRYPTO', trade)
         
         # Verify data exists
@@ -259,6 +256,82 @@ class TestMarketRotationStrategy(unittest.TestCase):
         self.assertEqual(stats['markets']['US_EQUITY']['trades'], 0, "All markets should be reset")
         self.assertEqual(stats['rotation_count'], 0, "Rotation count should be reset")
 
+    def test_9_bulk_update_saves_once(self):
+        """Test that bulk updates match per-trade updates but persist once."""
+        trades = [
+            {'success': i % 2 == 0, 'profit': 10.0 * (i + 1), 'symbol': 'AAPL', 'strategy': '3ma'}
+            for i in range(4)
+        ]
+        
+        strategy = MarketRotationStrategy(state_manager=_InMemoryStateManager())
+        
+        with patch.object(strategy.state_manager, 'save_state') as mock_save:
+            strategy.bulk_update_market_performance('US_EQUITY', trades)
+            mock_save.assert_called_once_with(strategy.performance_state)
+        
+        equity_stats = strategy.get_market_statistics()['markets']['US_EQUITY']
+        self.assertEqual(equity_stats['trades'], 4)
+        self.assertEqual(equity_stats['wins'], 2)
+        self.assertAlmostEqual(equity_stats['total_profit'], 100.0, places=2)
+        self.assertAlmostEqual(equity_stats['avg_profit'], 25.0, places=2)
+    
+    def test_10_autoflush_disabled_defers_saves(self):
+        """Test that autoflush=False keeps changes in memory until flush()."""
+        state_manager = _InMemoryStateManager()
+        strategy = MarketRotationStrategy(state_manager=state_manager, autoflush=False)
+        
+        strategy.update_market_performance('CRYPTO', _TRADE_WIN.copy())
+        strategy.reset_performance('US_EQUITY')
+        self.assertEqual(state_manager.state, {}, "Nothing should be saved before flush")
+        
+        strategy.flush()
+        self.assertEqual(state_manager.state['market_performance']['CRYPTO']['trades'], 1)
+    
+    def test_11_statistics_cached_until_mutation(self):
+        """Test that statistics are reused until performance changes."""
+        self.strategy.update_market_performance('CRYPTO', _TRADE_WIN.copy())
+        
+        first = self.strategy.get_market_statistics()
+        with patch.object(self.strategy, '_calculate_market_score') as mock_score:
+            self.assertEqual(self.strategy.get_market_statistics(), first, "Unchanged state should reuse cached stats")
+            mock_score.assert_not_called()
+        
+        # Callers get a copy; mutating it must not leak into later results
+        first['markets']['CRYPTO']['trades'] = 99
+        first['rotation_count'] = 99
+        second = self.strategy.get_market_statistics()
+        self.assertEqual(second['markets']['CRYPTO']['trades'], 1)
+        self.assertEqual(second['rotation_count'], 0)
+        
+        self.strategy.update_market_performance('CRYPTO', _TRADE_LOSS.copy())
+        self.assertEqual(self.strategy.get_market_statistics()['markets']['CRYPTO']['trades'], 2)
+        
+        self.strategy.reset_performance('CRYPTO')
+        self.assertEqual(self.strategy.get_market_statistics()['markets']['CRYPTO']['trades'], 0)
+    
+    def test_12_repeated_selection_reuses_cached_statistics(self):
+        """Test that a select-then-stats cycle on the same market skips rescoring."""
+        self.strategy.update_market_performance('CRYPTO', _TRADE_WIN.copy())
+        
+        with patch('src.utils.market_calendar.MarketCalendar.get_active_markets') as mock_active:
+            mock_active.return_value = ['CRYPTO']
+            self.strategy.select_active_market(consider_performance=False)
+            first = self.strategy.get_market_statistics()
+            
+            with patch.object(self.strategy, '_calculate_market_score') as mock_score:
+                for _ in range(3):
+                    self.strategy.select_active_market(consider_performance=False)
+                    stats = self.strategy.get_market_statistics()
+                mock_score.assert_not_called()
+            
+            self.assertEqual(stats['rotation_count'], first['rotation_count'])
+            self.assertEqual(stats['last_rotation_time'], self.strategy.performance_state['last_rotation_time'])
+            
+            # Rotating to another market refreshes the statistics
+            mock_active.return_value = ['US_EQUITY', 'CRYPTO']
+            self.strategy.select_active_market(consider_performance=False)
+            self.assertEqual(self.strategy.get_market_statistics()['rotation_count'], first['rotation_count'] + 1)
+
 
 if __name__ == '__main__':
     # Run tests
@@ -0,0 +1,91 @@
+"""
+Shared OHLCV fixtures for the strategy tests.
+
+The MACD, RSI Breakout and Triple MA suites all read the same synthetic bars,
+so each frame is built once per session here. No test edits a frame in place;
+tests that need a variant (e.g. a dropped column) derive a new frame from it.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def _build_ohlcv(num_bars: int, trend: str = "up", noise_scale: float = 0.5, seed: int = 0) -> pd.DataFrame:
+    """
+    Build deterministic sample OHLCV data.
+
+    Args:
+        num_bars: Number of bars to generate
+        trend: Trend direction ("up", "down", "sideways")
+        noise_scale: Scale of the close noise around the up/down trend line
+        seed: Random seed for the generated prices and volumes
+
+    Returns:
+        DataFrame with float32 OHLCV data on a 1-minute index
+    """
+    rng = np.random.default_rng(seed)
+    # One draw for all price noise: rows are close, open, high and low
+    noise = rng.standard_normal((4, num_bars), dtype=np.float32)
+
+    # Generate price data based on trend
+    if trend == "up":
+        close_prices = np.linspace(100, 120, num_bars, dtype=np.float32) + noise[0] * noise_scale
+    elif trend == "down":
+        close_prices = np.linspace(120, 100, num_bars, dtype=np.float32) + noise[0] * noise_scale
+    else:  # sideways
+        close_prices = 110 + noise[0] * 2
+
+    # Fill one (num_bars, 5) array so the frame is built from a single block
+    ohlcv = np.empty((num_bars, len(_OHLCV_COLUMNS)), dtype=np.float32)
+    ohlcv[:, 0] = close_prices + noise[1] * 0.3
+    # Half-normal wick offsets, folded in place in the noise buffer
+    wicks = noise[2:]
+    np.abs(wicks, out=wicks)
+    wicks *= 0.5
+    ohlcv[:, 1] = close_prices + wicks[0]
+    ohlcv[:, 2] = close_prices - wicks[1]
+    ohlcv[:, 3] = close_prices
+    ohlcv[:, 4] = rng.integers(1000000, 5000000, num_bars)
+
+    index = pd.date_range(end=pd.Timestamp.now().floor("min"), periods=num_bars, freq="1min")
+    return pd.DataFrame(ohlcv, columns=_OHLCV_COLUMNS, index=index)
+
+
+@pytest.fixture(scope="session")
+def ohlcv_100_up():
+    return _build_ohlcv(100, "up")
+
+
+@pytest.fixture(scope="session")
+def ohlcv_100_down():
+    return _build_ohlcv(100, "down")
+
+
+@pytest.fixture(scope="session")
+def ohlcv_100_sideways():
+    return _build_ohlcv(100, "sideways")
+
+
+# Trends with less noise, so RSI settles at the low or high end
+@pytest.fixture(scope="session")
+def ohlcv_100_oversold():
+    return _build_ohlcv(100, "down", noise_scale=0.3)
+
+
+@pytest.fixture(scope="session")
+def ohlcv_100_overbought():
+    return _build_ohlcv(100, "up", noise_scale=0.3)
+
+
+# Short frames for the insufficient-data tests
+@pytest.fixture(scope="session")
+def ohlcv_20():
+    return _build_ohlcv(20)
+
+
+@pytest.fixture(scope="session")
+def ohlcv_10():
+    return _build_ohlcv(10)
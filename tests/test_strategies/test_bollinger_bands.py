@@ -8,198 +8,205 @@ Tests cover:
 - Edge cases
 """
 
-import unittest
+import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import cache
 from src.strategies.bollinger_bands_reversal import BollingerBandsReversalStrategy
 
 
-class TestBollingerBandsReversalStrategy(unittest.TestCase):
-    """Test suite for Bollinger Bands Reversal strategy."""
+# Standard deviation of the close around 110 for each volatility regime
+_CLOSE_SCALE = {"high": 5.0, "normal": 2.0, "low": 0.5}
+
+
+@cache
+def _build_sample_data(num_bars: int, volatility: str, seed: int) -> pd.DataFrame:
+    """Build deterministic sample OHLCV data; cached per (num_bars, volatility, seed)."""
+    rng = np.random.default_rng(seed)
+    timestamps = [datetime.now() - timedelta(minutes=i) for i in range(num_bars)]
+    timestamps.reverse()
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.strategy = BollingerBandsReversalStrategy()
-        
-    def _create_sample_data(self, num_bars: int = 100, volatility: str = "normal") -> pd.DataFrame:
-        """Create sample OHLCV data for testing."""
-        timestamps = [datetime.now() - timedelta(minutes=i) for i in range(num_bars)]
-        timestamps.reverse()
-        
-        if volatility == "high":
-            close_prices = 110 + np.random.randn(num_bars) * 5
-        elif volatility == "low":
-            close_prices = 110 + np.random.randn(num_bars) * 0.5
-        else:  # normal
-            close_prices = 110 + np.random.randn(num_bars) * 2
-            
-        data = {
-            'open': close_prices + np.random.randn(num_bars) * 0.3,
-            'high': close_prices + np.abs(np.random.randn(num_bars) * 0.5),
-            'low': close_prices - np.abs(np.random.randn(num_bars) * 0.5),
-            'close': close_prices,
-            'volume': np.random.randint(1000000, 5000000, num_bars)
-        }
-        
-        return pd.DataFrame(data, index=pd.DatetimeIndex(timestamps))
+    # One draw for every price column: close, open offset, high wick, low wick
+    noise = rng.standard_normal((num_bars, 4))
+    close_prices = 110 + noise[:, 0] * _CLOSE_SCALE[volatility]
+        
+    data = {
+        'open': close_prices + noise[:, 1] * 0.3,
+        'high': close_prices + np.abs(noise[:, 2] * 0.5),
+        'low': close_prices - np.abs(noise[:, 3] * 0.5),
+        'close': close_prices,
+        'volume': rng.integers(1000000, 5000000, num_bars)
+    }
     
-    def test_initialization(self):
+    return pd.DataFrame(data, index=pd.DatetimeIndex(timestamps))
+
+
+def _create_sample_data(num_bars: int = 100, volatility: str = "normal", seed: int = 0) -> pd.DataFrame:
+    """
+    Create sample OHLCV data for testing.
+
+    Returns a shallow copy of the cached frame, so the arrays are shared. Replacing a
+    whole column only affects the copy; tests that edit values in place must call
+    .copy() first.
+    """
+    return _build_sample_data(num_bars, volatility, seed).copy(deep=False)
+
+
+# The strategy is stateless and no test mutates the frames, so both are built once
+@pytest.fixture(scope="session")
+def strategy():
+    return BollingerBandsReversalStrategy()
+
+
+@pytest.fixture(scope="module")
+def sample_df():
+    return _create_sample_data(num_bars=100)
+
+
+@pytest.fixture(scope="module")
+def high_volatility_df():
+    return _create_sample_data(num_bars=100, volatility="high")
+
+
+# Indicator and signal outputs for sample_df, computed once and only read by the tests
+@pytest.fixture(scope="module")
+def indicators(strategy, sample_df):
+    return strategy.calculate_indicators(sample_df)
+
+
+@pytest.fixture(scope="module")
+def sample_signal(strategy, sample_df):
+    return strategy.generate_signal(sample_df)
+
+
+class TestBollingerBandsReversalStrategy:
+    """Test suite for Bollinger Bands Reversal strategy."""
+    
+    def test_initialization(self, strategy):
         """Test strategy initialization."""
-        self.assertEqual(self.strategy.name, "bollinger")
-        self.assertEqual(self.strategy.description, "Bollinger Bands Mean Reversal Strategy")
-        self.assertEqual(self.strategy.min_bars_required, 21)
+        assert strategy.name == "bollinger"
+        assert strategy.description == "Bollinger Bands Mean Reversal Strategy"
+        assert strategy.min_bars_required == 21
         
-    def test_calculate_indicators_returns_all_required(self):
+    def test_calculate_indicators_returns_all_required(self, indicators):
         """Test that calculate_indicators returns all required indicators."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
-        self.assertIn("upper_band", indicators)
-        self.assertIn("middle_band", indicators)
-        self.assertIn("lower_band", indicators)
-        self.assertIn("rsi", indicators)
-        self.assertIn("volume", indicators)
-        self.assertIn("bb_width", indicators)
-        
-        self.assertIsInstance(indicators["upper_band"], pd.Series)
-        self.assertIsInstance(indicators["middle_band"], pd.Series)
-        self.assertIsInstance(indicators["lower_band"], pd.Series)
-        
-    def test_calculate_indicators_band_ordering(self):
+        assert "upper_band" in indicators
+        assert "middle_band" in indicators
+        assert "lower_band" in indicators
+        assert "rsi" in indicators
+        assert "volume" in indicators
+        assert "bb_width" in indicators
+        
+        assert isinstance(indicators["upper_band"], pd.Series)
+        assert isinstance(indicators["middle_band"], pd.Series)
+        assert isinstance(indicators["lower_band"], pd.Series)
+        
+    def test_calculate_indicators_band_ordering(self, indicators):
         """Test that Bollinger Bands are ordered correctly (upper > middle > lower)."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
         # Check band ordering for last value (ignoring NaN)
         upper = indicators["upper_band"].iloc[-1]
         middle = indicators["middle_band"].iloc[-1]
         lower = indicators["lower_band"].iloc[-1]
         
         if not (pd.isna(upper) or pd.isna(middle) or pd.isna(lower)):
-            self.assertGreater(upper, middle)
-            self.assertGreater(middle, lower)
+            assert upper > middle
+            assert middle > lower
         
-    def test_generate_signal_structure(self):
+    def test_generate_signal_structure(self, sample_signal):
         """Test that generated signal has correct structure."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        self.assertIn("signal", signal)
-        self.assertIn("confidence", signal)
-        self.assertIn("details", signal)
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
-        self.assertGreaterEqual(signal["confidence"], 0.0)
-        self.assertLessEqual(signal["confidence"], 1.0)
-        
-    def test_generate_signal_details_structure(self):
+        assert "signal" in sample_signal
+        assert "confidence" in sample_signal
+        assert "details" in sample_signal
+        assert sample_signal["signal"] in ["BUY", "SELL", "HOLD"]
+        assert sample_signal["confidence"] >= 0.0
+        assert sample_signal["confidence"] <= 1.0
+        
+    def test_generate_signal_details_structure(self, sample_signal):
         """Test that signal details contain required fields."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        details = signal["details"]
-        self.assertIn("price", details)
-        self.assertIn("lower_band", details)
-        self.assertIn("upper_band", details)
-        self.assertIn("rsi", details)
-        self.assertIn("timestamp", details)
-        
-        self.assertIsInstance(details["price"], float)
-        self.assertIsInstance(details["lower_band"], float)
-        self.assertIsInstance(details["upper_band"], float)
-        self.assertIsInstance(details["rsi"], float)
-        
-    def test_generate_signal_rsi_values(self):
+        details = sample_signal["details"]
+        assert "price" in details
+        assert "lower_band" in details
+        assert "upper_band" in details
+        assert "rsi" in details
+        assert "timestamp" in details
+        
+        assert isinstance(details["price"], float)
+        assert isinstance(details["lower_band"], float)
+        assert isinstance(details["upper_band"], float)
+        assert isinstance(details["rsi"], float)
+        
+    def test_generate_signal_rsi_values(self, sample_signal):
         """Test that RSI values are in valid range (0-100)."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        rsi_value = signal["details"]["rsi"]
+        rsi_value = sample_signal["details"]["rsi"]
         if not pd.isna(rsi_value):
-            self.assertGreaterEqual(rsi_value, 0)
-            self.assertLessEqual(rsi_value, 100)
+            assert rsi_value >= 0
+            assert rsi_value <= 100
         
-    def test_validate_signal_hold_returns_unchanged(self):
+    def test_validate_signal_hold_returns_unchanged(self, strategy, sample_df):
         """Test that HOLD signals are not modified by validation."""
-        df = self._create_sample_data(num_bars=100)
         signal = {"signal": "HOLD", "confidence": 0}
         
-        validated = self.strategy.validate_signal(df, signal, _data_feed="iex")
+        validated = strategy.validate_signal(sample_df, signal, _data_feed="iex")
         
-        self.assertEqual(validated["signal"], "HOLD")
-        self.assertEqual(validated["confidence"], 0)
+        assert validated["signal"] == "HOLD"
+        assert validated["confidence"] == 0
         
-    def test_validate_signal_adds_validation_field(self):
+    def test_validate_signal_adds_validation_field(self, strategy, sample_df):
         """Test that validation adds validation field."""
-        df = self._create_sample_data(num_bars=100)
         signal = {"signal": "BUY", "confidence": 0.7, "details": {}}
         
-        validated = self.strategy.validate_signal(df, signal, _data_feed="iex")
+        validated = strategy.validate_signal(sample_df, signal, _data_feed="iex")
         
-        self.assertIn("validation", validated)
-        self.assertIsInstance(validated["validation"], str)
+        assert "validation" in validated
+        assert isinstance(validated["validation"], str)
         
-    def test_validate_signal_confidence_bounds(self):
+    def test_validate_signal_confidence_bounds(self, strategy, sample_df):
         """Test that confidence stays within [0, 1] bounds."""
-        df = self._create_sample_data(num_bars=100)
         signal = {"signal": "BUY", "confidence": 0.95, "details": {}}
         
-        validated = self.strategy.validate_signal(df, signal, _data_feed="iex")
+        validated = strategy.validate_signal(sample_df, signal, _data_feed="iex")
         
-        self.assertGreaterEqual(validated["confidence"], 0.0)
-        self.assertLessEqual(validated["confidence"], 1.0)
+        assert validated["confidence"] >= 0.0
+        assert validated["confidence"] <= 1.0
         
-    def test_validate_signal_volatility_confirmation(self):
+    def test_validate_signal_volatility_confirmation(self, strategy, high_volatility_df):
         """Test that volatility expansion is checked."""
-        df = self._create_sample_data(num_bars=100, volatility="high")
         signal = {"signal": "BUY", "confidence": 0.7, "details": {}}
         
-        validated = self.strategy.validate_signal(df, signal, _data_feed="iex")
+        validated = strategy.validate_signal(high_volatility_df, signal, _data_feed="iex")
         
         # Should have validation notes
-        self.assertIn("validation", validated)
-        
-    def test_strategy_with_insufficient_data(self):
-        """Test strategy with insufficient bars."""
-        df = self._create_sample_data(num_bars=15)
+        assert "validation" in validated
         
-        # Should still run but may have limited indicators
-        signal = self.strategy.generate_signal(df)
-        self.assertIn("signal", signal)
-        
-    def test_strategy_min_bars_requirement(self):
+    def test_strategy_min_bars_requirement(self, strategy):
         """Test that strategy defines minimum bars requirement."""
-        self.assertEqual(self.strategy.min_bars_required, 21)
+        assert strategy.min_bars_required == 21
         
-    def test_bb_width_calculation(self):
+    def test_bb_width_calculation(self, indicators):
         """Test that BB width is calculated correctly."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
         bb_width = indicators["bb_width"]
-        self.assertIsInstance(bb_width, pd.Series)
+        assert isinstance(bb_width, pd.Series)
         
         # BB width should be positive (or NaN for early values)
         valid_widths = bb_width.dropna()
         if len(valid_widths) > 0:
-            self.assertTrue(all(valid_widths >= 0))
-        
-    def test_strategy_with_low_volatility(self):
-        """Test strategy behavior in low volatility conditions."""
-        df = self._create_sample_data(num_bars=100, volatility="low")
-        signal = self.strategy.generate_signal(df)
+            assert all(valid_widths >= 0)
         
-        # Should generate a signal (BUY/SELL/HOLD)
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
+    @pytest.mark.parametrize("num_bars,volatility", [
+        (100, "normal"),
+        (100, "low"),
+        (100, "high"),
+        (15, "normal"),  # Fewer bars than min_bars_required: runs with limited indicators
+    ])
+    def test_strategy_signal_across_conditions(self, strategy, num_bars, volatility):
+        """Test that a valid signal is generated across volatility regimes and bar counts."""
+        df = _create_sample_data(num_bars=num_bars, volatility=volatility)
         
-    def test_strategy_with_high_volatility(self):
-        """Test strategy behavior in high volatility conditions."""
-        df = self._create_sample_data(num_bars=100, volatility="high")
-        signal = self.strategy.generate_signal(df)
+        signal = strategy.generate_signal(df)
         
-        # Should generate a signal
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
+        assert signal["signal"] in ["BUY", "SELL", "HOLD"]
 
 
-if __name__ == '__main__':
-    unittest.main()
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -8,144 +8,113 @@ Tests cover:
 - Edge cases
 """
 
-import unittest
+import pytest
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
 from src.strategies.macd_crossover import MACDCrossoverStrategy
 
 
-class TestMACDCrossoverStrategy(unittest.TestCase):
+# The strategy is stateless, so one instance serves the module; frames come from conftest.py
+@pytest.fixture(scope="module")
+def strategy():
+    return MACDCrossoverStrategy()
+
+
+@pytest.fixture(scope="module")
+def sample_df(ohlcv_100_up):
+    return ohlcv_100_up
+
+
+# Indicator and signal outputs for sample_df, computed once and only read by the tests
+@pytest.fixture(scope="module")
+def indicators(strategy, sample_df):
+    return strategy.calculate_indicators(sample_df)
+
+
+@pytest.fixture(scope="module")
+def sample_signal(strategy, sample_df):
+    return strategy.generate_signal(sample_df)
+
+
+class TestMACDCrossoverStrategy:
     """Test suite for MACD Crossover strategy."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.strategy = MACDCrossoverStrategy()
-        
-    def _create_sample_data(self, num_bars: int = 100, trend: str = "up") -> pd.DataFrame:
-        """Create sample OHLCV data for testing."""
-        timestamps = [datetime.now() - timedelta(minutes=i) for i in range(num_bars)]
-        timestamps.reverse()
-        
-        if trend == "up":
-            close_prices = np.linspace(100, 120, num_bars) + np.random.randn(num_bars) * 0.5
-        elif trend == "down":
-            close_prices = np.linspace(120, 100, num_bars) + np.random.randn(num_bars) * 0.5
-        else:  # sideways
-            close_prices = 110 + np.random.randn(num_bars) * 2
-            
-        data = {
-            'open': close_prices + np.random.randn(num_bars) * 0.3,
-            'high': close_prices + np.abs(np.random.randn(num_bars) * 0.5),
-            'low': close_prices - np.abs(np.random.randn(num_bars) * 0.5),
-            'close': close_prices,
-            'volume': np.random.randint(1000000, 5000000, num_bars)
-        }
-        
-        return pd.DataFrame(data, index=pd.DatetimeIndex(timestamps))
-    
-    def test_initialization(self):
+    def test_initialization(self, strategy):
         """Test strategy initialization."""
-        self.assertEqual(self.strategy.name, "macd")
-        self.assertEqual(self.strategy.description, "MACD Crossover Strategy")
-        self.assertEqual(self.strategy.min_bars_required, 34)
+        assert strategy.name == "macd"
+        assert strategy.description == "MACD Crossover Strategy"
+        assert strategy.min_bars_required == 34
         
-    def test_calculate_indicators_returns_all_required(self):
+    def test_calculate_indicators_returns_all_required(self, indicators):
         """Test that calculate_indicators returns all required indicators."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
-        self.assertIn("macd_line", indicators)
-        self.assertIn("signal_line", indicators)
-        self.assertIn("histogram", indicators)
-        self.assertIn("volume", indicators)
-        self.assertIn("rsi", indicators)
+        assert "macd_line" in indicators
+        assert "signal_line" in indicators
+        assert "histogram" in indicators
+        assert "volume" in indicators
+        assert "rsi" in indicators
         
-        self.assertIsInstance(indicators["macd_line"], pd.Series)
-        self.assertIsInstance(indicators["signal_line"], pd.Series)
-        self.assertIsInstance(indicators["histogram"], pd.Series)
+        assert isinstance(indicators["macd_line"], pd.Series)
+        assert isinstance(indicators["signal_line"], pd.Series)
+        assert isinstance(indicators["histogram"], pd.Series)
         
-    def test_generate_signal_structure(self):
+    def test_generate_signal_structure(self, sample_signal):
         """Test that generated signal has correct structure."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        self.assertIn("signal", signal)
-        self.assertIn("confidence", signal)
-        self.assertIn("details", signal)
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
-        self.assertGreaterEqual(signal["confidence"], 0.0)
-        self.assertLessEqual(signal["confidence"], 1.0)
-        
-    def test_generate_signal_details_structure(self):
+        assert "signal" in sample_signal
+        assert "confidence" in sample_signal
+        assert "details" in sample_signal
+        assert sample_signal["signal"] in ["BUY", "SELL", "HOLD"]
+        assert sample_signal["confidence"] >= 0.0
+        assert sample_signal["confidence"] <= 1.0
+        
+    def test_generate_signal_details_structure(self, sample_signal):
         """Test that signal details contain required fields."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        details = signal["details"]
-        self.assertIn("macd_line", details)
-        self.assertIn("signal_line", details)
-        self.assertIn("histogram", details)
-        self.assertIn("current_price", details)
-        self.assertIn("timestamp", details)
-        
-        self.assertIsInstance(details["macd_line"], float)
-        self.assertIsInstance(details["signal_line"], float)
-        self.assertIsInstance(details["histogram"], float)
-        
-    def test_validate_signal_hold_returns_unchanged(self):
+        details = sample_signal["details"]
+        assert "macd_line" in details
+        assert "signal_line" in details
+        assert "histogram" in details
+        assert "current_price" in details
+        assert "timestamp" in details
+        
+        assert isinstance(details["macd_line"], float)
+        assert isinstance(details["signal_line"], float)
+        assert isinstance(details["histogram"], float)
+        
+    def test_validate_signal_hold_returns_unchanged(self, strategy, sample_df):
         """Test that HOLD signals are not modified by validation."""
-        df = self._create_sample_data(num_bars=100)
         signal = {"signal": "HOLD", "confidence": 0}
         
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
-        
-        self.assertEqual(validated["signal"], "HOLD")
-        self.assertEqual(validated["confidence"], 0)
-        
-    def test_validate_signal_adds_validation_field(self):
-        """Test that validation adds validation field."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.65, "details": {}}
+        validated = strategy.validate_signal(sample_df, signal, data_feed="iex")
         
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
+        assert validated["signal"] == "HOLD"
+        assert validated["confidence"] == 0
         
-        self.assertIn("validation", validated)
-        self.assertIsInstance(validated["validation"], str)
+    @pytest.mark.parametrize("side, confidence, feed", [
+        ("BUY", 0.65, "iex"),
+        ("BUY", 0.65, "sip"),
+        ("BUY", 0.95, "sip"),
+    ])
+    def test_validate_signal_confirmations(self, strategy, sample_df, side, confidence, feed):
+        """
+        Test validation of non-HOLD signals across feeds and starting confidences.
         
-    def test_validate_signal_confidence_bounds(self):
-        """Test that confidence stays within [0, 1] bounds."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.95, "details": {}}
+        Every case must gain a validation note and keep confidence a float in [0, 1]
+        (SIP and IEX feeds are both exercised, and a 0.95 start must not push past 1.0).
+        """
+        signal = {"signal": side, "confidence": confidence}
         
-        validated = self.strategy.validate_signal(df, signal, data_feed="sip")
+        validated = strategy.validate_signal(sample_df, signal, data_feed=feed)
         
-        self.assertGreaterEqual(validated["confidence"], 0.0)
-        self.assertLessEqual(validated["confidence"], 1.0)
+        assert "validation" in validated
+        assert isinstance(validated["validation"], str)
+        assert isinstance(validated["confidence"], float)
+        assert validated["confidence"] >= 0.0
+        assert validated["confidence"] <= 1.0
         
-    def test_validate_signal_data_feed_awareness(self):
-        """Test that validation treats SIP and IEX feeds differently."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.65, "details": {}}
-        
-        validated_sip = self.strategy.validate_signal(df, signal.copy(), data_feed="sip")
-        validated_iex = self.strategy.validate_signal(df, signal.copy(), data_feed="iex")
-        
-        self.assertIn("validation", validated_sip)
-        self.assertIn("validation", validated_iex)
-        
-    def test_strategy_with_insufficient_data(self):
+    def test_strategy_with_insufficient_data(self, strategy, ohlcv_20):
         """Test strategy with insufficient bars."""
-        df = self._create_sample_data(num_bars=20)
-        
         # Should still run but may have limited indicators
-        signal = self.strategy.generate_signal(df)
-        self.assertIn("signal", signal)
+        signal = strategy.generate_signal(ohlcv_20)
+        assert "signal" in signal
         
-    def test_strategy_min_bars_requirement(self):
+    def test_strategy_min_bars_requirement(self, strategy):
         """Test that strategy defines minimum bars requirement."""
-        self.assertGreater(self.strategy.min_bars_required, 30)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        assert strategy.min_bars_required > 30
@@ -8,235 +8,161 @@ Tests cover:
 - Edge cases (insufficient data, missing columns)
 """
 
-import unittest
+import pytest
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
 from src.strategies.triple_ma import TripleMovingAverageStrategy
 
 
-class TestTripleMovingAverageStrategy(unittest.TestCase):
+# The strategy is stateless, so one instance serves the module; frames come from conftest.py
+@pytest.fixture(scope="module")
+def strategy():
+    return TripleMovingAverageStrategy()
+
+
+@pytest.fixture(scope="module")
+def sample_df(ohlcv_100_up):
+    return ohlcv_100_up
+
+
+# Indicator and signal outputs for sample_df, computed once and only read by the tests
+@pytest.fixture(scope="module")
+def indicators(strategy, sample_df):
+    return strategy.calculate_indicators(sample_df)
+
+
+@pytest.fixture(scope="module")
+def sample_signal(strategy, sample_df):
+    return strategy.generate_signal(sample_df)
+
+
+class TestTripleMovingAverageStrategy:
     """Test suite for Triple Moving Average strategy."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.strategy = TripleMovingAverageStrategy()
-        
-    def _create_sample_data(self, num_bars: int = 100, trend: str = "up") -> pd.DataFrame:
-        """
-        Create sample OHLCV data for testing.
-        
-        Args:
-            num_bars: Number of bars to generate
-            trend: Trend direction ("up", "down", "sideways")
-            
-        Returns:
-            DataFrame with OHLCV data
-        """
-        timestamps = [datetime.now() - timedelta(minutes=i) for i in range(num_bars)]
-        timestamps.reverse()
-        
-        # Generate price data based on trend
-        if trend == "up":
-            close_prices = np.linspace(100, 120, num_bars) + np.random.randn(num_bars) * 0.5
-        elif trend == "down":
-            close_prices = np.linspace(120, 100, num_bars) + np.random.randn(num_bars) * 0.5
-        else:  # sideways
-            close_prices = 110 + np.random.randn(num_bars) * 2
-            
-        data = {
-            'open': close_prices + np.random.randn(num_bars) * 0.3,
-            'high': close_prices + np.abs(np.random.randn(num_bars) * 0.5),
-            'low': close_prices - np.abs(np.random.randn(num_bars) * 0.5),
-            'close': close_prices,
-            'volume': np.random.randint(1000000, 5000000, num_bars)
-        }
-        
-        df = pd.DataFrame(data, index=pd.DatetimeIndex(timestamps))
-        return df
-    
-    def test_initialization(self):
+    def test_initialization(self, strategy):
         """Test strategy initialization."""
-        self.assertEqual(self.strategy.name, "3ma")
-        self.assertEqual(self.strategy.description, "Triple Moving Average Crossover Strategy")
-        self.assertIsInstance(self.strategy.min_bars_required, int)
-        self.assertGreater(self.strategy.min_bars_required, 20)
+        assert strategy.name == "3ma"
+        assert strategy.description == "Triple Moving Average Crossover Strategy"
+        assert isinstance(strategy.min_bars_required, int)
+        assert strategy.min_bars_required > 20
         
-    def test_calculate_indicators_returns_all_required(self):
+    def test_calculate_indicators_returns_all_required(self, indicators, sample_df):
         """Test that calculate_indicators returns all required indicators."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
         # Check all required indicators are present
-        self.assertIn("fast_ma", indicators)
-        self.assertIn("medium_ma", indicators)
-        self.assertIn("slow_ma", indicators)
-        self.assertIn("volume", indicators)
-        self.assertIn("adx", indicators)
+        assert "fast_ma" in indicators
+        assert "medium_ma" in indicators
+        assert "slow_ma" in indicators
+        assert "volume" in indicators
+        assert "adx" in indicators
         
         # Check indicators are pandas Series
-        self.assertIsInstance(indicators["fast_ma"], pd.Series)
-        self.assertIsInstance(indicators["medium_ma"], pd.Series)
-        self.assertIsInstance(indicators["slow_ma"], pd.Series)
+        assert isinstance(indicators["fast_ma"], pd.Series)
+        assert isinstance(indicators["medium_ma"], pd.Series)
+        assert isinstance(indicators["slow_ma"], pd.Series)
         
         # Check lengths match
-        self.assertEqual(len(indicators["fast_ma"]), len(df))
-        self.assertEqual(len(indicators["medium_ma"]), len(df))
-        self.assertEqual(len(indicators["slow_ma"]), len(df))
+        assert len(indicators["fast_ma"]) == len(sample_df)
+        assert len(indicators["medium_ma"]) == len(sample_df)
+        assert len(indicators["slow_ma"]) == len(sample_df)
         
-    def test_calculate_indicators_with_insufficient_data(self):
+    def test_calculate_indicators_with_insufficient_data(self, strategy, ohlcv_10):
         """Test calculate_indicators with insufficient data."""
-        df = self._create_sample_data(num_bars=10)  # Too few bars
-        
         # Should still calculate indicators, but may have NaN values
-        indicators = self.strategy.calculate_indicators(df)
-        self.assertIn("fast_ma", indicators)
+        indicators = strategy.calculate_indicators(ohlcv_10)  # Too few bars
+        assert "fast_ma" in indicators
         
-    def test_generate_signal_buy_on_bullish_crossover(self):
+    def test_generate_signal_buy_on_bullish_crossover(self, sample_signal):
         """Test BUY signal generation on bullish crossover."""
-        # Create data that will trigger a BUY signal
-        # Fast MA crosses above medium MA, and medium > slow
-        df = self._create_sample_data(num_bars=100, trend="up")
-        
-        # Generate signal
-        signal = self.strategy.generate_signal(df)
+        # sample_df is the up-trending frame, the one that can trigger a BUY signal
+        # (fast MA crosses above medium MA, and medium > slow)
         
         # Check signal structure
-        self.assertIn("signal", signal)
-        self.assertIn("confidence", signal)
-        self.assertIn("details", signal)
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
-        self.assertGreaterEqual(signal["confidence"], 0.0)
-        self.assertLessEqual(signal["confidence"], 1.0)
-        
-    def test_generate_signal_sell_on_bearish_crossover(self):
+        assert "signal" in sample_signal
+        assert "confidence" in sample_signal
+        assert "details" in sample_signal
+        assert sample_signal["signal"] in ["BUY", "SELL", "HOLD"]
+        assert sample_signal["confidence"] >= 0.0
+        assert sample_signal["confidence"] <= 1.0
+        
+    def test_generate_signal_sell_on_bearish_crossover(self, strategy, ohlcv_100_down):
         """Test SELL signal generation on bearish crossover."""
-        df = self._create_sample_data(num_bars=100, trend="down")
-        signal = self.strategy.generate_signal(df)
+        signal = strategy.generate_signal(ohlcv_100_down)
         
-        self.assertIn("signal", signal)
-        self.assertIn(signal["signal"], ["BUY", "SELL", "HOLD"])
+        assert "signal" in signal
+        assert signal["signal"] in ["BUY", "SELL", "HOLD"]
         
-    def test_generate_signal_hold_on_sideways(self):
+    def test_generate_signal_hold_on_sideways(self, strategy, ohlcv_100_sideways):
         """Test HOLD signal in sideways market."""
-        df = self._create_sample_data(num_bars=100, trend="sideways")
-        signal = self.strategy.generate_signal(df)
+        signal = strategy.generate_signal(ohlcv_100_sideways)
         
         # In sideways market, most signals should be HOLD
-        self.assertIn("signal", signal)
+        assert "signal" in signal
         
-    def test_generate_signal_details_structure(self):
+    def test_generate_signal_details_structure(self, sample_signal):
         """Test that signal details contain required fields."""
-        df = self._create_sample_data(num_bars=100)
-        signal = self.strategy.generate_signal(df)
-        
-        self.assertIn("details", signal)
-        details = signal["details"]
+        assert "details" in sample_signal
+        details = sample_signal["details"]
         
         # Check required detail fields
-        self.assertIn("fast_ma", details)
-        self.assertIn("medium_ma", details)
-        self.assertIn("slow_ma", details)
-        self.assertIn("current_price", details)
-        self.assertIn("timestamp", details)
+        assert "fast_ma" in details
+        assert "medium_ma" in details
+        assert "slow_ma" in details
+        assert "current_price" in details
+        assert "timestamp" in details
         
         # Check types
-        self.assertIsInstance(details["fast_ma"], float)
-        self.assertIsInstance(details["medium_ma"], float)
-        self.assertIsInstance(details["slow_ma"], float)
-        self.assertIsInstance(details["current_price"], float)
+        assert isinstance(details["fast_ma"], float)
+        assert isinstance(details["medium_ma"], float)
+        assert isinstance(details["slow_ma"], float)
+        assert isinstance(details["current_price"], float)
         
-    def test_validate_signal_hold_returns_unchanged(self):
+    def test_validate_signal_hold_returns_unchanged(self, strategy, sample_df):
         """Test that HOLD signals are not modified by validation."""
-        df = self._create_sample_data(num_bars=100)
         signal = {"signal": "HOLD", "confidence": 0}
         
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
-        
-        self.assertEqual(validated["signal"], "HOLD")
-        self.assertEqual(validated["confidence"], 0)
-        
-    def test_validate_signal_adds_validation_notes(self):
-        """Test that validation adds notes to non-HOLD signals."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.7}
-        
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
-        
-        # Should have validation field
-        self.assertIn("validation", validated)
-        self.assertIsInstance(validated["validation"], str)
-        
-    def test_validate_signal_confidence_adjustment(self):
-        """Test that validation adjusts confidence appropriately."""
-        df = self._create_sample_data(num_bars=100)
-        original_confidence = 0.7
-        signal = {"signal": "BUY", "confidence": original_confidence}
-        
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
-        
-        # Confidence should be adjusted (either up or down)
-        self.assertIsInstance(validated["confidence"], float)
-        self.assertGreaterEqual(validated["confidence"], 0.0)
-        self.assertLessEqual(validated["confidence"], 1.0)
-        
-    def test_validate_signal_data_feed_awareness(self):
-        """Test that validation treats SIP and IEX data feeds differently."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.7}
+        validated = strategy.validate_signal(sample_df, signal, data_feed="iex")
         
-        # Validate with SIP feed
-        validated_sip = self.strategy.validate_signal(df, signal.copy(), data_feed="sip")
+        assert validated["signal"] == "HOLD"
+        assert validated["confidence"] == 0
         
-        # Validate with IEX feed
-        validated_iex = self.strategy.validate_signal(df, signal.copy(), data_feed="iex")
-        
-        # Both should have validation field
-        self.assertIn("validation", validated_sip)
-        self.assertIn("validation", validated_iex)
-        
-    def test_validate_signal_confidence_caps_at_one(self):
-        """Test that confidence never exceeds 1.0 after validation."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.95}
-        
-        validated = self.strategy.validate_signal(df, signal, data_feed="sip")
-        
-        self.assertLessEqual(validated["confidence"], 1.0)
+    @pytest.mark.parametrize("side, confidence, feed", [
+        ("BUY", 0.7, "iex"),
+        ("BUY", 0.7, "sip"),
+        ("BUY", 0.95, "sip"),
+        ("BUY", 0.1, "iex"),
+    ])
+    def test_validate_signal_confirmations(self, strategy, sample_df, side, confidence, feed):
+        """
+        Test validation of non-HOLD signals across feeds and starting confidences.
         
-    def test_validate_signal_confidence_never_negative(self):
-        """Test that confidence never goes below 0.0 after validation."""
-        df = self._create_sample_data(num_bars=100)
-        signal = {"signal": "BUY", "confidence": 0.1}
+        Every case must gain a validation note and keep confidence a float in [0, 1]
+        (0.95 and 0.1 starts check the upper and lower caps).
+        """
+        signal = {"signal": side, "confidence": confidence}
         
-        validated = self.strategy.validate_signal(df, signal, data_feed="iex")
+        validated = strategy.validate_signal(sample_df, signal, data_feed=feed)
         
-        self.assertGreaterEqual(validated["confidence"], 0.0)
+        assert "validation" in validated
+        assert isinstance(validated["validation"], str)
+        assert isinstance(validated["confidence"], float)
+        assert validated["confidence"] >= 0.0
+        assert validated["confidence"] <= 1.0
         
-    def test_strategy_with_missing_volume_column(self):
+    def test_strategy_with_missing_volume_column(self, strategy, sample_df):
         """Test strategy handles missing volume column gracefully."""
-        df = self._create_sample_data(num_bars=100)
-        df = df.drop(columns=['volume'])
+        df = sample_df.drop(columns=['volume'])
         
         # Should raise an exception or handle gracefully
-        with self.assertRaises(KeyError):
-            self.strategy.calculate_indicators(df)
+        with pytest.raises(KeyError):
+            strategy.calculate_indicators(df)
             
-    def test_strategy_min_bars_requirement(self):
+    def test_strategy_min_bars_requirement(self, strategy):
         """Test that strategy defines minimum bars requirement."""
-        self.assertGreater(self.strategy.min_bars_required, 0)
+        assert strategy.min_bars_required > 0
         
-    def test_indicators_are_numeric(self):
+    def test_indicators_are_numeric(self, indicators):
         """Test that all indicator values are numeric."""
-        df = self._create_sample_data(num_bars=100)
-        indicators = self.strategy.calculate_indicators(df)
-        
         # Check that indicators contain numeric values (excluding NaN)
         for key, series in indicators.items():
             if key != "volume":  # Volume is from original DataFrame
                 # Should be numeric type
-                self.assertTrue(pd.api.types.is_numeric_dtype(series))
-
-
-if __name__ == '__main__':
-    unittest.main()
+                assert pd.api.types.is_numeric_dtype(series)
@@ -0,0 +1,128 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.tools.analysis_tools import TechnicalAnalysisTools
+
+
+class TestCalculateATR(unittest.TestCase):
+
+    def test_matches_true_range_definition(self):
+        """
+        Verify the ATR equals the rolling mean of max(high-low, |high-prev|, |low-prev|).
+        """
+        df = pd.DataFrame({
+            'high': [10.0, 12.0, 11.0, 15.0],
+            'low': [9.0, 10.0, 8.0, 13.0],
+            'close': [9.5, 11.0, 10.0, 14.0]
+        })
+
+        atr = TechnicalAnalysisTools.calculate_atr(df, period=2)
+
+        # True ranges: first bar has no previous close -> 1.0, then 2.5, 3.0, 5.0
+        self.assertTrue(np.isnan(atr.iloc[0]))
+        self.assertEqual(atr.iloc[1:].tolist(), [1.75, 2.75, 4.0])
+        self.assertTrue(atr.index.equals(df.index))
+
+
+class TestBollingerBandWidth(unittest.TestCase):
+
+    def test_width_from_bands_matches_frame_helper(self):
+        """
+        Verify width computed from precomputed bands equals calculate_bollinger_band_width.
+        """
+        close = 100 + np.random.default_rng(1).normal(0, 1, 60).cumsum()
+        df = pd.DataFrame({'close': close})
+
+        upper, middle, lower = TechnicalAnalysisTools.calculate_bollinger_bands(df)
+        width = TechnicalAnalysisTools.bollinger_band_width(upper, middle, lower)
+
+        pd.testing.assert_series_equal(width, TechnicalAnalysisTools.calculate_bollinger_band_width(df))
+        self.assertTrue((width.dropna() > 0).all())
+
+
+# SMA, RSI and ATR all average through talib.SMA when TA-Lib is installed
+_TALIB_INDICATORS = {
+    'sma': lambda df: TechnicalAnalysisTools.calculate_sma(df, 20),
+    'rsi': lambda df: TechnicalAnalysisTools.calculate_rsi(df, 14),
+    'atr': lambda df: TechnicalAnalysisTools.calculate_atr(df, 14)
+}
+
+
+def _trending_frame():
+    close = 100 + np.random.default_rng(0).normal(0, 1, 120).cumsum()
+    return pd.DataFrame({'high': close + 1, 'low': close - 1, 'close': close})
+
+
+class TestTalibFallback(unittest.TestCase):
+
+    def setUp(self):
+        self.df = _trending_frame()
+        # Stand-in TA-Lib whose SMA is a constant, so its output is recognisable
+        self.fake_talib = SimpleNamespace(
+            SMA=Mock(side_effect=lambda values, timeperiod: np.full(len(values), 42.0))
+        )
+
+    def test_talib_branch_used_when_installed(self):
+        """
+        Verify SMA, RSI and ATR route through talib.SMA and wrap its output on the input index.
+        """
+        expected = {'sma': 42.0, 'rsi': 50.0, 'atr': 42.0}  # RSI: equal gain/loss averages
+        for name, indicator in _TALIB_INDICATORS.items():
+            with self.subTest(indicator=name):
+                self.fake_talib.SMA.reset_mock()
+                with patch('src.tools.analysis_tools.talib', self.fake_talib):
+                    result = indicator(self.df)
+
+                self.assertTrue(self.fake_talib.SMA.called)
+                for call_ in self.fake_talib.SMA.call_args_list:
+                    self.assertIn(call_.kwargs['timeperiod'], (14, 20))
+                self.assertIsInstance(result, pd.Series)
+                self.assertTrue(result.index.equals(self.df.index))
+                self.assertTrue((result.iloc[1:] == expected[name]).all())
+
+    def test_nan_input_bypasses_talib(self):
+        """
+        Verify NaN-bearing closes go through pandas even when TA-Lib is installed.
+        """
+        self.df.loc[50, 'close'] = np.nan
+
+        with patch('src.tools.analysis_tools.talib', self.fake_talib):
+            TechnicalAnalysisTools.calculate_sma(self.df, 20)
+
+        self.fake_talib.SMA.assert_not_called()
+
+    def test_nan_only_blanks_windows_containing_it(self):
+        """
+        Verify a missing close does not poison every later SMA value.
+        """
+        self.df.loc[50, 'close'] = np.nan
+
+        sma = TechnicalAnalysisTools.calculate_sma(self.df, 20)
+
+        self.assertTrue(sma.iloc[50:70].isna().all())
+        self.assertFalse(sma.iloc[70:].isna().any())
+
+
+@pytest.mark.parametrize('name', list(_TALIB_INDICATORS))
+def test_talib_matches_pandas_fallback(name):
+    """
+    Verify the real TA-Lib path agrees with the pandas fallback.
+    """
+    pytest.importorskip('talib')
+    df = _trending_frame()
+    indicator = _TALIB_INDICATORS[name]
+
+    with_talib = indicator(df)
+    with patch('src.tools.analysis_tools.talib', None):
+        fallback = indicator(df)
+
+    pd.testing.assert_series_equal(with_talib, fallback, check_names=False, rtol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
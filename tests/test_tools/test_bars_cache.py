@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from src.config.settings import Settings
+from src.tools.bars_cache import BarsCache
+
+
+class TestBarsCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = BarsCache(cache_dir=Path(self.temp_dir) / "bars")
+        self.df = pd.DataFrame(
+            {'close': [1.5, 2.5], 'volume': [10, 20]},
+            index=pd.date_range('2025-01-01', periods=2, freq='D', tz='UTC')
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_preserves_dtypes_and_index(self):
+        key = BarsCache.make_key('BTC/USD', '1Day', 2, 'CRYPTO')
+        self.cache.set(key, self.df)
+
+        cached = self.cache.get(key, ttl=60)
+
+        pd.testing.assert_frame_equal(cached, self.df)
+
+    def test_miss_and_expiry(self):
+        key = BarsCache.make_key('AAPL', '1Hour', 24, 'US_EQUITY')
+        self.assertIsNone(self.cache.get(key, ttl=60))
+
+        self.cache.set(key, self.df)
+        stale = time.time() - 120
+        os.utime(self.cache._path(key), (stale, stale))
+
+        self.assertIsNone(self.cache.get(key, ttl=60))
+
+    def test_truncated_entry_is_a_miss(self):
+        key = BarsCache.make_key('AAPL', '1Day', 2, 'US_EQUITY')
+        self.cache.set(key, self.df)
+        path = self.cache._path(key)
+        path.write_bytes(path.read_bytes()[:20])
+
+        self.assertIsNone(self.cache.get(key, ttl=60))
+
+    def test_concurrent_writes_leave_a_readable_entry(self):
+        key = BarsCache.make_key('BTC/USD', '1Day', 2, 'CRYPTO')
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: self.cache.set(key, self.df), range(32)))
+
+        pd.testing.assert_frame_equal(self.cache.get(key, ttl=60), self.df)
+        self.assertEqual([p.name for p in self.cache.cache_dir.iterdir()], [f"{key}.pkl"])
+
+    def test_failed_write_removes_temp_file(self):
+        key = BarsCache.make_key('AAPL', '1Day', 2, 'US_EQUITY')
+        with patch.object(pd.DataFrame, 'to_pickle', side_effect=OSError("disk full")):
+            self.cache.set(key, self.df)
+
+        self.assertEqual(list(self.cache.cache_dir.iterdir()), [])
+
+    def test_disabled_cache_never_stores(self):
+        cache = BarsCache(cache_dir=Path(self.temp_dir) / "disabled", enabled=False)
+        key = BarsCache.make_key('AAPL', '1Day', 30, 'US_EQUITY')
+
+        cache.set(key, self.df)
+
+        self.assertIsNone(cache.get(key, ttl=60))
+        self.assertFalse((Path(self.temp_dir) / "disabled").exists())
+
+    def test_key_and_ttl(self):
+        self.assertNotEqual(
+            BarsCache.make_key('AAPL', '1Day', 30, 'US_EQUITY'),
+            BarsCache.make_key('AAPL', '1Day', 31, 'US_EQUITY')
+        )
+        self.assertEqual(BarsCache.ttl_for('1Day'), BarsCache.DAILY_TTL_SECONDS)
+        self.assertEqual(BarsCache.ttl_for('1d'), BarsCache.DAILY_TTL_SECONDS)
+        self.assertEqual(BarsCache.ttl_for('15Min'), BarsCache.INTRADAY_TTL_SECONDS)
+
+    def test_global_cache_is_opt_in(self):
+        self.assertIs(Settings.model_fields['bars_cache_enabled'].default, False)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,70 +5,93 @@ This module tests trade execution, position sizing, and portfolio constraints.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch
+
 from src.tools.execution_tools import ExecutionTools, execution_tools
 
+# Position sizing inputs and the fields each must produce. shares = equity * risk / atr,
+# falling back to 1% of equity / price when ATR is zero, and never below 1 share.
+_POSITION_SIZE_CASES = [
+    # risk_amount = 10000 * 0.02 = 200; shares = 200 / 2.0 = 100
+    {'name': 'normal', 'risk': 0.02, 'price': 100.0, 'atr': 2.0, 'equity': 10000.0,
+     'expected': {'shares': 100, 'total_cost': 10000.0, 'risk_amount': 200.0,
+                  'price_per_share': 100.0, 'atr_used': 2.0}},
+    # shares = (10000 * 0.01) / 50 = 2
+    {'name': 'zero_atr_fallback', 'risk': 0.02, 'price': 50.0, 'atr': 0.0, 'equity': 10000.0,
+     'expected': {'shares': 2, 'atr_used': 0.0}},
+    # 1000 * 0.001 / 100 rounds down to 0, so the 1-share floor applies
+    {'name': 'minimum_one_share', 'risk': 0.001, 'price': 10000.0, 'atr': 100.0, 'equity': 1000.0,
+     'expected': {'shares': 1}},
+]
+
+# Defaults installed in setUp; tests copy or override only the fields they change
+_HEALTHY_ACCOUNT = MappingProxyType({
+    'equity': '10000.00',
+    'last_equity': '10000.00',
+    'buying_power': '5000.00',
+    'trading_blocked': False
+})
+
+_APPROVED_CONSTRAINTS = MappingProxyType({
+    'approved': True,
+    'checks': {},
+    'account_info': {'equity': '10000', 'buying_power': '5000'}
+})
+
+
+class _FakeAlpaca:
+    """
+    Plain stand-in for alpaca_manager's account and position reads.
+    
+    Cheaper than a MagicMock for tests that only feed data in. Setting ``error``
+    makes both calls raise it, like a failing API.
+    """
+    
+    def __init__(self, account=_HEALTHY_ACCOUNT, positions=()):
+        self.account = dict(account)
+        self.positions = list(positions)
+        self.error = None
+    
+    def get_account(self):
+        if self.error:
+            raise self.error
+        return self.account
+    
+    def get_positions(self):
+        if self.error:
+            raise self.error
+        return self.positions
+
 
 class TestCalculatePositionSize(unittest.TestCase):
     """Test position sizing calculations."""
     
-    @patch('src.tools.execution_tools.settings')
-    def test_normal_position_size(self, mock_settings):
-        """Test position size calculation with normal values."""
-        mock_settings.max_risk_per_trade = 0.02  # 2%
-        
-        result = ExecutionTools.calculate_position_size(
-            signal='BUY',
-            current_price=100.0,
-            atr=2.0,
-            account_equity=10000.0
-        )
-        
-        # risk_amount = 10000 * 0.02 = 200
-        # shares = 200 / 2.0 = 100
-        self.assertEqual(result['shares'], 100)
-        self.assertEqual(result['total_cost'], 10000.0)  # 100 shares * $100
-        self.assertEqual(result['risk_amount'], 200.0)
-        self.assertEqual(result['price_per_share'], 100.0)
-        self.assertEqual(result['atr_used'], 2.0)
+    def setUp(self):
+        # Patch settings once per test; each test overrides only the fields it needs
+        patcher = patch('src.tools.execution_tools.settings')
+        self.mock_settings = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_settings.max_risk_per_trade = 0.02  # 2%
     
-    @patch('src.tools.execution_tools.settings')
-    def test_zero_atr_fallback(self, mock_settings):
-        """Test fallback when ATR is zero."""
-        mock_settings.max_risk_per_trade = 0.02
-        
-        result = ExecutionTools.calculate_position_size(
-            signal='BUY',
-            current_price=50.0,
-            atr=0.0,  # Zero ATR
-            account_equity=10000.0
-        )
-        
-        # Falls back to 1% of equity / price
-        # shares = (10000 * 0.01) / 50 = 2
-        self.assertEqual(result['shares'], 2)
-        self.assertIn('atr_used', result)
+    def test_position_size_cases(self):
+        """Test position size calculation across risk, price and volatility inputs."""
+        for case in _POSITION_SIZE_CASES:
+            with self.subTest(case=case['name']):
+                self.mock_settings.max_risk_per_trade = case['risk']
+                
+                result = ExecutionTools.calculate_position_size(
+                    signal='BUY',
+                    current_price=case['price'],
+                    atr=case['atr'],
+                    account_equity=case['equity']
+                )
+                
+                for key, expected in case['expected'].items():
+                    self.assertEqual(result[key], expected, key)
     
-    @patch('src.tools.execution_tools.settings')
-    def test_minimum_one_share(self, mock_settings):
-        """Test that position size is at least 1 share."""
-        mock_settings.max_risk_per_trade = 0.001  # Very small risk
-        
-        result = ExecutionTools.calculate_position_size(
-            signal='BUY',
-            current_price=10000.0,  # Very expensive stock
-            atr=100.0,
-            account_equity=1000.0
-        )
-        
-        # Even with small account, should get at least 1 share
-        self.assertGreaterEqual(result['shares'], 1)
-    
-    @patch('src.tools.execution_tools.settings')
-    def test_high_volatility_reduces_shares(self, mock_settings):
+    def test_high_volatility_reduces_shares(self):
         """Test that higher ATR (volatility) reduces position size."""
-        mock_settings.max_risk_per_trade = 0.02
-        
         # Low volatility
         result_low = ExecutionTools.calculate_position_size(
             signal='BUY',
@@ -88,11 +111,8 @@ class TestCalculatePositionSize(unittest.TestCase):
         # Higher ATR should result in fewer shares
         self.assertGreater(result_low['shares'], result_high['shares'])
     
-    @patch('src.tools.execution_tools.settings')
-    def test_error_handling(self, mock_settings):
+    def test_error_handling(self):
         """Test error handling in position size calculation."""
-        mock_settings.max_risk_per_trade = 0.02
-        
         # Invalid inputs (e.g., negative values shouldn't crash)
         result = ExecutionTools.calculate_position_size(
             signal='BUY',
@@ -109,23 +129,23 @@ class TestCalculatePositionSize(unittest.TestCase):
 class TestCheckPortfolioConstraints(unittest.TestCase):
     """Test portfolio constraint checks."""
     
-    @patch('src.tools.execution_tools.settings')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_all_constraints_pass(self, mock_alpaca, mock_settings):
+    def setUp(self):
+        settings_patcher = patch('src.tools.execution_tools.settings')
+        self.mock_settings = settings_patcher.start()
+        self.addCleanup(settings_patcher.stop)
+        self.mock_settings.max_open_positions = 5
+        self.mock_settings.daily_loss_limit = 0.05  # 5%
+        
+        # No losses, trading allowed, no open positions
+        self.fake_alpaca = _FakeAlpaca()
+        alpaca_patcher = patch('src.tools.execution_tools.alpaca_manager', self.fake_alpaca)
+        alpaca_patcher.start()
+        self.addCleanup(alpaca_patcher.stop)
+    
+    def test_all_constraints_pass(self):
         """Test when all portfolio constraints pass."""
-        mock_settings.max_open_positions = 5
-        mock_settings.daily_loss_limit = 0.05  # 5%
-        
-        # Mock account with no losses
-        mock_alpaca.get_account.return_value = {
-            'equity': '10000.00',
-            'last_equity': '10000.00',
-            'buying_power': '5000.00',
-            'trading_blocked': False
-        }
-        
         # Mock 2 open positions (under limit of 5)
-        mock_alpaca.get_positions.return_value = [
+        self.fake_alpaca.positions = [
             {'symbol': 'SPY', 'qty': '10'},
             {'symbol': 'QQQ', 'qty': '5'}
         ]
@@ -137,22 +157,12 @@ class TestCheckPortfolioConstraints(unittest.TestCase):
         self.assertTrue(result['checks']['daily_loss']['passed'])
         self.assertTrue(result['checks']['trading_status']['passed'])
     
-    @patch('src.tools.execution_tools.settings')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_max_positions_exceeded(self, mock_alpaca, mock_settings):
+    def test_max_positions_exceeded(self):
         """Test when max positions limit is exceeded."""
-        mock_settings.max_open_positions = 3
-        mock_settings.daily_loss_limit = 0.05
-        
-        mock_alpaca.get_account.return_value = {
-            'equity': '10000.00',
-            'last_equity': '10000.00',
-            'buying_power': '5000.00',
-            'trading_blocked': False
-        }
+        self.mock_settings.max_open_positions = 3
         
         # Mock 4 positions (exceeds limit of 3)
-        mock_alpaca.get_positions.return_value = [
+        self.fake_alpaca.positions = [
             {'symbol': 'SPY'},
             {'symbol': 'QQQ'},
             {'symbol': 'AAPL'},
@@ -165,22 +175,10 @@ class TestCheckPortfolioConstraints(unittest.TestCase):
         self.assertFalse(result['checks']['max_positions']['passed'])
         self.assertEqual(result['checks']['max_positions']['current'], 4)
     
-    @patch('src.tools.execution_tools.settings')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_daily_loss_limit_exceeded(self, mock_alpaca, mock_settings):
+    def test_daily_loss_limit_exceeded(self):
         """Test when daily loss limit is exceeded."""
-        mock_settings.max_open_positions = 5
-        mock_settings.daily_loss_limit = 0.05  # 5% limit
-        
-        # Mock account with 6% loss
-        mock_alpaca.get_account.return_value = {
-            'equity': '9400.00',      # Current equity
-            'last_equity': '10000.00', # Yesterday's equity
-            'buying_power': '5000.00',
-            'trading_blocked': False
-        }
-        
-        mock_alpaca.get_positions.return_value = []
+        # Mock account with 6% loss against yesterday's 10000.00
+        self.fake_alpaca.account['equity'] = '9400.00'
         
         result = ExecutionTools.check_portfolio_constraints()
         
@@ -189,22 +187,13 @@ class TestCheckPortfolioConstraints(unittest.TestCase):
         # Loss: (9400 / 10000) - 1 = -0.06 = -6%
         self.assertLess(result['checks']['daily_loss']['current_loss_pct'], -5.0)
     
-    @patch('src.tools.execution_tools.settings')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_trading_blocked(self, mock_alpaca, mock_settings):
+    def test_trading_blocked(self):
         """Test when trading is blocked."""
-        mock_settings.max_open_positions = 5
-        mock_settings.daily_loss_limit = 0.05
-        
         # Mock account with trading blocked
-        mock_alpaca.get_account.return_value = {
-            'equity': '10000.00',
-            'last_equity': '10000.00',
-            'buying_power': '0.00',
-            'trading_blocked': True  # Trading blocked!
-        }
-        
-        mock_alpaca.get_positions.return_value = []
+        self.fake_alpaca.account.update(
+            buying_power='0.00',
+            trading_blocked=True
+        )
         
         result = ExecutionTools.check_portfolio_constraints()
         
@@ -212,33 +201,20 @@ class TestCheckPortfolioConstraints(unittest.TestCase):
         self.assertFalse(result['checks']['trading_status']['passed'])
         self.assertTrue(result['checks']['trading_status']['blocked'])
     
-    @patch('src.tools.execution_tools.settings')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_missing_last_equity(self, mock_alpaca, mock_settings):
+    def test_missing_last_equity(self):
         """Test handling of missing last_equity field."""
-        mock_settings.max_open_positions = 5
-        mock_settings.daily_loss_limit = 0.05
-        
         # Mock account with missing last_equity
-        mock_alpaca.get_account.return_value = {
-            'equity': '10000.00',
-            'last_equity': None,  # Missing value
-            'buying_power': '5000.00',
-            'trading_blocked': False
-        }
-        
-        mock_alpaca.get_positions.return_value = []
+        self.fake_alpaca.account['last_equity'] = None
         
         result = ExecutionTools.check_portfolio_constraints()
         
         # Should still approve (skips loss check)
         self.assertTrue(result['approved'])
     
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_error_handling(self, mock_alpaca):
+    def test_error_handling(self):
         """Test error handling when API calls fail."""
         # Mock API failure
-        mock_alpaca.get_account.side_effect = Exception("API Error")
+        self.fake_alpaca.error = Exception("API Error")
         
         result = ExecutionTools.check_portfolio_constraints()
         
@@ -249,19 +225,20 @@ class TestCheckPortfolioConstraints(unittest.TestCase):
 class TestPlaceOrder(unittest.TestCase):
     """Test order placement functionality."""
     
-    @patch('src.tools.execution_tools.ExecutionTools.check_portfolio_constraints')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_successful_buy_order(self, mock_alpaca, mock_constraints):
+    def setUp(self):
+        constraints_patcher = patch.object(ExecutionTools, 'check_portfolio_constraints')
+        self.mock_constraints = constraints_patcher.start()
+        self.addCleanup(constraints_patcher.stop)
+        self.mock_constraints.return_value = dict(_APPROVED_CONSTRAINTS)
+        
+        alpaca_patcher = patch('src.tools.execution_tools.alpaca_manager')
+        self.mock_alpaca = alpaca_patcher.start()
+        self.addCleanup(alpaca_patcher.stop)
+    
+    def test_successful_buy_order(self):
         """Test successful BUY order placement."""
-        # Mock constraints passing
-        mock_constraints.return_value = {
-            'approved': True,
-            'checks': {},
-            'account_info': {'equity': '10000', 'buying_power': '5000'}
-        }
-        
         # Mock order placement
-        mock_alpaca.place_market_order.return_value = {
+        self.mock_alpaca.place_market_order.return_value = {
             'status': 'submitted',
             'order_id': 'order123',
             'symbol': 'SPY',
@@ -276,23 +253,15 @@ class TestPlaceOrder(unittest.TestCase):
         self.assertEqual(result['order']['order_id'], 'order123')
         
         # Verify order was placed correctly
-        mock_alpaca.place_market_order.assert_called_once_with(
+        self.mock_alpaca.place_market_order.assert_called_once_with(
             symbol='SPY',
             qty=10,
             side='BUY'
         )
     
-    @patch('src.tools.execution_tools.ExecutionTools.check_portfolio_constraints')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_successful_sell_order(self, mock_alpaca, mock_constraints):
+    def test_successful_sell_order(self):
         """Test successful SELL order placement."""
-        mock_constraints.return_value = {
-            'approved': True,
-            'checks': {},
-            'account_info': {'equity': '10000', 'buying_power': '5000'}
-        }
-        
-        mock_alpaca.place_market_order.return_value = {
+        self.mock_alpaca.place_market_order.return_value = {
             'status': 'submitted',
             'order_id': 'order456',
             'symbol': 'AAPL',
@@ -305,11 +274,10 @@ class TestPlaceOrder(unittest.TestCase):
         self.assertTrue(result['success'])
         self.assertEqual(result['order']['side'], 'SELL')
     
-    @patch('src.tools.execution_tools.ExecutionTools.check_portfolio_constraints')
-    def test_order_rejected_by_constraints(self, mock_constraints):
+    def test_order_rejected_by_constraints(self):
         """Test order rejected when constraints fail."""
         # Mock constraints failing
-        mock_constraints.return_value = {
+        self.mock_constraints.return_value = {
             'approved': False,
             'checks': {'max_positions': {'passed': False}}
         }
@@ -335,14 +303,10 @@ class TestPlaceOrder(unittest.TestCase):
         self.assertFalse(result['success'])
         self.assertIn('error', result)
     
-    @patch('src.tools.execution_tools.ExecutionTools.check_portfolio_constraints')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_dry_run_mode(self, mock_alpaca, mock_constraints):
+    def test_dry_run_mode(self):
         """Test order in DRY_RUN mode."""
-        mock_constraints.return_value = {'approved': True}
-        
         # Mock dry run response
-        mock_alpaca.place_market_order.return_value = {
+        self.mock_alpaca.place_market_order.return_value = {
             'status': 'dry_run',
             'order_id': 'dry_run_123',
             'symbol': 'SPY',
@@ -355,14 +319,10 @@ class TestPlaceOrder(unittest.TestCase):
         self.assertTrue(result['success'])
         self.assertEqual(result['order']['status'], 'dry_run')
     
-    @patch('src.tools.execution_tools.ExecutionTools.check_portfolio_constraints')
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_order_placement_failure(self, mock_alpaca, mock_constraints):
+    def test_order_placement_failure(self):
         """Test handling of order placement failure."""
-        mock_constraints.return_value = {'approved': True}
-        
         # Mock order failure
-        mock_alpaca.place_market_order.return_value = {
+        self.mock_alpaca.place_market_order.return_value = {
             'status': 'rejected',
             'reason': 'Insufficient buying power'
         }
@@ -376,11 +336,16 @@ class TestPlaceOrder(unittest.TestCase):
 class TestGetPositionForSymbol(unittest.TestCase):
     """Test position retrieval."""
     
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_get_existing_position(self, mock_alpaca):
+    def setUp(self):
+        self.fake_alpaca = _FakeAlpaca()
+        patcher = patch('src.tools.execution_tools.alpaca_manager', self.fake_alpaca)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_get_existing_position(self):
         """Test getting an existing position."""
         # Mock positions list
-        mock_alpaca.get_positions.return_value = [
+        self.fake_alpaca.positions = [
             {'symbol': 'SPY', 'qty': '10', 'avg_entry_price': '450.00'},
             {'symbol': 'QQQ', 'qty': '5', 'avg_entry_price': '380.00'},
             {'symbol': 'AAPL', 'qty': '20', 'avg_entry_price': '175.00'}
@@ -392,10 +357,9 @@ class TestGetPositionForSymbol(unittest.TestCase):
         self.assertEqual(result['symbol'], 'QQQ')
         self.assertEqual(result['qty'], '5')
     
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_get_nonexistent_position(self, mock_alpaca):
+    def test_get_nonexistent_position(self):
         """Test getting a non-existent position."""
-        mock_alpaca.get_positions.return_value = [
+        self.fake_alpaca.positions = [
             {'symbol': 'SPY', 'qty': '10'},
             {'symbol': 'QQQ', 'qty': '5'}
         ]
@@ -404,19 +368,17 @@ class TestGetPositionForSymbol(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_no_positions(self, mock_alpaca):
+    def test_no_positions(self):
         """Test when there are no open positions."""
-        mock_alpaca.get_positions.return_value = []
+        self.fake_alpaca.positions = []
         
         result = ExecutionTools.get_position_for_symbol('SPY')
         
         self.assertIsNone(result)
     
-    @patch('src.tools.execution_tools.alpaca_manager')
-    def test_error_handling(self, mock_alpaca):
+    def test_error_handling(self):
         """Test error handling when API fails."""
-        mock_alpaca.get_positions.side_effect = Exception("API Error")
+        self.fake_alpaca.error = Exception("API Error")
         
         result = ExecutionTools.get_position_for_symbol('SPY')
         
@@ -428,8 +390,6 @@ class TestExecutionToolsGlobalInstance(unittest.TestCase):
     
     def test_global_instance_exists(self):
         """Test that global instance is created."""
-        from src.tools.execution_tools import execution_tools
-        
         self.assertIsNotNone(execution_tools)
         self.assertIsInstance(execution_tools, ExecutionTools)
 
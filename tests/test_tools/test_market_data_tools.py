@@ -5,26 +5,29 @@ from datetime import datetime, timedelta
 
 class TestMarketDataTools(unittest.TestCase):
 
-    def test_validate_data_completeness_ambiguous_truth_error(self):
-        """
-        Verify that validate_data_completeness handles non-uniform time differences
-        without raising the "ambiguous truth value" error.
-        """
-        # Arrange
-        # Create a DataFrame with a non-uniform time difference, which will cause
-        # the mode() function to return a Series of two values.
+    @classmethod
+    def setUpClass(cls):
+        # Built once and only read by the tests. A fixed base time keeps the index
+        # deterministic; the 2 minute gap makes the index deltas non-uniform, so
+        # mode() returns a Series of two values.
+        base = datetime(2024, 1, 1)
         timestamps = [
-            datetime.now() - timedelta(minutes=3),
-            datetime.now() - timedelta(minutes=2),
-            datetime.now() - timedelta(minutes=0), # 2 minute gap
+            base - timedelta(minutes=3),
+            base - timedelta(minutes=2),
+            base,  # 2 minute gap
         ]
         data = {'open': [100, 101, 102], 'high': [102, 103, 104], 'low': [99, 100, 101],
                 'close': [101, 102, 103], 'volume': [1000, 1100, 1200]}
-        df = pd.DataFrame(data, index=pd.to_datetime(timestamps))
+        cls.gap_df = pd.DataFrame(data, index=pd.to_datetime(timestamps))
 
+    def test_validate_data_completeness_ambiguous_truth_error(self):
+        """
+        Verify that validate_data_completeness handles non-uniform time differences
+        without raising the "ambiguous truth value" error.
+        """
         # Act
         # This should not raise an exception.
-        result = MarketDataTools.validate_data_completeness(df)
+        result = MarketDataTools.validate_data_completeness(self.gap_df)
 
         # Assert
         # The validation should identify the time series gap.
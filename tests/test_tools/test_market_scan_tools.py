@@ -0,0 +1,304 @@
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from src.tools.analysis_tools import TechnicalAnalysisTools
+from src.tools.bars_cache import BarsCache
+from src.tools.market_scan_tools import MarketScanTools
+
+
+def _bars(closes):
+    """Small OHLCV frame with the given closing prices."""
+    return pd.DataFrame({
+        'open': closes, 'high': closes, 'low': closes, 'close': closes,
+        'volume': [1000] * len(closes)
+    }, index=pd.date_range('2025-01-01', periods=len(closes), freq='D'))
+
+
+class TestFetchUniverseData(unittest.TestCase):
+
+    def setUp(self):
+        # Point the bars cache at an empty temp dir so results never leak between tests
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = BarsCache(cache_dir=Path(self.temp_dir))
+        patcher = patch('src.tools.market_scan_tools.bars_cache', self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch('src.tools.market_scan_tools.alpaca_manager')
+    def test_one_batched_request_per_asset_class(self, mock_alpaca):
+        """
+        Verify that auto-detected symbols are grouped so each asset class is fetched once.
+        """
+        # Arrange
+        def fetch_batch(symbols, timeframe, limit, asset_class):
+            return {symbol: _bars([1.0, 2.0]) for symbol in symbols}
+
+        mock_alpaca.fetch_historical_bars_batch.side_effect = fetch_batch
+
+        # Act
+        data = MarketScanTools.fetch_universe_data(
+            ['AAPL', 'BTC/USD', 'MSFT', 'ETH/USD'], timeframe='1Day', limit=2
+        )
+
+        # Assert
+        self.assertEqual(set(data), {'AAPL', 'BTC/USD', 'MSFT', 'ETH/USD'})
+        requested = {
+            c.kwargs['asset_class']: c.kwargs['symbols']
+            for c in mock_alpaca.fetch_historical_bars_batch.call_args_list
+        }
+        self.assertEqual(requested, {'US_EQUITY': ['AAPL', 'MSFT'], 'CRYPTO': ['BTC/USD', 'ETH/USD']})
+
+    @patch('src.tools.market_scan_tools.alpaca_manager')
+    def test_missing_and_failed_symbols_are_dropped(self, mock_alpaca):
+        """
+        Verify that empty results are omitted and a failing batch does not abort the others.
+        """
+        # Arrange
+        def fetch_batch(symbols, timeframe, limit, asset_class):
+            if asset_class == 'CRYPTO':
+                raise ConnectionError("network down")
+            return {'AAPL': _bars([1.0]), 'MSFT': _bars([])}
+
+        mock_alpaca.fetch_historical_bars_batch.side_effect = fetch_batch
+
+        # Act
+        data = MarketScanTools.fetch_universe_data(['AAPL', 'MSFT', 'GOOGL', 'BTC/USD'])
+
+        # Assert
+        self.assertEqual(list(data), ['AAPL'])
+
+    @patch('src.tools.market_scan_tools.alpaca_manager')
+    def test_asset_class_groups_fetched_concurrently(self, mock_alpaca):
+        """
+        Verify that a mixed universe issues its per-class requests in parallel.
+        """
+        # Arrange: each request waits for the other, so sequential fetching would time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_batch(symbols, timeframe, limit, asset_class):
+            barrier.wait()
+            return {symbol: _bars([1.0, 2.0]) for symbol in symbols}
+
+        mock_alpaca.fetch_historical_bars_batch.side_effect = fetch_batch
+
+        # Act
+        data = MarketScanTools.fetch_universe_data(['AAPL', 'BTC/USD', 'ETH/USD'], '1Hour', 2)
+
+        # Assert
+        self.assertEqual(set(data), {'AAPL', 'BTC/USD', 'ETH/USD'})
+        self.assertEqual(mock_alpaca.fetch_historical_bars_batch.call_count, 2)
+
+    @patch('src.tools.market_scan_tools.alpaca_manager')
+    def test_cached_symbols_skip_the_request(self, mock_alpaca):
+        """
+        Verify that a second fetch only requests symbols missing from the cache.
+        """
+        # Arrange
+        mock_alpaca.fetch_historical_bars_batch.side_effect = (
+            lambda symbols, timeframe, limit, asset_class: {s: _bars([1.0, 2.0]) for s in symbols}
+        )
+        MarketScanTools.fetch_universe_data(['BTC/USD', 'ETH/USD'], '1Day', 2, 'CRYPTO', use_cache=True)
+        mock_alpaca.fetch_historical_bars_batch.reset_mock()
+
+        # Act
+        data = MarketScanTools.fetch_universe_data(
+            ['BTC/USD', 'ETH/USD', 'SOL/USD'], '1Day', 2, 'CRYPTO', use_cache=True
+        )
+
+        # Assert
+        self.assertEqual(set(data), {'BTC/USD', 'ETH/USD', 'SOL/USD'})
+        mock_alpaca.fetch_historical_bars_batch.assert_called_once_with(
+            symbols=['SOL/USD'], timeframe='1Day', limit=2, asset_class='CRYPTO'
+        )
+
+    @patch('src.tools.market_scan_tools.alpaca_manager')
+    def test_cache_bypassed_by_default(self, mock_alpaca):
+        """
+        Verify that live callers always refetch and never write to the bars cache.
+        """
+        # Arrange
+        mock_alpaca.fetch_historical_bars_batch.side_effect = (
+            lambda symbols, timeframe, limit, asset_class: {s: _bars([1.0, 2.0]) for s in symbols}
+        )
+
+        # Act
+        MarketScanTools.fetch_universe_data(['BTC/USD'], '1Day', 2, 'CRYPTO')
+        MarketScanTools.fetch_universe_data(['BTC/USD'], '1Day', 2, 'CRYPTO')
+
+        # Assert
+        self.assertEqual(mock_alpaca.fetch_historical_bars_batch.call_count, 2)
+        self.assertEqual(list(Path(self.temp_dir).iterdir()), [])
+
+class TestAnalyzeTechnicalSetup(unittest.TestCase):
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_matches_per_symbol_indicators(self, mock_fetch):
+        """
+        Verify the universe-wide computation equals indicators computed symbol by symbol.
+        """
+        # Arrange: different lengths exercise the front padding of shorter series
+        rng = np.random.default_rng(0)
+        data = {
+            'AAA': _bars(list(100 + rng.normal(0, 2, 100).cumsum())),
+            'BBB': _bars(list(50 + rng.normal(0, 1, 60).cumsum())),
+            'CCC': _bars([1.0] * 30)
+        }
+        mock_fetch.return_value = data
+
+        # Act
+        results = MarketScanTools.analyze_technical_setup(['AAA', 'CCC', 'MISSING', 'BBB'])
+
+        # Assert
+        self.assertEqual(
+            [(r['symbol'], r['status']) for r in results],
+            [('AAA', 'success'), ('CCC', 'insufficient_data'), ('MISSING', 'no_data'), ('BBB', 'success')]
+        )
+        mock_fetch.assert_called_once()
+        for result in (results[0], results[3]):
+            df = data[result['symbol']]
+            macd_line, _, _ = TechnicalAnalysisTools.calculate_macd(df)
+            expected = {
+                'rsi': TechnicalAnalysisTools.calculate_rsi(df, 14).iloc[-1],
+                'macd': macd_line.iloc[-1],
+                'sma_20': TechnicalAnalysisTools.calculate_sma(df, 20).iloc[-1],
+                'sma_50': TechnicalAnalysisTools.calculate_sma(df, 50).iloc[-1],
+                'price': df['close'].iloc[-1]
+            }
+            for name, value in expected.items():
+                self.assertAlmostEqual(result['indicators'][name], value, places=9)
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_malformed_bars_marked_error(self, mock_fetch):
+        """
+        Verify that a symbol without closes is reported as an error and the rest still score.
+        """
+        rng = np.random.default_rng(2)
+        mock_fetch.return_value = {
+            'AAA': _bars(list(100 + rng.normal(0, 2, 60).cumsum())),
+            'BAD': _bars([1.0] * 60).drop(columns='close')
+        }
+
+        results = MarketScanTools.analyze_technical_setup(['BAD', 'AAA'])
+
+        self.assertEqual([r['status'] for r in results], ['error', 'success'])
+        self.assertIn('close', results[0]['error'])
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_failed_universe_pass_falls_back_per_symbol(self, mock_fetch):
+        """
+        Verify that an indicator failure on one series only fails that symbol.
+        """
+        rng = np.random.default_rng(3)
+        mock_fetch.return_value = {
+            'AAA': _bars(list(100 + rng.normal(0, 2, 60).cumsum())),
+            'BAD': _bars(list(50 + rng.normal(0, 1, 60).cumsum()))
+        }
+        calculate_rsi = TechnicalAnalysisTools.calculate_rsi
+
+        def rsi_failing_on_bad(df, period=14):
+            if 'BAD' in df['close'].columns:
+                raise ValueError("bad series")
+            return calculate_rsi(df, period)
+
+        with patch.object(TechnicalAnalysisTools, 'calculate_rsi', side_effect=rsi_failing_on_bad):
+            results = MarketScanTools.analyze_technical_setup(['AAA', 'BAD'])
+
+        self.assertEqual([r['status'] for r in results], ['success', 'error'])
+        self.assertEqual(results[1]['error'], 'bad series')
+
+
+class TestUniverseArrays(unittest.TestCase):
+
+    @patch.object(MarketScanTools, 'fetch_universe_data', return_value={})
+    def test_analyzers_forward_use_cache(self, mock_fetch):
+        """
+        Verify each analyze_* tool passes use_cache through to the universe fetch.
+        """
+        for analyzer in (
+            MarketScanTools.analyze_volatility,
+            MarketScanTools.analyze_technical_setup,
+            MarketScanTools.filter_by_liquidity
+        ):
+            with self.subTest(analyzer=analyzer.__name__):
+                mock_fetch.reset_mock()
+                analyzer(['AAPL'], use_cache=True)
+                self.assertIs(mock_fetch.call_args.kwargs['use_cache'], True)
+
+                mock_fetch.reset_mock()
+                analyzer(['AAPL'])
+                self.assertIs(mock_fetch.call_args.kwargs['use_cache'], False)
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_frames_converted_to_float_arrays(self, mock_fetch):
+        """
+        Verify each fetched frame becomes a dict of float64 arrays keyed by OHLCV field.
+        """
+        mock_fetch.return_value = {'AAPL': _bars([1.0, 2.0, 3.0])}
+
+        bars = MarketScanTools.fetch_universe_arrays(['AAPL', 'MSFT'])
+
+        self.assertEqual(list(bars), ['AAPL'])
+        self.assertEqual(set(bars['AAPL']), {'open', 'high', 'low', 'close', 'volume'})
+        self.assertEqual(bars['AAPL']['close'][-1], 3.0)
+        self.assertEqual(bars['AAPL']['volume'].dtype, np.float64)
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_analyze_volatility_on_arrays(self, mock_fetch):
+        """
+        Verify ATR scoring from arrays matches the DataFrame ATR helper.
+        """
+        rng = np.random.default_rng(1)
+        df = _bars(list(100 + rng.normal(0, 1, 40).cumsum()))
+        df['high'] += 1.0
+        df['low'] -= 1.0
+        mock_fetch.return_value = {'AAPL': df, 'TINY': _bars([1.0] * 5)}
+
+        results = MarketScanTools.analyze_volatility(['AAPL', 'TINY', 'MISSING'])
+
+        atr = TechnicalAnalysisTools.calculate_atr(df, 14)
+        self.assertEqual([r['status'] for r in results], ['success', 'insufficient_data', 'no_data'])
+        self.assertAlmostEqual(results[0]['atr'], atr.iloc[-1], places=9)
+        self.assertAlmostEqual(results[0]['atr_mean'], atr.mean(), places=9)
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_filter_by_liquidity_on_arrays(self, mock_fetch):
+        """
+        Verify liquidity is judged from the mean of the volume array.
+        """
+        no_volume = _bars([1.0, 2.0]).drop(columns='volume')
+        mock_fetch.return_value = {'AAPL': _bars([1.0, 2.0]), 'FX': no_volume}
+
+        results = MarketScanTools.filter_by_liquidity(['AAPL', 'FX'], min_volume=500)
+
+        self.assertEqual(results[0]['avg_volume'], 1000.0)
+        self.assertTrue(results[0]['is_liquid'])
+        self.assertEqual(results[1]['status'], 'no_volume_data')
+
+    @patch.object(MarketScanTools, 'fetch_universe_data')
+    def test_prefetched_bars_skip_the_fetch(self, mock_fetch):
+        """
+        Verify analyzers given bars= analyze those frames without fetching.
+        """
+        bars = {'AAPL': _bars([1.0, 2.0]), 'MSFT': _bars([1.0] * 60)}
+
+        liquidity = MarketScanTools.filter_by_liquidity(['AAPL'], min_volume=500, bars=bars)
+        volatility = MarketScanTools.analyze_volatility(['AAPL', 'MISSING'], bars=bars)
+        technical = MarketScanTools.analyze_technical_setup(['MSFT'], bars=bars)
+
+        mock_fetch.assert_not_called()
+        self.assertTrue(liquidity[0]['is_liquid'])
+        self.assertEqual([r['status'] for r in volatility], ['insufficient_data', 'no_data'])
+        self.assertEqual(technical[0]['status'], 'success')
+
+if __name__ == '__main__':
+    unittest.main()
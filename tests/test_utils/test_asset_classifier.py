@@ -3,105 +3,117 @@
 Tests 50+ symbol patterns across US equities, crypto, and forex.
 """
 
+from functools import cache
+
 import pytest
 from src.utils.asset_classifier import AssetClassifier
 
 
+# US Equity Test Cases
+US_EQUITY_SYMBOLS = [
+    "AAPL", "SPY", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA",
+    "JPM", "V", "JNJ", "WMT", "PG", "MA", "UNH", "HD", "BAC", "XOM",
+    "A", "BB", "C", "D", "F", "GM", "T", "VZ"  # 1-2 letter symbols
+]
+
+# Crypto Test Cases (with slash)
+CRYPTO_SLASH_SYMBOLS = [
+    "BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "DOT/USD",
+    "MATIC/USD", "AVAX/USD", "LINK/USD", "UNI/USD", "ATOM/USD",
+    "BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"
+]
+
+# Crypto Test Cases (no slash)
+CRYPTO_NO_SLASH_SYMBOLS = [
+    "BTCUSD", "ETHUSD", "SOLUSD", "ADAUSD", "DOTUSD",
+    "MATICUSD", "AVAXUSD", "LINKUSD", "UNIUSD", "ATOMUSD",
+    "BTCUSDT", "ETHUSDT", "SOLUSDT", "ADAUSDT"
+]
+
+# Forex Test Cases (with slash)
+FOREX_SLASH_SYMBOLS = [
+    "EUR/USD", "GBP/USD", "USD/JPY", "AUD/USD", "USD/CAD",
+    "NZD/USD", "EUR/GBP", "GBP/JPY", "EUR/JPY", "AUD/JPY"
+]
+
+# Forex Test Cases (no slash)
+FOREX_NO_SLASH_SYMBOLS = [
+    "EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD",
+    "NZDUSD", "EURGBP", "GBPJPY", "EURJPY", "AUDJPY"
+]
+
+# Invalid symbols
+INVALID_SYMBOLS = [
+    "", "   ", "123", "TOOLONG", "A1B2C3",
+    "BTC-USD", "BTC_USD", "?AAPL", "AAPL!", "A/B", "@#$%"
+]
+
+
+@cache
+def _classify(symbol):
+    """Classify each valid symbol once per session; tests only read the result."""
+    return AssetClassifier.classify(symbol)
+
+
+# Dozens of sub-millisecond cases: under --dist loadgroup they share one worker
+@pytest.mark.asset_classifier
+@pytest.mark.xdist_group("asset_classifier")
 class TestAssetClassifier:
     """Test suite for AssetClassifier."""
     
-    # US Equity Test Cases
-    US_EQUITY_SYMBOLS = [
-        "AAPL", "SPY", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA",
-        "JPM", "V", "JNJ", "WMT", "PG", "MA", "UNH", "HD", "BAC", "XOM",
-        "A", "BB", "C", "D", "F", "GM", "T", "VZ"  # 1-2 letter symbols
-    ]
-    
-    # Crypto Test Cases (with slash)
-    CRYPTO_SLASH_SYMBOLS = [
-        "BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "DOT/USD",
-        "MATIC/USD", "AVAX/USD", "LINK/USD", "UNI/USD", "ATOM/USD",
-        "BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT"
-    ]
-    
-    # Crypto Test Cases (no slash)
-    CRYPTO_NO_SLASH_SYMBOLS = [
-        "BTCUSD", "ETHUSD", "SOLUSD", "ADAUSD", "DOTUSD",
-        "MATICUSD", "AVAXUSD", "LINKUSD", "UNIUSD", "ATOMUSD",
-        "BTCUSDT", "ETHUSDT", "SOLUSDT", "ADAUSDT"
-    ]
-    
-    # Forex Test Cases (with slash)
-    FOREX_SLASH_SYMBOLS = [
-        "EUR/USD", "GBP/USD", "USD/JPY", "AUD/USD", "USD/CAD",
-        "NZD/USD", "EUR/GBP", "GBP/JPY", "EUR/JPY", "AUD/JPY"
-    ]
-    
-    # Forex Test Cases (no slash)
-    FOREX_NO_SLASH_SYMBOLS = [
-        "EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD",
-        "NZDUSD", "EURGBP", "GBPJPY", "EURJPY", "AUDJPY"
-    ]
-    
-    # Invalid symbols
-    INVALID_SYMBOLS = [
-        "", "   ", "123", "TOOLONG", "A1B2C3",
-        "BTC-USD", "BTC_USD", "?AAPL", "AAPL!", "A/B", "@#$%"
-    ]
-    
-    def test_us_equity_classification(self):
+    @pytest.mark.parametrize("symbol", US_EQUITY_SYMBOLS)
+    def test_us_equity_classification(self, symbol):
         """Test US equity symbol classification."""
-        for symbol in self.US_EQUITY_SYMBOLS:
-            result = AssetClassifier.classify(symbol)
-            assert result["type"] == "US_EQUITY", f"Failed for {symbol}"
-            assert result["client_type"] == "stock"
-            assert result["markets"] == ["US_EQUITY"]
-            assert result["trading_hours"] == "6.5h/day"
-            assert result["symbol"] == symbol.upper()
+        result = _classify(symbol)
+        assert result["type"] == "US_EQUITY"
+        assert result["client_type"] == "stock"
+        assert result["markets"] == ["US_EQUITY"]
+        assert result["trading_hours"] == "6.5h/day"
+        assert result["symbol"] == symbol.upper()
     
-    def test_crypto_slash_classification(self):
+    @pytest.mark.parametrize("symbol", CRYPTO_SLASH_SYMBOLS)
+    def test_crypto_slash_classification(self, symbol):
         """Test crypto symbols with slash (BTC/USD format)."""
-        for symbol in self.CRYPTO_SLASH_SYMBOLS:
-            result = AssetClassifier.classify(symbol)
-            assert result["type"] == "CRYPTO", f"Failed for {symbol}"
-            assert result["client_type"] == "crypto"
-            assert result["markets"] == ["CRYPTO"]
-            assert result["trading_hours"] == "24/7"
-            assert result["symbol"] == symbol.upper()
+        result = _classify(symbol)
+        assert result["type"] == "CRYPTO"
+        assert result["client_type"] == "crypto"
+        assert result["markets"] == ["CRYPTO"]
+        assert result["trading_hours"] == "24/7"
+        assert result["symbol"] == symbol.upper()
     
-    def test_crypto_no_slash_classification(self):
+    @pytest.mark.parametrize("symbol", CRYPTO_NO_SLASH_SYMBOLS)
+    def test_crypto_no_slash_classification(self, symbol):
         """Test crypto symbols without slash (BTCUSD format)."""
-        for symbol in self.CRYPTO_NO_SLASH_SYMBOLS:
-            result = AssetClassifier.classify(symbol)
-            assert result["type"] == "CRYPTO", f"Failed for {symbol}"
-            assert result["client_type"] == "crypto"
-            assert result["markets"] == ["CRYPTO"]
-            assert result["trading_hours"] == "24/7"
+        result = _classify(symbol)
+        assert result["type"] == "CRYPTO"
+        assert result["client_type"] == "crypto"
+        assert result["markets"] == ["CRYPTO"]
+        assert result["trading_hours"] == "24/7"
     
-    def test_forex_slash_classification(self):
+    @pytest.mark.parametrize("symbol", FOREX_SLASH_SYMBOLS)
+    def test_forex_slash_classification(self, symbol):
         """Test forex pairs with slash (EUR/USD format)."""
-        for symbol in self.FOREX_SLASH_SYMBOLS:
-            result = AssetClassifier.classify(symbol)
-            assert result["type"] == "FOREX", f"Failed for {symbol}"
-            assert result["client_type"] == "forex"
-            assert result["markets"] == ["FOREX"]
-            assert result["trading_hours"] == "23/5"
-            assert result["symbol"] == symbol.upper()
-    
-    def test_forex_no_slash_classification(self):
+        result = _classify(symbol)
+        assert result["type"] == "FOREX"
+        assert result["client_type"] == "forex"
+        assert result["markets"] == ["FOREX"]
+        assert result["trading_hours"] == "23/5"
+        assert result["symbol"] == symbol.upper()
+    
+    @pytest.mark.parametrize("symbol", FOREX_NO_SLASH_SYMBOLS)
+    def test_forex_no_slash_classification(self, symbol):
         """Test forex pairs without slash (EURUSD format)."""
-        for symbol in self.FOREX_NO_SLASH_SYMBOLS:
-            result = AssetClassifier.classify(symbol)
-            assert result["type"] == "FOREX", f"Failed for {symbol}"
-            assert result["client_type"] == "forex"
-            assert result["markets"] == ["FOREX"]
-            assert result["trading_hours"] == "23/5"
-    
-    def test_invalid_symbols(self):
+        result = _classify(symbol)
+        assert result["type"] == "FOREX"
+        assert result["client_type"] == "forex"
+        assert result["markets"] == ["FOREX"]
+        assert result["trading_hours"] == "23/5"
+    
+    @pytest.mark.parametrize("symbol", INVALID_SYMBOLS)
+    def test_invalid_symbols(self, symbol):
         """Test invalid symbols raise ValueError."""
-        for symbol in self.INVALID_SYMBOLS:
-            with pytest.raises(ValueError):
-                AssetClassifier.classify(symbol)
+        with pytest.raises(ValueError):
+            AssetClassifier.classify(symbol)
     
     def test_case_insensitivity(self):
         """Test symbols are normalized to uppercase."""
@@ -113,7 +125,7 @@ class TestAssetClassifier:
             ("Eth/Usd", "CRYPTO")
         ]
         for symbol, expected_type in test_cases:
-            result = AssetClassifier.classify(symbol)
+            result = _classify(symbol)
             assert result["type"] == expected_type
             assert result["symbol"] == symbol.upper()
     
@@ -125,7 +137,7 @@ class TestAssetClassifier:
             ("  EUR/USD  ", "FOREX")
         ]
         for symbol, expected_type in test_cases:
-            result = AssetClassifier.classify(symbol)
+            result = _classify(symbol)
             assert result["type"] == expected_type
             assert result["symbol"] == symbol.strip().upper()
     
@@ -160,7 +172,7 @@ class TestAssetClassifier:
     
     def test_result_structure(self):
         """Test classification result has all required fields."""
-        result = AssetClassifier.classify("AAPL")
+        result = _classify("AAPL")
         
         # Check all required fields present
         required_fields = ["type", "symbol", "client_type", "markets", 
@@ -179,29 +191,29 @@ class TestAssetClassifier:
     def test_edge_cases(self):
         """Test edge cases and boundary conditions."""
         # Single letter stock (valid)
-        result = AssetClassifier.classify("A")
+        result = _classify("A")
         assert result["type"] == "US_EQUITY"
         
         # 5-letter stock (maximum for US equity)
-        result = AssetClassifier.classify("GOOGL")
+        result = _classify("GOOGL")
         assert result["type"] == "US_EQUITY"
         
         # 3-letter crypto base (minimum)
-        result = AssetClassifier.classify("BTC/USD")
+        result = _classify("BTC/USD")
         assert result["type"] == "CRYPTO"
         
         # 5-letter crypto base (maximum common)
-        result = AssetClassifier.classify("MATIC/USD")
+        result = _classify("MATIC/USD")
         assert result["type"] == "CRYPTO"
     
     def test_total_coverage(self):
         """Verify we test 50+ unique symbols as required."""
         all_symbols = (
-            self.US_EQUITY_SYMBOLS +
-            self.CRYPTO_SLASH_SYMBOLS +
-            self.CRYPTO_NO_SLASH_SYMBOLS +
-            self.FOREX_SLASH_SYMBOLS +
-            self.FOREX_NO_SLASH_SYMBOLS
+            US_EQUITY_SYMBOLS +
+            CRYPTO_SLASH_SYMBOLS +
+            CRYPTO_NO_SLASH_SYMBOLS +
+            FOREX_SLASH_SYMBOLS +
+            FOREX_NO_SLASH_SYMBOLS
         )
         unique_symbols = set(all_symbols)
         assert len(unique_symbols) >= 50, \
@@ -72,6 +72,15 @@ class TestAnnualizationFactor(unittest.TestCase):
         
         factor = self.backtester._get_annualization_factor('')
         self.assertEqual(factor, 252)
+    
+    def test_factor_memoized_across_instances(self):
+        """Test repeated lookups are served from the cache, even for a new instance."""
+        BacktesterV2._get_annualization_factor.cache_clear()
+        self.backtester._get_annualization_factor('1Hour')
+        BacktesterV2('2024-01-01', '2024-06-30')._get_annualization_factor('1Hour')
+        
+        info = BacktesterV2._get_annualization_factor.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
 
 
 class TestCalculatePerformance(unittest.TestCase):
@@ -139,7 +148,23 @@ class TestCalculatePerformance(unittest.TestCase):
         # Trade 1: +8, Trade 2: -7, Trade 3: +8 = +9 total
         self.assertEqual(result['pnl'], 9.0)
         self.assertAlmostEqual(result['win_rate'], 66.67, places=1)  # 2 wins out of 3
-    
+
+    def test_commissions_paired_with_their_trade(self):
+        """Test that each trade's PnL uses its own entry and exit commissions."""
+        trades = [
+            {'date': '2024-01-01', 'type': 'BUY', 'price': 100.0, 'commission': 0.5},
+            {'date': '2024-01-10', 'type': 'SELL', 'price': 101.0, 'commission': 0.25},
+            {'date': '2024-01-15', 'type': 'BUY', 'price': 101.0, 'commission': 3.0},
+            {'date': '2024-01-20', 'type': 'SELL', 'price': 102.0, 'commission': 2.0},
+        ]
+
+        result = self.backtester.calculate_performance(trades, '1Day')
+
+        # Trade 1: +0.25, Trade 2: -4.0
+        self.assertEqual(result['pnl'], -3.75)
+        self.assertEqual(result['win_rate'], 50.0)
+        self.assertEqual(result['max_drawdown'], -4.0)
+
     def test_open_position_warning(self):
         """Test handling of incomplete trade (open position)."""
         trades = [
@@ -4,14 +4,37 @@ Tests for global_scheduler.py - Autonomous 24/7 trading scheduler.
 This module tests the intelligent market rotation and adaptive interval scheduling.
 """
 
+import copy
 import unittest
-from unittest.mock import patch, MagicMock, call
-from datetime import datetime, timedelta
-import pytz
+import pytest
+from unittest.mock import patch, Mock, call
+from datetime import datetime, timedelta, timezone
 import time
+from types import SimpleNamespace
 
 from src.utils.global_scheduler import AutoTradingScheduler
 
+UTC = timezone.utc
+
+# Position payloads returned by the mocked broker; shared by reference, never mutated
+_LONG_POSITIONS = [
+    {'symbol': 'SPY', 'qty': '10', 'side': 'long'},
+    {'symbol': 'QQQ', 'qty': '5', 'side': 'long'}
+]
+_SHORT_POSITIONS = [
+    {'symbol': 'TSLA', 'qty': '10', 'side': 'short'}
+]
+
+
+def _mock_dependencies():
+    """Fresh collaborator doubles to inject into AutoTradingScheduler."""
+    return {
+        'market_calendar': Mock(),
+        'state_manager': Mock(),
+        'orchestrator': Mock(),
+        'market_rotation': Mock(),
+    }
+
 
 class TestAutoTradingSchedulerInit(unittest.TestCase):
     """Test scheduler initialization."""
@@ -22,9 +45,8 @@ class TestAutoTradingSchedulerInit(unittest.TestCase):
     @patch('src.utils.global_scheduler.market_rotation_strategy')
     def test_initialization(self, mock_rotation, mock_orchestrator, mock_calendar, mock_state_mgr):
         """Test that scheduler initializes correctly."""
-        mock_state_mgr_instance = MagicMock()
-        mock_state_mgr.return_value = mock_state_mgr_instance
-        mock_state_mgr_instance.load_state.return_value = {'test': 'state'}
+        # Only load_state is read, so a plain namespace is enough
+        mock_state_mgr.return_value = SimpleNamespace(load_state=lambda: {'test': 'state'})
         
         scheduler = AutoTradingScheduler()
         
@@ -34,15 +56,30 @@ class TestAutoTradingSchedulerInit(unittest.TestCase):
         self.assertIsNotNone(scheduler.market_rotation)
         self.assertEqual(scheduler.state, {'test': 'state'})
     
+    @patch('src.utils.global_scheduler.StateManager')
+    @patch('src.utils.global_scheduler.MarketCalendar')
+    def test_injected_dependencies(self, mock_calendar, mock_state_mgr):
+        """Test that injected collaborators are used instead of the defaults."""
+        dependencies = _mock_dependencies()
+        dependencies['state_manager'].load_state.return_value = {'injected': True}
+        
+        scheduler = AutoTradingScheduler(**dependencies)
+        
+        mock_calendar.assert_not_called()
+        mock_state_mgr.assert_not_called()
+        self.assertIs(scheduler.market_calendar, dependencies['market_calendar'])
+        self.assertIs(scheduler.state_manager, dependencies['state_manager'])
+        self.assertIs(scheduler.orchestrator, dependencies['orchestrator'])
+        self.assertIs(scheduler.market_rotation, dependencies['market_rotation'])
+        self.assertEqual(scheduler.state, {'injected': True})
+    
     @patch('src.utils.global_scheduler.StateManager')
     @patch('src.utils.global_scheduler.MarketCalendar')
     @patch('src.utils.global_scheduler.trading_orchestrator')
     @patch('src.utils.global_scheduler.market_rotation_strategy')
     def test_interval_configuration(self, mock_rotation, mock_orchestrator, mock_calendar, mock_state_mgr):
         """Test that adaptive intervals are configured correctly."""
-        mock_state_mgr_instance = MagicMock()
-        mock_state_mgr.return_value = mock_state_mgr_instance
-        mock_state_mgr_instance.load_state.return_value = {}
+        mock_state_mgr.return_value = SimpleNamespace(load_state=dict)
         
         scheduler = AutoTradingScheduler()
         
@@ -55,17 +92,18 @@ class TestAutoTradingSchedulerInit(unittest.TestCase):
 class TestCalculateNextInterval(unittest.TestCase):
     """Test adaptive interval calculation."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the collaborator doubles once for the class."""
+        cls.dependencies = _mock_dependencies()
+    
     def setUp(self):
         """Set up test fixtures."""
-        with patch('src.utils.global_scheduler.StateManager'), \
-             patch('src.utils.global_scheduler.MarketCalendar'), \
-             patch('src.utils.global_scheduler.trading_orchestrator'), \
-             patch('src.utils.global_scheduler.market_rotation_strategy'):
-            self.scheduler = AutoTradingScheduler()
+        self.scheduler = AutoTradingScheduler(**self.dependencies)
     
     def test_us_equity_interval(self):
         """Test interval for US_EQUITY market."""
-        current_time = datetime(2025, 1, 15, 14, 30, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 14, 30, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('US_EQUITY', current_time)
         
@@ -75,7 +113,7 @@ class TestCalculateNextInterval(unittest.TestCase):
     def test_crypto_peak_hours(self):
         """Test interval for CRYPTO during peak hours (9-23 UTC)."""
         # 15:00 UTC is peak time
-        current_time = datetime(2025, 1, 15, 15, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 15, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
         
@@ -85,7 +123,7 @@ class TestCalculateNextInterval(unittest.TestCase):
     def test_crypto_offpeak_hours(self):
         """Test interval for CRYPTO during off-peak hours (0-8 UTC)."""
         # 3:00 UTC is off-peak time
-        current_time = datetime(2025, 1, 15, 3, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 3, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
         
@@ -94,7 +132,7 @@ class TestCalculateNextInterval(unittest.TestCase):
     
     def test_crypto_peak_boundary_start(self):
         """Test interval at peak hours start boundary (9:00 UTC)."""
-        current_time = datetime(2025, 1, 15, 9, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 9, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
         
@@ -103,7 +141,7 @@ class TestCalculateNextInterval(unittest.TestCase):
     
     def test_crypto_peak_boundary_end(self):
         """Test interval just before peak hours end (22:59 UTC)."""
-        current_time = datetime(2025, 1, 15, 22, 59, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 22, 59, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
         
@@ -112,7 +150,7 @@ class TestCalculateNextInterval(unittest.TestCase):
     
     def test_crypto_after_peak(self):
         """Test interval just after peak hours end (23:00 UTC)."""
-        current_time = datetime(2025, 1, 15, 23, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 23, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
         
@@ -121,18 +159,35 @@ class TestCalculateNextInterval(unittest.TestCase):
     
     def test_forex_interval(self):
         """Test interval for FOREX market."""
-        current_time = datetime(2025, 1, 15, 12, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('FOREX', current_time)
         
         # Forex: 10 minutes = 600 seconds
         self.assertEqual(interval, 600)
-    
+
+    def test_crypto_every_hour(self):
+        """Test the crypto hour table against the 9-23 UTC peak window."""
+        for hour in range(24):
+            with self.subTest(hour=hour):
+                current_time = datetime(2025, 1, 15, hour, 0, tzinfo=UTC)
+                expected = 900 if 9 <= hour < 23 else 1800
+                self.assertEqual(self.scheduler._calculate_next_interval('CRYPTO', current_time), expected)
+
+    def test_interval_overrides_respected(self):
+        """Test that per-instance interval changes are used by the lookup."""
+        self.scheduler.intervals['CRYPTO_PEAK'] = 7
+        current_time = datetime(2025, 1, 15, 15, 0, tzinfo=UTC)
+
+        interval = self.scheduler._calculate_next_interval('CRYPTO', current_time)
+
+        self.assertEqual(interval, 420)
+
     @patch('src.utils.global_scheduler.settings')
     def test_unknown_market_fallback(self, mock_settings):
         """Test fallback for unknown market type."""
         mock_settings.scan_interval_minutes = 20
-        current_time = datetime(2025, 1, 15, 12, 0, tzinfo=pytz.utc)
+        current_time = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
         
         interval = self.scheduler._calculate_next_interval('UNKNOWN_MARKET', current_time)
         
@@ -143,13 +198,14 @@ class TestCalculateNextInterval(unittest.TestCase):
 class TestGetOptimalStrategies(unittest.TestCase):
     """Test strategy selection for different asset classes."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the collaborator doubles once for the class."""
+        cls.dependencies = _mock_dependencies()
+    
     def setUp(self):
         """Set up test fixtures."""
-        with patch('src.utils.global_scheduler.StateManager'), \
-             patch('src.utils.global_scheduler.MarketCalendar'), \
-             patch('src.utils.global_scheduler.trading_orchestrator'), \
-             patch('src.utils.global_scheduler.market_rotation_strategy'):
-            self.scheduler = AutoTradingScheduler()
+        self.scheduler = AutoTradingScheduler(**self.dependencies)
     
     def test_us_equity_strategies(self):
         """Test optimal strategies for US_EQUITY."""
@@ -180,36 +236,32 @@ class TestGetOptimalStrategies(unittest.TestCase):
 class TestEmergencyClosePositions(unittest.TestCase):
     """Test emergency position closing."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one scheduler for the class; tests only read from it."""
+        cls.scheduler_template = AutoTradingScheduler(**_mock_dependencies())
+    
     def setUp(self):
         """Set up test fixtures."""
-        with patch('src.utils.global_scheduler.StateManager'), \
-             patch('src.utils.global_scheduler.MarketCalendar'), \
-             patch('src.utils.global_scheduler.trading_orchestrator'), \
-             patch('src.utils.global_scheduler.market_rotation_strategy'):
-            self.scheduler = AutoTradingScheduler()
+        self.scheduler = copy.copy(self.scheduler_template)
     
     @patch('src.utils.global_scheduler.alpaca_manager')
     def test_close_long_positions(self, mock_alpaca):
         """Test closing long positions in emergency."""
-        mock_alpaca.get_positions.return_value = [
-            {'symbol': 'SPY', 'qty': '10', 'side': 'long'},
-            {'symbol': 'QQQ', 'qty': '5', 'side': 'long'}
-        ]
+        mock_alpaca.get_positions.return_value = _LONG_POSITIONS
         
         self.scheduler._emergency_close_positions()
         
-        # Should place SELL orders for long positions
-        calls = mock_alpaca.place_market_order.call_args_list
-        self.assertEqual(len(calls), 2)
-        self.assertEqual(calls[0], call('SPY', '10', 'SELL'))
-        self.assertEqual(calls[1], call('QQQ', '5', 'SELL'))
+        # Should place SELL orders for long positions, in position order
+        self.assertEqual(
+            mock_alpaca.place_market_order.call_args_list,
+            [call('SPY', '10', 'SELL'), call('QQQ', '5', 'SELL')]
+        )
     
     @patch('src.utils.global_scheduler.alpaca_manager')
     def test_close_short_positions(self, mock_alpaca):
         """Test closing short positions in emergency."""
-        mock_alpaca.get_positions.return_value = [
-            {'symbol': 'TSLA', 'qty': '10', 'side': 'short'}
-        ]
+        mock_alpaca.get_positions.return_value = _SHORT_POSITIONS
         
         self.scheduler._emergency_close_positions()
         
@@ -236,126 +288,245 @@ class TestEmergencyClosePositions(unittest.TestCase):
         self.scheduler._emergency_close_positions()
 
 
-class TestRunForeverLoop(unittest.TestCase):
-    """Test the main run_forever loop."""
+# Table of run_forever scenarios. Each case drives one or two loop iterations;
+# the harness calls ``stop()`` once ``stop_after`` sleeps have been requested.
+RUN_FOREVER_CASES = [
+    pytest.param(
+        {
+            'rotation': ['US_EQUITY'],
+            'active_markets': ['US_EQUITY'],
+            'next_open_in': None,
+            'cycle_error': None,
+            'auto_close': False,
+            'stop_after': 1,
+            'expected_sleeps': [300],
+            'expected_cycles': 1,
+            'expected_saves': 1,
+            'expected_emergency_closes': 0,
+        },
+        id='successful_cycle',
+    ),
+    pytest.param(
+        {
+            'rotation': ['US_EQUITY'],
+            'active_markets': [],
+            'next_open_in': timedelta(hours=2),
+            'cycle_error': None,
+            'auto_close': False,
+            'stop_after': 1,
+            'expected_sleeps': [3600],  # capped at one hour
+            'expected_cycles': 0,
+            'expected_saves': 0,
+            'expected_emergency_closes': 0,
+        },
+        id='market_closed',
+    ),
+    pytest.param(
+        {
+            'rotation': ['US_EQUITY'],
+            'active_markets': [],
+            'next_open_in': None,
+            'cycle_error': None,
+            'auto_close': False,
+            'stop_after': 1,
+            'expected_sleeps': [3600],
+            'expected_cycles': 0,
+            'expected_saves': 0,
+            'expected_emergency_closes': 0,
+        },
+        id='no_schedule',
+    ),
+    pytest.param(
+        {
+            'rotation': ['US_EQUITY'],
+            'active_markets': ['US_EQUITY'],
+            'next_open_in': None,
+            'cycle_error': Exception("Cycle failed"),
+            'auto_close': True,
+            'stop_after': 1,
+            'expected_sleeps': [300],
+            'expected_cycles': 1,
+            'expected_saves': 1,
+            'expected_emergency_closes': 1,
+        },
+        id='error_with_auto_close',
+    ),
+    pytest.param(
+        {
+            'rotation': [Exception("Test error"), 'US_EQUITY'],
+            'active_markets': ['US_EQUITY'],
+            'next_open_in': None,
+            'cycle_error': None,
+            'auto_close': False,
+            'stop_after': 2,
+            'expected_sleeps': [300, 300],  # error back-off, then normal interval
+            'expected_cycles': 1,
+            'expected_saves': 1,
+            'expected_emergency_closes': 0,
+        },
+        id='unexpected_error_recovery',
+    ),
+]
+
+
+class _RunForeverHarness:
+    """Wires a scheduler's collaborators for one run_forever scenario."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        with patch('src.utils.global_scheduler.StateManager'), \
-             patch('src.utils.global_scheduler.MarketCalendar'), \
-             patch('src.utils.global_scheduler.trading_orchestrator'), \
-             patch('src.utils.global_scheduler.market_rotation_strategy'):
-            self.scheduler = AutoTradingScheduler()
+    def __init__(self, scheduler, mock_sleep, mock_settings, mock_alpaca):
+        self.scheduler = scheduler
+        self.mock_sleep = mock_sleep
+        self.mock_settings = mock_settings
+        self.mock_alpaca = mock_alpaca
+        self._stop_after = 1
     
-    @patch('src.utils.global_scheduler.time.sleep')
-    @patch('src.utils.global_scheduler.alpaca_manager')
-    @patch('src.utils.global_scheduler.settings')
-    def test_successful_cycle_execution(self, mock_settings, mock_alpaca, mock_sleep):
-        """Test successful execution of one trading cycle."""
-        mock_settings.target_markets = ['US_EQUITY']
-        mock_settings.auto_close_on_error = False
-        
-        # Mock market rotation
-        self.scheduler.market_rotation.select_active_market.return_value = 'US_EQUITY'
-        self.scheduler.market_rotation.get_market_statistics.return_value = {
-            'rotation_count': 5,
-            'last_rotation': '2025-01-15 10:00:00'
-        }
-        
-        # Mock market calendar
-        self.scheduler.market_calendar.get_active_markets.return_value = ['US_EQUITY']
-        
-        # Mock orchestrator
-        self.scheduler.orchestrator.run_cycle = MagicMock()
-        
-        # Mock positions
-        mock_alpaca.get_positions.return_value = []
-        
-        # Mock state manager
-        self.scheduler.state_manager.save_state = MagicMock()
-        
-        # Run one iteration then stop
-        iteration_count = [0]
-        original_sleep = mock_sleep.side_effect
-        
-        def sleep_and_stop(*args):
-            iteration_count[0] += 1
-            if iteration_count[0] >= 1:
-                raise KeyboardInterrupt()
-        
-        mock_sleep.side_effect = sleep_and_stop
-        
-        # Run scheduler
-        self.scheduler.run_forever()
-        
-        # Verify one cycle executed
-        self.scheduler.orchestrator.run_cycle.assert_called_once()
-        self.scheduler.state_manager.save_state.assert_called_once()
+    def configure(self, case):
+        """Apply a RUN_FOREVER_CASES entry to the scheduler mocks."""
+        self.mock_settings.target_markets = ['US_EQUITY']
+        self.mock_settings.auto_close_on_error = case['auto_close']
+        self.mock_alpaca.get_positions.return_value = []
+        
+        rotation = self.scheduler.market_rotation
+        rotation.select_active_market.side_effect = case['rotation']
+        rotation.get_market_statistics.return_value = {'rotation_count': 0, 'last_rotation': None}
+        
+        calendar = self.scheduler.market_calendar
+        calendar.get_active_markets.return_value = case['active_markets']
+        if case['next_open_in'] is None:
+            calendar.next_market_open.return_value = None
+        else:
+            calendar.next_market_open.return_value = datetime.now(UTC) + case['next_open_in']
+        
+        self.scheduler.orchestrator.run_cycle.side_effect = case['cycle_error']
+        self.scheduler._emergency_close_positions = Mock()
+        
+        self._stop_after = case['stop_after']
+        self.mock_sleep.side_effect = self._sleep
     
-    @patch('src.utils.global_scheduler.time.sleep')
-    @patch('src.utils.global_scheduler.settings')
-    def test_market_closed_sleep(self, mock_settings, mock_sleep):
-        """Test scheduler behavior when market is closed."""
-        mock_settings.target_markets = ['US_EQUITY']
-        
-        # Mock market rotation
-        self.scheduler.market_rotation.select_active_market.return_value = 'US_EQUITY'
-        
-        # Mock market closed
-        self.scheduler.market_calendar.get_active_markets.return_value = []
-        next_open = datetime.now(pytz.utc) + timedelta(hours=2)
-        self.scheduler.market_calendar.next_market_open.return_value = next_open
-        
-        # Run one iteration then stop
-        iteration_count = [0]
-        
-        def sleep_and_stop(*args):
-            iteration_count[0] += 1
-            if iteration_count[0] >= 1:
-                raise KeyboardInterrupt()
-        
-        mock_sleep.side_effect = sleep_and_stop
-        
-        # Run scheduler
-        self.scheduler.run_forever()
-        
-        # Should have slept (market closed)
-        self.assertTrue(mock_sleep.called)
+    def _sleep(self, seconds):
+        # Bound the loop via the stop flag rather than raising out of sleep
+        if self.mock_sleep.call_count >= self._stop_after:
+            self.scheduler.stop()
     
-    @patch('src.utils.global_scheduler.time.sleep')
-    @patch('src.utils.global_scheduler.settings')
-    def test_error_recovery(self, mock_settings, mock_sleep):
-        """Test that scheduler recovers from errors."""
-        mock_settings.target_markets = ['US_EQUITY']
-        mock_settings.auto_close_on_error = False
-        
-        # Mock market rotation to raise error first, then succeed
-        call_count = [0]
-        
-        def market_selection_effect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise Exception("Test error")
-            return 'US_EQUITY'
-        
-        self.scheduler.market_rotation.select_active_market.side_effect = market_selection_effect
-        
-        # Stop after 2 iterations
-        iteration_count = [0]
-        
-        def sleep_and_stop(*args):
-            iteration_count[0] += 1
-            if iteration_count[0] >= 2:
-                raise KeyboardInterrupt()
-        
-        mock_sleep.side_effect = sleep_and_stop
-        
-        # Run scheduler
+    def run(self):
         self.scheduler.run_forever()
-        
-        # Should have called sleep twice (once for error, once for KeyboardInterrupt)
-        self.assertGreaterEqual(mock_sleep.call_count, 2)
 
 
+@pytest.fixture(scope='module')
+def _scheduler_template():
+    """Build one scheduler for the module; the harness hands out shallow copies."""
+    return AutoTradingScheduler(**_mock_dependencies())
+
+
+@pytest.fixture
+def _no_real_sleep():
+    """
+    Replace ``time.sleep`` with a fresh Mock for one test.
+
+    ``src.utils.global_scheduler.time`` is the ``time`` module itself, so this patch
+    is process-wide while it lasts; only tests that request the fixture get it.
+    """
+    with patch("src.utils.global_scheduler.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def run_forever_harness(_scheduler_template, _no_real_sleep):
+    """Scheduler with fresh collaborator mocks plus patched settings/alpaca and the per-test sleep mock."""
+    scheduler = copy.copy(_scheduler_template)
+    scheduler.state = {}
+    
+    # Collaborator mocks are shared by every copy; clear what the previous test configured
+    for collaborator in (scheduler.market_rotation, scheduler.market_calendar,
+                         scheduler.orchestrator, scheduler.state_manager):
+        collaborator.reset_mock(return_value=True, side_effect=True)
+    
+    with patch('src.utils.global_scheduler.settings') as mock_settings, \
+         patch('src.utils.global_scheduler.alpaca_manager') as mock_alpaca:
+        yield _RunForeverHarness(scheduler, _no_real_sleep, mock_settings, mock_alpaca)
+
+
+@pytest.mark.parametrize('case', RUN_FOREVER_CASES)
+def test_run_forever(run_forever_harness, case):
+    """Test the main run_forever loop across market/error scenarios."""
+    run_forever_harness.configure(case)
+    run_forever_harness.run()
+    
+    scheduler = run_forever_harness.scheduler
+    sleeps = [c.args[0] for c in run_forever_harness.mock_sleep.call_args_list]
+    
+    assert sleeps == case['expected_sleeps']
+    assert scheduler.orchestrator.run_cycle.call_count == case['expected_cycles']
+    assert scheduler.state_manager.save_state.call_count == case['expected_saves']
+    assert scheduler._emergency_close_positions.call_count == case['expected_emergency_closes']
+
+
+def test_run_forever_keyboard_interrupt(run_forever_harness):
+    """Test that a KeyboardInterrupt still shuts the loop down gracefully."""
+    run_forever_harness.configure(RUN_FOREVER_CASES[0].values[0])
+    run_forever_harness.mock_sleep.side_effect = KeyboardInterrupt()
+    
+    run_forever_harness.run()
+    
+    run_forever_harness.mock_sleep.assert_called_once_with(300)
+
+
+def test_stop_before_run_forever_is_honoured(run_forever_harness):
+    """Test that stop() called before run_forever starts prevents any cycle."""
+    run_forever_harness.configure(RUN_FOREVER_CASES[0].values[0])
+    run_forever_harness.scheduler.stop()
+    
+    run_forever_harness.run()
+    
+    run_forever_harness.scheduler.orchestrator.run_cycle.assert_not_called()
+    run_forever_harness.mock_sleep.assert_not_called()
+
+
+def _run_single_cycle(harness, positions):
+    """
+    Run one successful US_EQUITY cycle and return the states passed to save_state.
+    
+    Args:
+        harness: run_forever_harness fixture value
+        positions: Broker positions to return, or an exception to raise
+    """
+    harness.configure(RUN_FOREVER_CASES[0].values[0])
+    if isinstance(positions, Exception):
+        harness.mock_alpaca.get_positions.side_effect = positions
+    else:
+        harness.mock_alpaca.get_positions.return_value = positions
+    
+    harness.run()
+    
+    return [c.args[0] for c in harness.scheduler.state_manager.save_state.call_args_list]
+
+
+def test_state_tracking_after_cycle(run_forever_harness):
+    """Test that a completed cycle records market, strategies and positions."""
+    positions = [
+        {'symbol': 'SPY', 'qty': '10', 'side': 'long', 'unrealized_pl': 12.5},
+        {'symbol': 'QQQ', 'qty': '5', 'side': 'long', 'unrealized_pl': -2.5}
+    ]
+    
+    saved_states = _run_single_cycle(run_forever_harness, positions)
+    
+    assert len(saved_states) == 1
+    state = saved_states[0]
+    assert state['active_market'] == 'US_EQUITY'
+    assert state['strategies_used'] == ['3ma', 'rsi_breakout', 'macd']
+    assert state['positions'] == positions
+    assert state['daily_pnl'] == 10.0
+    assert 'last_run_timestamp' in state
+
+
+def test_state_update_handles_position_fetch_error(run_forever_harness):
+    """Test that state is still saved when positions cannot be fetched."""
+    saved_states = _run_single_cycle(run_forever_harness, Exception("API Error"))
+    
+    assert len(saved_states) == 1
+    state = saved_states[0]
+    assert state['active_market'] == 'US_EQUITY'
+    assert 'positions' not in state
+    assert 'daily_pnl' not in state
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,49 @@
+"""
+Tests for the backtest performance kernels.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.utils._perf_kernels import _dd_sortino_kernel, _dd_sortino_numpy
+
+
+class TestDrawdownSortinoKernel(unittest.TestCase):
+    """The single-pass kernel must match the NumPy reference."""
+
+    def assert_matches_numpy(self, trade_pnls, returns):
+        expected = _dd_sortino_numpy(trade_pnls, returns)
+        actual = _dd_sortino_kernel(trade_pnls, returns)
+        for name, exp, act in zip(("max_dd", "mean", "std", "downside_std", "downside_count"), expected, actual):
+            with self.subTest(name=name):
+                self.assertAlmostEqual(act, exp, places=10)
+
+    def test_random_trades(self):
+        """Test a long mixed history of wins and losses."""
+        rng = np.random.default_rng(0)
+        returns = rng.normal(0.001, 0.02, 500)
+        trade_pnls = returns * 100 - 2.0
+        self.assert_matches_numpy(trade_pnls, returns)
+
+    def test_single_trade(self):
+        """Test one completed trade."""
+        self.assert_matches_numpy(np.array([-12.0]), np.array([-0.1]))
+
+    def test_identical_returns_have_zero_std(self):
+        """Test that constant returns give an exact zero std, keeping Sharpe at 0."""
+        returns = np.full(4, 0.05)
+        _, _, std, downside_std, downside_count = _dd_sortino_kernel(returns * 100, returns)
+        self.assertEqual(std, 0.0)
+        self.assertEqual(downside_std, 0.0)
+        self.assertEqual(downside_count, 0)
+
+    def test_drawdown_from_running_peak(self):
+        """Test that drawdown is measured from the highest equity seen so far."""
+        trade_pnls = np.array([10.0, -15.0, 20.0, -4.0])
+        max_dd, *_ = _dd_sortino_kernel(trade_pnls, trade_pnls / 100)
+        self.assertEqual(max_dd, -15.0)
+
+
+if __name__ == '__main__':
+    unittest.main()